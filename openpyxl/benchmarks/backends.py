@@ -0,0 +1,95 @@
+"""
+Compare the XML parsers and writers head to head.
+
+The read path (WorkSheetParser for standard workbooks, ReadOnlyWorksheet for
+read-only ones) is run with every available parser, and the write path with
+every row writer and with the write-only workbook. Results are reported in
+cells per second:
+
+    python -m openpyxl.benchmarks.backends --rows 10000 --cols 20
+
+The parser and row writer can be selected at runtime with
+`openpyxl.xml.functions.set_iterparse` and
+`openpyxl.writer.worksheet.set_row_writer`.
+"""
+
+from __future__ import print_function
+
+import argparse
+from io import BytesIO
+import sys
+import time
+
+import openpyxl
+from openpyxl.xml.functions import ITERPARSERS, get_iterparse, set_iterparse
+from openpyxl.writer.worksheet import (
+    ROW_WRITERS,
+    get_row_writer,
+    set_row_writer,
+)
+
+from .generator import Spec, generate_workbook, save_workbook
+from .suite import load_standard, load_read_only, save_write_only
+
+
+def best(fn, repeat):
+    times = []
+    for idx in range(repeat):
+        start = time.time()
+        fn()
+        times.append(time.time() - start)
+    return min(times)
+
+
+def run(spec, repeat=3, out=sys.stdout):
+    """
+    Return a list of (path, backend, cells per second)
+    """
+    results = []
+    src = BytesIO()
+    save_workbook(spec, src)
+
+    parser = get_iterparse()
+    try:
+        for name in sorted(ITERPARSERS):
+            set_iterparse(name)
+            for path, fn in (("read standard", load_standard),
+                             ("read read-only", load_read_only)):
+                seconds = best(lambda: fn(spec, src), repeat)
+                results.append((path, name, spec.cells / seconds))
+    finally:
+        set_iterparse(parser)
+
+    wb = generate_workbook(spec)
+    writer = get_row_writer()
+    try:
+        for name in ROW_WRITERS:
+            if name == 'lxml' and not openpyxl.LXML:
+                continue
+            set_row_writer(name)
+            seconds = best(lambda: wb.save(BytesIO()), repeat)
+            results.append(("write standard", name, spec.cells / seconds))
+    finally:
+        set_row_writer(writer)
+
+    seconds = best(lambda: save_write_only(spec, BytesIO()), repeat)
+    backend = openpyxl.LXML and "lxml" or "etree"
+    results.append(("write write-only", backend, spec.cells / seconds))
+
+    for path, backend, rate in results:
+        print("{0:<18} {1:<8} {2:12.0f} cells/s".format(path, backend, rate),
+              file=out)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=2000)
+    parser.add_argument("--cols", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+    run(Spec(rows=args.rows, cols=args.cols, styles=10), args.repeat)
+
+
+if __name__ == '__main__':
+    main()
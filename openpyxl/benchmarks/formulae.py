@@ -0,0 +1,26 @@
+"Benchmark the formula tokenizer"
+
+import timeit
+
+from openpyxl.formula.tokenizer import Tokenizer
+
+FORMULAE = [
+    '=IF(A$3<40%,"",INDEX(Pipeline!B$4:B$138,#REF!))',
+    "=IF(A$3<1.3E-8,\"\",IF(ISNA('External Ref'!K7),\"N/A\",TEXT(K7*1E+12,\"0\")&\"bp\"",
+    '=SUMPRODUCT((Accounts!A1:A1000>=5)*(Accounts!B1:B1000<=10),Accounts!C1:C1000)',
+    '=VLOOKUP($A2,\'Price List\'!$D$2:$F$10000,3,FALSE)*B2',
+    '=B4*2',
+]
+
+
+def tokenize():
+    for formula in FORMULAE:
+        Tokenizer(formula).parse()
+
+
+if __name__ == '__main__':
+    number = 10000
+    t = min(timeit.repeat(tokenize, number=number, repeat=3))
+    count = number * len(FORMULAE)
+    print("{0} formulae in {1:.2f}s, {2:.0f} formulae/s".format(
+        count, t, count / t))
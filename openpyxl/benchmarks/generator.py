@@ -0,0 +1,138 @@
+"""
+Generate synthetic workbooks for benchmarking.
+
+The content of a workbook depends only on the parameters and the seed so
+that runs on different machines or versions work on the same data.
+"""
+
+from random import Random
+
+from openpyxl import Workbook
+from openpyxl.compat import range
+from openpyxl.styles import Font, PatternFill
+from openpyxl.utils import get_column_letter
+from openpyxl.writer.write_only import WriteOnlyCell
+
+
+FONT_NAMES = ['Calibri', 'Tahoma', 'Arial', 'Times New Roman']
+COLOURS = ['FF0000', '00FF00', '0000FF', 'FFFF00', '00FFFF', 'FF00FF']
+WORDS = ['alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta', 'eta',
+         'theta', 'iota', 'kappa', 'lambda', 'mu']
+
+
+class Spec(object):
+
+    """
+    Parameters of a synthetic workbook.
+
+    `rows`, `cols` and `sheets`: the size of the workbook
+    `string_ratio`: the proportion of cells holding strings, the others hold
+    numbers
+    `styles`: the number of distinct styles, 0 for unstyled cells
+    `formula_density`: the proportion of cells holding formulae
+    `seed`: the seed of the random generator
+    """
+
+    def __init__(self, rows=1000, cols=20, sheets=1, string_ratio=0.3,
+                 styles=0, formula_density=0.0, seed=0):
+        self.rows = rows
+        self.cols = cols
+        self.sheets = sheets
+        self.string_ratio = string_ratio
+        self.styles = styles
+        self.formula_density = formula_density
+        self.seed = seed
+
+
+    @property
+    def cells(self):
+        return self.rows * self.cols * self.sheets
+
+
+    def as_dict(self):
+        return dict((k, getattr(self, k)) for k in (
+            'rows', 'cols', 'sheets', 'string_ratio', 'styles',
+            'formula_density', 'seed'))
+
+
+def make_styles(count, rand):
+    """
+    Return `count` distinct (font, fill) pairs
+    """
+    styles = []
+    for idx in range(count):
+        font = Font(name=FONT_NAMES[idx % len(FONT_NAMES)],
+                    size=8 + idx // len(FONT_NAMES) % 20,
+                    bold=bool(idx & 1))
+        colour = COLOURS[rand.randrange(len(COLOURS))]
+        fill = PatternFill(fill_type='solid', fgColor=colour)
+        styles.append((font, fill))
+    return styles
+
+
+def iter_values(spec, rand):
+    """
+    Yield the rows of values of a worksheet, as lists of
+    (value, style index or None)
+    """
+    for row_idx in range(1, spec.rows + 1):
+        row = []
+        for col_idx in range(1, spec.cols + 1):
+            r = rand.random()
+            if r < spec.formula_density and row_idx > 1:
+                value = "=SUM({0}1:{0}{1})".format(
+                    get_column_letter(col_idx), row_idx - 1)
+            elif r < spec.formula_density + spec.string_ratio:
+                value = "{0} {1}".format(WORDS[rand.randrange(len(WORDS))],
+                                         rand.randrange(1000))
+            else:
+                value = round(rand.uniform(-1000, 1000), 2)
+            style = None
+            if spec.styles:
+                style = rand.randrange(spec.styles)
+            row.append((value, style))
+        yield row
+
+
+def generate_workbook(spec, write_only=False):
+    """
+    Create a workbook according to `spec`, using a write-only workbook if
+    requested.
+    """
+    rand = Random(spec.seed)
+    styles = make_styles(spec.styles, rand)
+    wb = Workbook(write_only=write_only)
+    for sheet_idx in range(spec.sheets):
+        if write_only:
+            ws = wb.create_sheet()
+        elif sheet_idx == 0:
+            ws = wb.active
+        else:
+            ws = wb.create_sheet()
+        ws.title = "Sheet{0}".format(sheet_idx + 1)
+
+        for row in iter_values(spec, rand):
+            if write_only:
+                cells = []
+                for value, style in row:
+                    cell = WriteOnlyCell(ws, value=value)
+                    if style is not None:
+                        cell.font, cell.fill = styles[style]
+                    cells.append(cell)
+                ws.append(cells)
+            else:
+                ws.append([value for value, style in row])
+                if spec.styles:
+                    row_idx = ws._current_row
+                    for col_idx, (value, style) in enumerate(row, 1):
+                        cell = ws.cell(row=row_idx, column=col_idx)
+                        cell.font, cell.fill = styles[style]
+    return wb
+
+
+def save_workbook(spec, filename):
+    """
+    Generate a workbook and save it to `filename`.
+    """
+    wb = generate_workbook(spec, write_only=True)
+    wb.save(filename)
@@ -0,0 +1,123 @@
+"""
+Measure the time taken to import openpyxl.
+
+Each measurement imports the package in a new interpreter so that nothing is
+cached in memory, which is what a short-lived process such as a serverless
+handler pays on every start. The time of the import alone is reported,
+without the start of the interpreter, together with the optional
+subpackages which were imported although they should only load on first
+use:
+
+    python -m openpyxl.benchmarks.import_time --repeat 20
+    python -m openpyxl.benchmarks.import_time --modules 15
+
+`--modules` lists the slowest modules as reported by `python -X importtime`
+(Python 3.7 and later).
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+
+import openpyxl
+
+
+# subpackages which are only needed for charts, drawings and comments
+LAZY = (
+    'openpyxl.chart',
+    'openpyxl.chartsheet',
+    'openpyxl.comments',
+    'openpyxl.drawing.spreadsheet_drawing',
+)
+
+
+# import the same package as this one
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(openpyxl.__file__)))
+
+SCRIPT = """
+import json, sys, time
+start = time.time()
+import openpyxl
+elapsed = time.time() - start
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def measure():
+    """
+    Import openpyxl in a new interpreter and return the seconds taken and
+    the names of the modules loaded
+    """
+    out = subprocess.check_output([sys.executable, "-c", SCRIPT], cwd=ROOT)
+    result = json.loads(out.decode("utf-8").strip().splitlines()[-1])
+    return result['seconds'], result['modules']
+
+
+def eager(modules):
+    """
+    Return the subpackages which should have been loaded lazily
+    """
+    return [m for m in modules
+            if any(m == name or m.startswith(name + ".") for name in LAZY)]
+
+
+def slowest(count):
+    """
+    Return the (cumulative microseconds, module) of the slowest imports
+    """
+    proc = subprocess.Popen([sys.executable, "-X", "importtime", "-c",
+                             "import openpyxl"],
+                            stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                            cwd=ROOT)
+    out, err = proc.communicate()
+    timings = []
+    for line in err.decode("utf-8").splitlines():
+        if not line.startswith("import time:"):
+            continue
+        parts = line.split("|")
+        try:
+            cumulative = int(parts[1])
+        except ValueError: # header
+            continue
+        timings.append((cumulative, parts[2].strip()))
+    timings.sort(reverse=True)
+    return timings[:count]
+
+
+def run(repeat=10, modules=0, out=sys.stdout):
+    times = []
+    for idx in range(repeat):
+        seconds, loaded = measure()
+        times.append(seconds)
+    times.sort()
+    median = times[len(times) // 2]
+    print("import openpyxl: median {0:.1f} ms, min {1:.1f} ms over {2} runs".format(
+        median * 1000, times[0] * 1000, repeat), file=out)
+    print("{0} modules loaded".format(len(loaded)), file=out)
+    loaded_eagerly = eager(loaded)
+    if loaded_eagerly:
+        print("loaded eagerly: {0}".format(", ".join(loaded_eagerly)),
+              file=out)
+    if modules:
+        for cumulative, name in slowest(modules):
+            print("{0:10.1f} ms  {1}".format(cumulative / 1000.0, name),
+                  file=out)
+    return median, loaded_eagerly
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--modules", type=int, default=0,
+                        help="list the slowest modules")
+    args = parser.parse_args(argv)
+    median, loaded_eagerly = run(args.repeat, args.modules)
+    return loaded_eagerly and 1 or 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
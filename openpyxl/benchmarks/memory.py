@@ -1,29 +1,148 @@
 """
-Very simple memory use analysis
+Check that the streaming modes use memory independent of the number of rows.
+
+The peak memory allocated by Python, as traced by tracemalloc, is measured
+for reading every cell of a read-only workbook, for appending rows to a
+write-only workbook and for saving it, each with a small and a large
+generated workbook. A mode whose peak grows by more than the threshold
+between the two is reported as a regression:
+
+    python -m openpyxl.benchmarks.memory --rows 1000 --factor 10
+
+The workbooks hold only numbers: the shared string table is kept in memory
+by design and grows with the number of distinct strings, not of rows.
 """
+
+from __future__ import print_function
+
+import argparse
+import gc
 import os
-import openpyxl
+import sys
+import tempfile
+
+try:
+    import tracemalloc
+except ImportError: # Python < 3.4
+    tracemalloc = None
+
+from openpyxl import Workbook, load_workbook
+
+from .generator import Spec, iter_values, save_workbook
+
+
+def spec_for(rows, cols=10):
+    return Spec(rows=rows, cols=cols, string_ratio=0)
+
+
+def read_only(spec, filename):
+    """Read all cells of a read-only workbook"""
+    wb = load_workbook(filename, read_only=True)
+    for ws in wb.worksheets:
+        for row in ws.iter_rows():
+            for cell in row:
+                cell.value
+
+
+def _append(spec):
+    from random import Random
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    for row in iter_values(spec, Random(spec.seed)):
+        ws.append([value for value, style in row])
+    return wb
+
+
+def write_only_append(spec, filename):
+    """Append rows to a write-only workbook"""
+    wb = _append(spec)
+    for ws in wb.worksheets:
+        ws.close()
+        ws._cleanup()
+
+
+def write_only_save(spec, filename):
+    """Append rows to a write-only workbook and save it"""
+    wb = _append(spec)
+    wb.save(filename)
+
+
+STREAMING = [
+    ('read_only', read_only),
+    ('write_only_append', write_only_append),
+    ('write_only_save', write_only_save),
+]
+
+
+def peak_memory(fn, spec, filename):
+    """
+    Return the peak memory in bytes allocated by Python while running
+    `fn(spec, filename)`
+    """
+    if tracemalloc is None:
+        raise RuntimeError("tracemalloc is required")
+    gc.collect()
+    tracemalloc.start()
+    try:
+        fn(spec, filename)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def growth(fn, rows, factor=10, cols=10):
+    """
+    Return the peak memory of `fn` for workbooks of `rows` and
+    `rows * factor` rows
+    """
+    peaks = []
+    fd, filename = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        for size in (rows, rows * factor):
+            spec = spec_for(size, cols)
+            save_workbook(spec, filename)
+            peaks.append(peak_memory(fn, spec, filename))
+    finally:
+        os.remove(filename)
+    return tuple(peaks)
 
-from memory_profiler import memory_usage
 
+def check(rows=1000, factor=10, threshold=1.5, modes=None, out=sys.stdout):
+    """
+    Measure every streaming mode and return the names of those whose peak
+    memory for the large workbook exceeds `threshold` times that for the
+    small one
+    """
+    regressions = []
+    for name, fn in STREAMING:
+        if modes and name not in modes:
+            continue
+        small, large = growth(fn, rows, factor)
+        ratio = float(large) / small
+        failed = ratio > threshold
+        if failed:
+            regressions.append(name)
+        print("{0:<20} {1:10d} {2:10d} bytes  x{3:.2f}  {4}".format(
+            name, small, large, ratio, failed and "regression" or "ok"),
+              file=out)
+    return regressions
 
-def test_memory_use():
-    """Naive test that assumes memory use will never be more than 120 % of
-    that for first 50 rows"""
-    folder = os.path.split(__file__)[0]
-    src = os.path.join(folder, "files", "very_large.xlsx")
-    wb = openpyxl.load_workbook(src, use_iterators=True)
-    ws = wb.active
 
-    initial_use = None
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rows", type=int, default=1000)
+    parser.add_argument("--factor", type=int, default=10,
+                        help="ratio of rows of the large and small workbooks")
+    parser.add_argument("--threshold", type=float, default=1.5,
+                        help="accepted ratio of the peak memory")
+    parser.add_argument("--mode", action="append",
+                        choices=[name for name, fn in STREAMING])
+    args = parser.parse_args(argv)
+    if check(args.rows, args.factor, args.threshold, args.mode):
+        return 1
+    return 0
 
-    for n, line in enumerate(ws.iter_rows()):
-        if n % 50 == 0:
-            use = memory_usage(proc=-1, interval=1)[0]
-            if initial_use is None:
-                initial_use = use
-            assert use/initial_use < 1.2
-            print(n, use)
 
 if __name__ == '__main__':
-    test_memory_use()
+    sys.exit(main())
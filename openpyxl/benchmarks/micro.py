@@ -0,0 +1,288 @@
+"""
+Micro-benchmarks of the primitives called for every cell.
+
+Every benchmark times a loop of calls. The number of loops is calibrated so
+that a run lasts at least `--min-time`, then after a warmup run the time per
+call of every run is recorded and the median, mean, standard deviation and
+minimum are reported in nanoseconds. As with the suite, results can be saved
+as JSON and compared with a baseline from the same machine:
+
+    python -m openpyxl.benchmarks.micro --save micro.json
+    python -m openpyxl.benchmarks.micro --compare micro.json -b column
+
+Functions cached with lru_cache are measured both through the cache, with
+repeated arguments, and uncached.
+"""
+
+from __future__ import print_function
+
+import argparse
+import datetime
+import gc
+from io import BytesIO
+import json
+import math
+import platform
+import sys
+import time
+
+import openpyxl
+from openpyxl import Workbook, load_workbook
+from openpyxl.cell import Cell
+from openpyxl.styles.cell_style import StyleArray
+from openpyxl.styles.numbers import is_date_format
+from openpyxl.utils import (
+    get_column_letter,
+    get_column_letters,
+    column_index_from_string,
+    column_indices_from_strings,
+    coordinate_to_tuple,
+    range_boundaries,
+)
+from openpyxl.utils.datetime import to_excel, from_excel
+from openpyxl.utils.indexed_list import IndexedList
+
+timer = getattr(time, "perf_counter", time.time)
+
+
+BENCHMARKS = []
+
+
+def benchmark(name):
+    """
+    Register a function which is called with a number of loops and returns
+    the time they took and the number of calls they made
+    """
+    def decorator(fn):
+        BENCHMARKS.append((name, fn))
+        return fn
+    return decorator
+
+
+def _calls(name, fn, args):
+    def bench(loops):
+        start = timer()
+        for idx in range(loops):
+            for arg in args:
+                fn(arg)
+        return timer() - start, loops * len(args)
+    BENCHMARKS.append((name, bench))
+
+
+COLUMNS = [1, 26, 27, 702, 703, 16384]
+LETTERS = ['A', 'Z', 'AA', 'ZZ', 'AAA', 'XFD']
+COORDINATES = ['A1', 'Z26', 'AB123', 'XFD1048576']
+RANGES = ['A1:D10', 'AA100:AZ200', '$A$1:$XFD$1048576']
+FORMATS = ['General', '0.00', 'yyyy-mm-dd', 'h:mm:ss AM/PM',
+           '#,##0.00 "days"', '[Red]0.00']
+DATES = [datetime.datetime(2015, 1, 1, 12, 30), datetime.date(1900, 2, 1),
+         datetime.datetime(2038, 12, 31, 23, 59, 59)]
+SERIALS = [42005.520833333336, 32.0, 51501.99998842592]
+
+_calls("get_column_letter", get_column_letter, COLUMNS)
+_calls("column_index_from_string", column_index_from_string, LETTERS)
+_calls("get_column_letters[100]", get_column_letters, [range(1, 101)])
+_calls("column_indices_from_strings[100]", column_indices_from_strings,
+       [get_column_letters(range(1, 101))])
+_calls("coordinate_to_tuple", coordinate_to_tuple, COORDINATES)
+_calls("range_boundaries", range_boundaries, RANGES)
+_calls("is_date_format", is_date_format, FORMATS)
+_calls("is_date_format uncached", is_date_format.__wrapped__, FORMATS)
+_calls("to_excel", to_excel, DATES)
+_calls("to_excel uncached", to_excel.__wrapped__, DATES)
+_calls("from_excel", from_excel, SERIALS)
+_calls("from_excel uncached", from_excel.__wrapped__, SERIALS)
+
+
+VALUES = [
+    ('None', None),
+    ('int', 42),
+    ('float', 3.14),
+    ('bool', True),
+    ('str', u"openpyxl"),
+    ('formula', u"=SUM(A1:A10)"),
+    ('datetime', datetime.datetime(2015, 1, 1, 12, 30)),
+]
+
+_ws = Workbook().active
+for _name, _value in VALUES:
+    _calls("Cell._bind_value[{0}]".format(_name),
+           Cell(_ws, 'A', 1)._bind_value, [_value])
+
+
+def _read_only_cells():
+    """
+    Return the cells of a read-only worksheet by type of value
+    """
+    wb = Workbook()
+    ws = wb.active
+    ws.append([42, 3.14, u"openpyxl", True, datetime.datetime(2015, 1, 1)])
+    out = BytesIO()
+    wb.save(out)
+    ws = load_workbook(out, read_only=True).active
+    row = next(ws.iter_rows())
+    return zip(['int', 'float', 'str', 'bool', 'datetime'], row)
+
+
+def _value(cell):
+    def bench(loops):
+        start = timer()
+        for idx in range(loops):
+            cell.value
+        return timer() - start, loops
+    return bench
+
+for _name, _cell in _read_only_cells():
+    BENCHMARKS.append(("ReadOnlyCell.value[{0}]".format(_name), _value(_cell)))
+
+
+@benchmark("IndexedList.add")
+def indexed_list_add(loops):
+    strings = [u"string {0}".format(idx) for idx in range(100)]
+    table = IndexedList(strings)
+    add = table.add
+    start = timer()
+    for idx in range(loops):
+        for value in strings:
+            add(value)
+    return timer() - start, loops * len(strings)
+
+
+@benchmark("StyleArray hash")
+def style_array_hash(loops):
+    styles = [StyleArray([idx, 1, 0, 14, 0, 0, 0, 0, 0]) for idx in range(10)]
+    start = timer()
+    for idx in range(loops):
+        for style in styles:
+            hash(style)
+    return timer() - start, loops * len(styles)
+
+
+def calibrate(fn, min_time):
+    """
+    Return the number of loops which last at least `min_time` seconds
+    """
+    loops = 1
+    while True:
+        elapsed, calls = fn(loops)
+        if elapsed >= min_time:
+            return loops
+        loops *= 2
+
+
+def stats(values):
+    values = sorted(values)
+    n = len(values)
+    mean = sum(values) / n
+    stdev = 0.0
+    if n > 1:
+        stdev = math.sqrt(sum((v - mean) ** 2 for v in values) / (n - 1))
+    mid = n // 2
+    median = values[mid] if n % 2 else (values[mid - 1] + values[mid]) / 2
+    return {'median': median, 'mean': mean, 'stdev': stdev, 'min': values[0]}
+
+
+def measure(fn, runs=20, min_time=0.05):
+    """
+    Return the statistics of the time per call in nanoseconds of `runs` runs
+    after a warmup. The garbage collector is disabled while timing.
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        loops = calibrate(fn, min_time)
+        fn(loops) # warmup
+        values = []
+        for idx in range(runs):
+            elapsed, calls = fn(loops)
+            values.append(elapsed / calls * 1e9)
+    finally:
+        if enabled:
+            gc.enable()
+    result = stats(values)
+    result['runs'] = runs
+    result['loops'] = loops
+    return result
+
+
+def format_result(name, result):
+    return "{0:<34} {1:10.1f} ns +- {2:6.1f}  (min {3:.1f})".format(
+        name, result['median'], result['stdev'], result['min'])
+
+
+def run(names=None, runs=20, min_time=0.05, out=sys.stdout):
+    results = {
+        'openpyxl': openpyxl.__version__,
+        'python': platform.python_version(),
+        'results': {},
+    }
+    for name, fn in BENCHMARKS:
+        if names and not any(n in name for n in names):
+            continue
+        result = results['results'][name] = measure(fn, runs, min_time)
+        print(format_result(name, result), file=out)
+        out.flush()
+    return results
+
+
+def compare(results, baseline, threshold=0.05, out=sys.stdout):
+    """
+    Print the change of the median of every benchmark relative to the
+    baseline and return the names of those which are slower by more than
+    `threshold` and by more than the standard deviation of both runs
+    """
+    regressions = []
+    for name in sorted(results['results']):
+        new = results['results'][name]
+        old = baseline['results'].get(name)
+        if old is None:
+            print("{0:<34} not in baseline".format(name), file=out)
+            continue
+        change = new['median'] / old['median'] - 1
+        noise = new['stdev'] + old['stdev']
+        slower = (change > threshold
+                  and new['median'] - old['median'] > noise)
+        if slower:
+            regressions.append(name)
+        print("{0:<34} {1:10.1f} -> {2:10.1f} ns {3:+7.1%}  {4}".format(
+            name, old['median'], new['median'], change,
+            slower and "slower" or ""), file=out)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("-b", "--benchmark", action="append",
+                        help="run the benchmarks whose name contains this")
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="minimum duration of a run in seconds")
+    parser.add_argument("--save", metavar="FILE",
+                        help="save the results as JSON")
+    parser.add_argument("--compare", metavar="FILE",
+                        help="compare the results with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.05,
+                        help="relative change reported as a regression")
+    parser.add_argument("--list", action="store_true",
+                        help="list the benchmarks")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name, fn in BENCHMARKS:
+            print(name)
+        return 0
+
+    results = run(args.benchmark, args.runs, args.min_time)
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1,6 +1,5 @@
 from io import BytesIO
 from lxml.etree import xmlfile
-import os
 from random import randint
 
 from openpyxl import Workbook
@@ -87,8 +86,9 @@ def styled_sheet():
 
 def read_workbook():
     from openpyxl import load_workbook
-    folder = os.path.split(__file__)[0]
-    src = os.path.join(folder, "files", "very_large.xlsx")
+    from openpyxl.benchmarks.generator import Spec, save_workbook
+    src = BytesIO()
+    save_workbook(Spec(rows=10000, cols=20), src)
     wb = load_workbook(src)
     return wb
 
@@ -0,0 +1,225 @@
+"""
+Benchmark suite for loading and saving workbooks.
+
+Every benchmark works on a synthetic workbook (see `generator`) and reports
+the best time of several runs, the throughput in cells per second and the
+peak memory allocated by Python. Results can be saved as JSON and compared
+with a baseline:
+
+    python -m openpyxl.benchmarks.suite --save baseline.json
+    python -m openpyxl.benchmarks.suite --compare baseline.json
+
+Timings vary from machine to machine so baselines should only be compared
+with runs on the same machine.
+"""
+
+from __future__ import print_function
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+try:
+    import tracemalloc
+except ImportError: # Python < 3.4
+    tracemalloc = None
+
+import openpyxl
+from openpyxl import load_workbook
+
+from .generator import Spec, generate_workbook, save_workbook
+
+
+SIZES = {
+    'small': Spec(rows=1000, cols=20, string_ratio=0.3, styles=10,
+                  formula_density=0.01),
+    'medium': Spec(rows=10000, cols=20, string_ratio=0.3, styles=50,
+                   formula_density=0.01),
+    'wide': Spec(rows=200, cols=1000, string_ratio=0.3),
+    'sheets': Spec(rows=1000, cols=10, sheets=10, string_ratio=0.5),
+}
+
+
+def save_standard(spec, filename):
+    """Create the cells of a workbook and save it"""
+    wb = generate_workbook(spec)
+    wb.save(filename)
+
+
+def save_write_only(spec, filename):
+    """Stream the cells of a write-only workbook to a file"""
+    wb = generate_workbook(spec, write_only=True)
+    wb.save(filename)
+
+
+def load_standard(spec, filename):
+    """Load a workbook and read all cells"""
+    wb = load_workbook(filename)
+    for ws in wb.worksheets:
+        for row in ws.iter_rows():
+            for cell in row:
+                cell.value
+
+
+def load_read_only(spec, filename):
+    """Read all cells of a read-only workbook"""
+    wb = load_workbook(filename, read_only=True)
+    for ws in wb.worksheets:
+        for row in ws.iter_rows():
+            for cell in row:
+                cell.value
+
+
+BENCHMARKS = [
+    ('save_standard', save_standard),
+    ('save_write_only', save_write_only),
+    ('load_standard', load_standard),
+    ('load_read_only', load_read_only),
+]
+
+
+def measure(fn, spec, filename, repeat=3):
+    """
+    Run a benchmark `repeat` times and return the best time in seconds, and
+    the peak memory in bytes allocated during one more run, None if
+    tracemalloc is not available. Tracing slows the run down, so it is not
+    timed.
+    """
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.time()
+        fn(spec, filename)
+        times.append(time.time() - start)
+
+    peak = None
+    if tracemalloc is not None:
+        gc.collect()
+        tracemalloc.start()
+        try:
+            fn(spec, filename)
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return min(times), peak
+
+
+def run(sizes, benchmarks, repeat=3, out=sys.stdout):
+    """
+    Run the benchmarks on workbooks of the given sizes and return the results
+    """
+    results = {
+        'openpyxl': openpyxl.__version__,
+        'python': platform.python_version(),
+        'lxml': openpyxl.LXML,
+        'results': {},
+    }
+    fd, filename = tempfile.mkstemp(suffix=".xlsx")
+    os.close(fd)
+    try:
+        for size in sizes:
+            spec = SIZES[size]
+            save_workbook(spec, filename)
+            for name, fn in BENCHMARKS:
+                if name not in benchmarks:
+                    continue
+                if name.startswith("save"):
+                    target = filename + ".out.xlsx"
+                else:
+                    target = filename
+                seconds, peak = measure(fn, spec, target, repeat)
+                key = "{0}.{1}".format(size, name)
+                results['results'][key] = {
+                    'spec': spec.as_dict(),
+                    'seconds': seconds,
+                    'cells_per_second': spec.cells / seconds,
+                    'peak_memory': peak,
+                }
+                print(format_result(key, results['results'][key]), file=out)
+                out.flush()
+    finally:
+        for name in (filename, filename + ".out.xlsx"):
+            if os.path.exists(name):
+                os.remove(name)
+    return results
+
+
+def format_result(key, result):
+    peak = result['peak_memory']
+    if peak is None:
+        peak = "n/a"
+    else:
+        peak = "{0:.1f} MB".format(peak / 1024.0 / 1024)
+    return "{0:<28} {1:8.3f}s {2:12.0f} cells/s {3:>12}".format(
+        key, result['seconds'], result['cells_per_second'], peak)
+
+
+def compare(results, baseline, threshold=0.1, out=sys.stdout):
+    """
+    Print the change of every result relative to the baseline and return
+    the keys of those which are slower or use more memory than the baseline
+    by more than `threshold`
+    """
+    regressions = []
+    for key in sorted(results['results']):
+        new = results['results'][key]
+        old = baseline['results'].get(key)
+        if old is None:
+            print("{0:<28} not in baseline".format(key), file=out)
+            continue
+        time_change = new['seconds'] / old['seconds'] - 1
+        memory_change = None
+        if new['peak_memory'] and old['peak_memory']:
+            memory_change = float(new['peak_memory']) / old['peak_memory'] - 1
+        flags = []
+        if time_change > threshold:
+            flags.append("slower")
+        if memory_change is not None and memory_change > threshold:
+            flags.append("more memory")
+        if flags:
+            regressions.append(key)
+        print("{0:<28} time {1:+7.1%}  memory {2:>7}  {3}".format(
+            key, time_change,
+            "n/a" if memory_change is None else "{0:+.1%}".format(memory_change),
+            ", ".join(flags)), file=out)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--size", action="append", choices=sorted(SIZES),
+                        help="workbook sizes to run, default: small")
+    parser.add_argument("--benchmark", action="append",
+                        choices=[name for name, fn in BENCHMARKS],
+                        help="benchmarks to run, default: all")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--save", metavar="FILE",
+                        help="save the results as JSON")
+    parser.add_argument("--compare", metavar="FILE",
+                        help="compare the results with a JSON baseline")
+    parser.add_argument("--threshold", type=float, default=0.1,
+                        help="relative change reported as a regression")
+    args = parser.parse_args(argv)
+
+    sizes = args.size or ['small']
+    benchmarks = args.benchmark or [name for name, fn in BENCHMARKS]
+    results = run(sizes, benchmarks, args.repeat)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
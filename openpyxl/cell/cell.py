@@ -44,6 +44,7 @@ from openpyxl.utils import (
 from openpyxl.styles import numbers, is_date_format
 from openpyxl.styles.styleable import StyleableObject
 from openpyxl.worksheet.hyperlink import Hyperlink
+from openpyxl.formula.shared import SharedFormula
 
 # constants
 
@@ -110,13 +111,13 @@ class Cell(StyleableObject):
         self._value = None
         self._hyperlink = None
         self.data_type = 'n'
-        if value is not None:
-            self.value = value
         self._comment = None
         if column is not None:
             col_idx = column_index_from_string(column)
         self.col_idx = col_idx
         self.array_formula = array_formula
+        if value is not None:
+            self.value = value
 
 
     @property
@@ -297,6 +298,8 @@ class Cell(StyleableObject):
             ':rtype: depends on the value (string, float, int or '
             ':class:`datetime.datetime`)'"""
         value = self._value
+        if value.__class__ is SharedFormula:
+            return value.formula(self.row, self.col_idx)
         if value is not None and self.is_date:
             value = from_excel(value, self.base_date)
         return value
@@ -305,11 +308,19 @@ class Cell(StyleableObject):
     def value(self, value):
         """Set the value and infer type and display options."""
         self._bind_value(value)
+        # cells may be created without a worksheet
+        workbook = getattr(self.parent, 'parent', None)
+        evaluator = getattr(workbook, 'evaluator', None)
+        if evaluator is not None and self.row is not None:
+            evaluator.changed(self)
 
     @property
     def internal_value(self):
         """Always returns the value for excel."""
-        return self._value
+        value = self._value
+        if value.__class__ is SharedFormula:
+            return value.formula(self.row, self.col_idx)
+        return value
 
     @property
     def hyperlink(self):
@@ -2,12 +2,13 @@ from __future__ import absolute_import
 # Copyright (c) 2010-2015 openpyxl
 
 import re
+from functools import partial
 
 from openpyxl.compat import unicode, long
 
 from openpyxl.cell import Cell
 from openpyxl.utils import get_column_letter
-from openpyxl.utils.datetime import from_excel
+from openpyxl.utils.datetime import from_excel, CALENDAR_WINDOWS_1900
 from openpyxl.styles import is_date_format, Style
 from openpyxl.styles.numbers import BUILTIN_FORMATS
 
@@ -23,11 +24,54 @@ def _cast_number(value):
     return long(value)
 
 
+_DEFAULT_FORMAT = (None, False, None)
+
+
+def _number_formats(wb):
+    """
+    Return the table of the number formats of the cell styles of a workbook,
+    indexed by style id. Every entry is (format, is date, converter), where
+    the converter turns the value of a numeric cell into a datetime for date
+    formats and is None otherwise. Formats are resolved once and the table is
+    extended when styles are added.
+    """
+    table = getattr(wb, '_number_format_table', None)
+    if table is None:
+        table = wb._number_format_table = [_DEFAULT_FORMAT]
+    styles = wb._cell_styles
+    if len(table) < len(styles):
+        base_date = getattr(wb, 'excel_base_date', CALENDAR_WINDOWS_1900)
+        convert = partial(from_excel, offset=base_date)
+        for style in styles[len(table):]:
+            _id = style.numFmtId
+            if _id < 164:
+                fmt = BUILTIN_FORMATS.get(_id, "General")
+            else:
+                fmt = wb._number_formats[_id - 164]
+            if is_date_format(fmt):
+                table.append((fmt, True, convert))
+            else:
+                table.append((fmt, False, None))
+    return table
+
+
+def _number_format(wb, style_id):
+    """
+    Return the entry of the number format table for a cell style.
+    """
+    try:
+        return wb._number_format_table[style_id]
+    except (AttributeError, IndexError):
+        return _number_formats(wb)[style_id]
+
+
 class ReadOnlyCell(object):
 
-    __slots__ =  ('parent', 'row', 'column', '_value', 'data_type', '_style_id')
+    __slots__ =  ('parent', 'row', 'column', '_value', 'data_type', '_style_id',
+                  '_format')
 
-    def __init__(self, sheet, row, column, value, data_type='n', style_id=None):
+    def __init__(self, sheet, row, column, value, data_type='n', style_id=None,
+                 number_format=None):
         self.parent = sheet
         self._value = None
         self.row = row
@@ -35,6 +79,8 @@ class ReadOnlyCell(object):
         self.data_type = data_type
         self.value = value
         self._style_id = style_id
+        # entry of the number format table, looked up when first needed
+        self._format = number_format
 
     def __eq__(self, other):
         for a in self.__slots__:
@@ -66,15 +112,17 @@ class ReadOnlyCell(object):
             return
         return self.parent.parent._cell_styles[self._style_id]
 
+    def _number_format(self):
+        fmt = self._format
+        if fmt is None:
+            if not self._style_id:
+                return _DEFAULT_FORMAT
+            fmt = self._format = _number_format(self.parent.parent, self._style_id)
+        return fmt
+
     @property
     def number_format(self):
-        if not self.style_array:
-            return
-        _id = self.style_array.numFmtId
-        if _id < 164:
-            return BUILTIN_FORMATS.get(_id, "General")
-        else:
-            return self.parent.parent._number_formats[_id - 164]
+        return self._number_format()[0]
 
     @property
     def font(self):
@@ -103,7 +151,9 @@ class ReadOnlyCell(object):
 
     @property
     def is_date(self):
-        return self.data_type == 'n' and is_date_format(self.number_format)
+        if self.data_type != 'n':
+            return False
+        return self._number_format()[1]
 
     @property
     def internal_value(self):
@@ -114,9 +164,9 @@ class ReadOnlyCell(object):
         if self._value is None:
             return
         if self.data_type == 'n':
-            if self.style_array:
-                if is_date_format(self.number_format):
-                    return from_excel(self._value, self.base_date)
+            convert = self._number_format()[2]
+            if convert is not None:
+                return convert(self._value)
             return self._value
         if self.data_type == 'b':
             return self._value == '1'
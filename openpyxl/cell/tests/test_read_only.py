@@ -145,3 +145,30 @@ def test_equality():
 def test_number_convesion(value, expected):
     from .. read_only import _cast_number
     assert _cast_number(value) == expected
+
+
+def test_number_format_table():
+    from .. read_only import _number_format
+
+    class DummyWorkbook(object):
+        excel_base_date = 2415018.5
+        _cell_styles = IndexedList([StyleArray(), StyleArray([0,0,0,14,0,0,0,0,0])])
+        _number_formats = IndexedList(['0.000'])
+
+    wb = DummyWorkbook()
+    fmt, is_date, convert = _number_format(wb, 1)
+    assert (fmt, is_date) == ('mm-dd-yy', True)
+    assert convert(23596) == datetime.datetime(1964, 8, 7, 0, 0, 0)
+    assert len(wb._number_format_table) == 2
+
+    wb._cell_styles.add(StyleArray([0,0,0,164,0,0,0,0,0]))
+    assert _number_format(wb, 2) == ('0.000', False, None)
+    assert _number_format(wb, 0) == (None, False, None)
+
+
+def test_given_number_format(dummy_sheet):
+    fmt = ('d-mmm-yy', True, lambda value: "converted")
+    cell = ReadOnlyCell(dummy_sheet, None, None, "23596", 'n', 1, fmt)
+    assert cell.number_format == 'd-mmm-yy'
+    assert cell.value == "converted"
+    assert cell.internal_value == 23596
@@ -2,8 +2,6 @@ from __future__ import absolute_import
 # Copyright (c) 2010-2015 openpyxl
 
 
-from tempfile import NamedTemporaryFile
-
 from .strings import (
     basestring,
     unicode,
@@ -33,7 +31,6 @@ except ImportError:
 
 import warnings
 from functools import wraps
-import inspect
 
 
 class DummyCode:
@@ -44,13 +41,14 @@ class DummyCode:
 class deprecated(object):
 
     def __init__(self, reason):
-        if inspect.isclass(reason) or inspect.isfunction(reason):
+        if callable(reason):
             raise TypeError("Reason for deprecation must be supplied")
         self.reason = reason
 
     def __call__(self, obj, *args, **kwargs):
         @wraps(obj)
         def new_func(*args, **kwargs):
+            import inspect
             msg = "Call to deprecated function or class {0} ({1})".format(obj.__name__,
                                                                self.reason)
             if inspect.isfunction(obj):
@@ -7,3 +7,9 @@ try:
 except ImportError:
     from abc import ABCMeta
     ABC = ABCMeta('ABC', (object, ), {})
+
+try:
+    from collections.abc import MutableMapping
+except ImportError: # Python 2
+    import collections
+    MutableMapping = collections.MutableMapping
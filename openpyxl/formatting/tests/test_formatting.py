@@ -11,6 +11,7 @@ from openpyxl.writer.worksheet import write_conditional_formatting
 from openpyxl.styles import Border, Side, PatternFill, Color, Font, fills, borders, colors
 from openpyxl.styles.differential import DifferentialStyle
 from openpyxl.formatting import ConditionalFormatting
+from openpyxl.utils.indexed_list import IndexedList
 from openpyxl.formatting.rule import ColorScaleRule, CellIsRule, FormulaRule, Rule
 
 # test imports
@@ -129,7 +130,7 @@ def test_fix_priorities(rules):
 class DummyWorkbook():
 
     def __init__(self):
-        self._differential_styles = []
+        self._differential_styles = IndexedList()
         self.worksheets = []
 
 class DummyWorksheet():
@@ -0,0 +1,119 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Array formulae and data tables.
+
+Both are stored in the top-left cell of the range they fill, with attributes
+such as the type and the range of the formula. The attributes are kept by
+(row, col) of that cell, and the ranges in an index so that the formula a cell
+of the range belongs to can be found without scanning all of them.
+"""
+
+from openpyxl.compat import basestring
+from openpyxl.compat.abc import MutableMapping
+from openpyxl.utils import coordinate_to_tuple, range_boundaries
+
+from .graph import RangeIndex
+
+
+class ArrayFormulae(MutableMapping):
+
+    """
+    Attributes of the array formulae and data tables of a worksheet.
+
+    Cells are given either as (row, col) or as coordinates. The attributes
+    are a dict of the attributes of the formula element, such as
+    {'t': 'array', 'ref': 'C10:C14'}, and should be replaced rather than
+    changed in place when the range changes. Otherwise the attributes can
+    be used as a dict.
+    """
+
+    def __init__(self):
+        self._attrs = {} # {(row, col): attributes}
+        self._ranges = {} # {(row, col): boundaries}
+        self._index = RangeIndex()
+
+
+    @staticmethod
+    def _key(key):
+        if isinstance(key, basestring):
+            return coordinate_to_tuple(key.upper())
+        return key
+
+
+    def __setitem__(self, key, attrs):
+        key = self._key(key)
+        if key in self._attrs:
+            del self[key]
+        row, col = key
+        boundaries = (col, row, col, row)
+        ref = attrs.get('ref')
+        if ref:
+            boundaries = range_boundaries(ref.upper())
+        self._attrs[key] = attrs
+        self._ranges[key] = boundaries
+        self._index.add(boundaries, key)
+
+
+    def __getitem__(self, key):
+        return self._attrs[self._key(key)]
+
+
+    def __delitem__(self, key):
+        key = self._key(key)
+        del self._attrs[key]
+        self._index.remove(self._ranges.pop(key), key)
+
+
+    def __contains__(self, key):
+        return self._key(key) in self._attrs
+
+
+    def __iter__(self):
+        return iter(self._attrs)
+
+
+    def __len__(self):
+        return len(self._attrs)
+
+
+    def get(self, key, default=None):
+        return self._attrs.get(self._key(key), default)
+
+
+    def keys(self):
+        return self._attrs.keys()
+
+
+    def items(self):
+        return self._attrs.items()
+
+
+    def values(self):
+        return self._attrs.values()
+
+
+    def __repr__(self):
+        return "<{0} {1!r}>".format(self.__class__.__name__, self._attrs)
+
+
+    def find(self, row, col):
+        """
+        Return the (row, col) of the formula whose range contains the cell at
+        (`row`, `col`), None if there is none.
+        """
+        keys = self._index.items(row, col)
+        if keys:
+            return min(keys)
+
+
+    def spill_range(self, row, col):
+        """
+        Return the boundaries (min_col, min_row, max_col, max_row) of the range
+        filled by the formula which the cell at (`row`, `col`) belongs to, None
+        if there is none.
+        """
+        key = self.find(row, col)
+        if key is not None:
+            return self._ranges[key]
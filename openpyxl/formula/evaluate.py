@@ -0,0 +1,719 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Evaluation of a subset of Excel formulae.
+
+Formulae using arithmetic, text concatenation and comparison operators and
+the functions SUM, AVERAGE, COUNT, IF, VLOOKUP, INDEX and MATCH can be
+evaluated. The results are cached: after changing cells only the formulae
+depending on them are evaluated again. Formulae which cannot be evaluated,
+and those depending on them, have no result.
+
+Evaluation is optional: assign an `Evaluator` to `Workbook.evaluator` and
+the results will be written as the cached values of the formulae when the
+workbook is saved. The evaluator of a workbook is told about cells whose
+value is assigned, and evaluates every formula again after rows, columns or
+ranges of cells have been moved.
+"""
+
+from openpyxl.compat import NUMERIC_TYPES, basestring, range
+
+from .tokenizer import TokenizerError, Token, tokenize
+from .graph import DependencyGraph
+
+
+class FormulaError(Exception):
+    """
+    An Excel error value, such as #DIV/0!
+    """
+
+    def __init__(self, code):
+        super(FormulaError, self).__init__(code)
+        self.code = code
+
+
+class UnsupportedFormula(Exception):
+    """
+    Raised for formulae which cannot be evaluated.
+    """
+
+
+NULL = "#NULL!"
+DIV0 = "#DIV/0!"
+VALUE = "#VALUE!"
+REF = "#REF!"
+NAME = "#NAME?"
+NUM = "#NUM!"
+NA = "#N/A"
+
+NUMBER, TEXT, LOGICAL = range(3)
+
+
+def _kind(value):
+    if value is True or value is False:
+        return LOGICAL
+    if isinstance(value, basestring):
+        return TEXT
+    return NUMBER
+
+
+def to_number(value):
+    """
+    Convert a value to a number as Excel does for arithmetic.
+    """
+    if value is None:
+        return 0
+    if value is True or value is False:
+        return int(value)
+    if isinstance(value, NUMERIC_TYPES):
+        return value
+    try:
+        return float(value)
+    except ValueError:
+        raise FormulaError(VALUE)
+
+
+def to_text(value):
+    """
+    Convert a value to text as Excel does for concatenation.
+    """
+    if value is None:
+        return ""
+    if value is True or value is False:
+        return "TRUE" if value else "FALSE"
+    if isinstance(value, NUMERIC_TYPES):
+        if value == int(value):
+            return "%d" % value
+        return "%.15g" % value
+    return value
+
+
+def to_bool(value):
+    """
+    Convert a value to a logical as Excel does for conditions.
+    """
+    if value is None:
+        return False
+    if value is True or value is False:
+        return value
+    if isinstance(value, NUMERIC_TYPES):
+        return value != 0
+    text = value.upper()
+    if text in ("TRUE", "FALSE"):
+        return text == "TRUE"
+    raise FormulaError(VALUE)
+
+
+def compare(left, right):
+    """
+    Compare two values as Excel does: numbers sort before text, and text
+    before logicals. Text is compared regardless of case.
+    """
+    if left is None:
+        left = _blank(right)
+    if right is None:
+        right = _blank(left)
+    kl, kr = _kind(left), _kind(right)
+    if kl != kr:
+        return (kl > kr) - (kl < kr)
+    if kl == TEXT:
+        left, right = left.lower(), right.lower()
+    return (left > right) - (left < right)
+
+
+def _blank(other):
+    kind = _kind(other)
+    if other is None or kind == NUMBER:
+        return 0
+    if kind == TEXT:
+        return ""
+    return False
+
+
+COMPARISONS = {
+    "=": lambda c: c == 0,
+    "<>": lambda c: c != 0,
+    "<": lambda c: c < 0,
+    ">": lambda c: c > 0,
+    "<=": lambda c: c <= 0,
+    ">=": lambda c: c >= 0,
+}
+
+PRECEDENCE = {
+    "^": 4,
+    "*": 3, "/": 3,
+    "+": 2, "-": 2,
+    "&": 1,
+}
+PRECEDENCE.update(dict.fromkeys(COMPARISONS, 0))
+
+
+class Parser(object):
+
+    """
+    Convert the tokens of a formula into a tree of nodes.
+
+    `resolve`: a callable converting a reference into a list of
+               (title, boundaries)
+
+    Nodes are tuples whose first item is the kind of node:
+
+    * ('value', value)
+    * ('error', code)
+    * ('ref', title, boundaries)
+    * ('neg', node) and ('percent', node)
+    * ('op', operator, left, right)
+    * ('func', name, [nodes])
+    """
+
+    def __init__(self, formula, resolve):
+        try:
+            tokens = tokenize(formula)
+        except TokenizerError as e:
+            raise UnsupportedFormula(e)
+        self.tokens = [t for t in tokens if t.type != Token.WSPACE]
+        self.pos = 0
+        self.resolve = resolve
+
+
+    def parse(self):
+        if not self.tokens:
+            raise UnsupportedFormula("Empty formula")
+        node = self.expression()
+        if self.pos != len(self.tokens):
+            raise UnsupportedFormula("Unexpected token {0}".format(
+                self.tokens[self.pos].value))
+        return node
+
+
+    def peek(self):
+        if self.pos < len(self.tokens):
+            return self.tokens[self.pos]
+
+
+    def next(self):
+        token = self.peek()
+        if token is None:
+            raise UnsupportedFormula("Unexpected end of formula")
+        self.pos += 1
+        return token
+
+
+    def expression(self, min_precedence=0):
+        node = self.unary()
+        while True:
+            token = self.peek()
+            if token is None or token.type != Token.OP_IN:
+                return node
+            precedence = PRECEDENCE.get(token.value)
+            if precedence is None:
+                raise UnsupportedFormula("Unsupported operator {0}".format(token.value))
+            if precedence < min_precedence:
+                return node
+            self.pos += 1
+            right = self.expression(precedence + 1)
+            node = ('op', token.value, node, right)
+
+
+    def unary(self):
+        token = self.peek()
+        if token is not None and token.type == Token.OP_PRE:
+            self.pos += 1
+            node = self.unary()
+            if token.value == "-":
+                return ('neg', node)
+            return node
+        node = self.primary()
+        token = self.peek()
+        while token is not None and token.type == Token.OP_POST:
+            self.pos += 1
+            node = ('percent', node)
+            token = self.peek()
+        return node
+
+
+    def primary(self):
+        token = self.next()
+        if token.type == Token.OPERAND:
+            return self.operand(token)
+        if token.type == Token.PAREN and token.subtype == Token.OPEN:
+            node = self.expression()
+            self.closer(Token.PAREN)
+            return node
+        if token.type == Token.FUNC and token.subtype == Token.OPEN:
+            name = token.value[:-1].upper()
+            if name not in FUNCTIONS:
+                raise UnsupportedFormula("Unsupported function {0}".format(name))
+            return ('func', name, self.arguments())
+        raise UnsupportedFormula("Unsupported token {0}".format(token.value))
+
+
+    def closer(self, type_):
+        token = self.next()
+        if token.type != type_ or token.subtype != Token.CLOSE:
+            raise UnsupportedFormula("Unexpected token {0}".format(token.value))
+
+
+    def arguments(self):
+        args = []
+        token = self.peek()
+        if token is not None and token.type == Token.FUNC and token.subtype == Token.CLOSE:
+            self.pos += 1
+            return args
+        while True:
+            token = self.peek()
+            if token is not None and (token.type == Token.SEP
+                                      or token.type == Token.FUNC
+                                      and token.subtype == Token.CLOSE):
+                args.append(('value', None)) # missing argument
+            else:
+                args.append(self.expression())
+            token = self.next()
+            if token.type == Token.FUNC and token.subtype == Token.CLOSE:
+                return args
+            if token.type != Token.SEP or token.subtype != Token.ARG:
+                raise UnsupportedFormula("Unexpected token {0}".format(token.value))
+
+
+    def operand(self, token):
+        value = token.value
+        if token.subtype == Token.TEXT:
+            return ('value', value[1:-1].replace('""', '"'))
+        if token.subtype == Token.NUMBER:
+            if value.isdigit():
+                return ('value', int(value))
+            return ('value', float(value))
+        if token.subtype == Token.LOGICAL:
+            return ('value', value == "TRUE")
+        if token.subtype == Token.ERROR:
+            return ('error', value)
+        refs = self.resolve(value)
+        if len(refs) != 1:
+            raise UnsupportedFormula("Cannot resolve {0}".format(value))
+        title, boundaries = refs[0]
+        return ('ref', title, boundaries)
+
+
+class Range(object):
+
+    """
+    A range of cells referred to by a formula.
+    """
+
+    def __init__(self, evaluator, title, boundaries):
+        self.evaluator = evaluator
+        self.title = title
+        self.min_col, self.min_row, self.max_col, self.max_row = boundaries
+        self.rows = self.max_row - self.min_row + 1
+        self.cols = self.max_col - self.min_col + 1
+
+
+    def cell(self, row, col):
+        """
+        Return the result of the cell at (`row`, `col`) relative to the range.
+        Errors are returned as FormulaError
+        """
+        return self.evaluator._cell_result(self.title, self.min_row + row - 1,
+                                           self.min_col + col - 1)
+
+
+    def used_rows(self):
+        """
+        Number of rows of the range within the cells in use.
+        """
+        ws = self.evaluator.workbook[self.title]
+        return max(0, min(self.max_row, ws.max_row) - self.min_row + 1)
+
+
+    def used_cols(self):
+        """
+        Number of columns of the range within the cells in use.
+        """
+        ws = self.evaluator.workbook[self.title]
+        return max(0, min(self.max_col, ws.max_column) - self.min_col + 1)
+
+
+    def values(self):
+        """
+        Results of the cells of the range which are not empty, in no
+        particular order for large ranges. Errors are returned as FormulaError
+        """
+        ws = self.evaluator.workbook[self.title]
+        result = self.evaluator._cell_result
+        title = self.title
+        if self.rows * self.cols <= len(ws._cells):
+            for row in range(self.min_row, self.max_row + 1):
+                for col in range(self.min_col, self.max_col + 1):
+                    if (row, col) in ws._cells:
+                        yield result(title, row, col)
+        else:
+            for row, col in list(ws._cells):
+                if (self.min_row <= row <= self.max_row
+                    and self.min_col <= col <= self.max_col):
+                    yield result(title, row, col)
+
+
+def _scalar(value):
+    """
+    Use a value where a single value is expected.
+    """
+    if isinstance(value, Range):
+        if value.rows == 1 and value.cols == 1:
+            value = value.cell(1, 1)
+        else:
+            raise FormulaError(VALUE)
+    if isinstance(value, FormulaError):
+        raise value
+    return value
+
+
+def _raise(value):
+    if isinstance(value, FormulaError):
+        raise value
+    return value
+
+
+class Evaluator(object):
+
+    """
+    Evaluate the formulae of a workbook and cache the results.
+
+    Cells whose value or formula has been changed are passed to `changed()`,
+    automatically for the evaluator of a workbook. `calculate()` evaluates
+    the formulae which have not been evaluated since.
+    """
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self.graph = DependencyGraph(workbook)
+        self._results = {}
+        self._dirty = set(self.graph._precedents)
+        self._compiled = {}
+        self._active = set()
+
+
+    def reset(self):
+        """
+        Forget all results, eg. after cells have been moved, so that every
+        formula is evaluated again.
+        """
+        self.graph.build()
+        self._results = {}
+        self._dirty = set(self.graph._precedents)
+        self._compiled = {}
+
+
+    def changed(self, cell):
+        """
+        Invalidate the results depending on a cell.
+        """
+        title = cell.parent.title
+        key = (title, cell.row, cell.col_idx)
+        if cell.data_type == 'f':
+            self.graph.add_formula(title, cell.row, cell.col_idx, cell.value)
+            self._dirty.add(key)
+        else:
+            self.graph.remove_formula(title, cell.row, cell.col_idx)
+            self._dirty.discard(key)
+        self._results.pop(key, None)
+        for dep in self.graph._all_dependents([key]):
+            self._results.pop(dep, None)
+            self._dirty.add(dep)
+
+
+    def calculate(self):
+        """
+        Evaluate the formulae which have changed and those depending on them.
+        """
+        for key in self.graph._order(self._dirty, strict=False):
+            if key in self._dirty:
+                self._evaluate(key)
+
+
+    def result(self, cell):
+        """
+        Return the cached result of a formula. Errors are returned as
+        FormulaError and None if the formula cannot be evaluated.
+        """
+        return self._results.get((cell.parent.title, cell.row, cell.col_idx))
+
+
+    def value(self, cell):
+        """
+        Return the value of a formula, as it would be read from a workbook
+        with cached values.
+        """
+        key = (cell.parent.title, cell.row, cell.col_idx)
+        if key not in self.graph._precedents and cell.data_type == 'f':
+            self.changed(cell)
+        if key in self._dirty:
+            self.calculate()
+        value = self._results.get(key)
+        if isinstance(value, FormulaError):
+            value = value.code
+        return value
+
+
+    def _compile(self, title, formula):
+        key = (title, formula)
+        node = self._compiled.get(key)
+        if node is None:
+            resolve = lambda ref: self.graph.resolve(title, ref)
+            node = self._compiled[key] = Parser(formula, resolve).parse()
+        return node
+
+
+    def _evaluate(self, key):
+        title, row, col = key
+        self._active.add(key)
+        try:
+            cell = self.workbook[title]._cells.get((row, col))
+            if cell is None or cell.data_type != 'f':
+                raise UnsupportedFormula("No formula")
+            node = self._compile(title, cell.value)
+            value = _scalar(self._eval(node))
+            if value is None:
+                value = 0
+        except FormulaError as e:
+            value = e
+        except UnsupportedFormula:
+            value = None
+        except ZeroDivisionError:
+            value = FormulaError(DIV0)
+        except (OverflowError, ValueError):
+            value = FormulaError(NUM)
+        finally:
+            self._active.discard(key)
+        if isinstance(value, complex):
+            value = FormulaError(NUM)
+        self._results[key] = value
+        self._dirty.discard(key)
+        return value
+
+
+    def _cell_result(self, title, row, col):
+        """
+        Return the value or result of a cell. Errors are returned as
+        FormulaError
+        """
+        cell = self.workbook[title]._cells.get((row, col))
+        if cell is None:
+            return None
+        if cell.data_type == 'f':
+            key = (title, row, col)
+            if key in self._dirty or key not in self._results:
+                if key in self._active:
+                    raise UnsupportedFormula("Circular reference")
+                if key not in self.graph._precedents:
+                    raise UnsupportedFormula("Unknown formula")
+                self._evaluate(key)
+            value = self._results[key]
+            if value is None:
+                raise UnsupportedFormula("Precedent cannot be evaluated")
+            return value
+        if cell.data_type == 'e':
+            return FormulaError(cell._value)
+        return cell._value
+
+
+    def _eval(self, node):
+        kind = node[0]
+        if kind == 'value':
+            return node[1]
+        if kind == 'ref':
+            title, (min_col, min_row, max_col, max_row) = node[1], node[2]
+            if min_col == max_col and min_row == max_row:
+                return _raise(self._cell_result(title, min_row, min_col))
+            return Range(self, title, node[2])
+        if kind == 'op':
+            op = node[1]
+            left = _scalar(self._eval(node[2]))
+            right = _scalar(self._eval(node[3]))
+            if op in COMPARISONS:
+                return COMPARISONS[op](compare(left, right))
+            if op == "&":
+                return to_text(left) + to_text(right)
+            left, right = to_number(left), to_number(right)
+            if op == "+":
+                return left + right
+            if op == "-":
+                return left - right
+            if op == "*":
+                return left * right
+            if op == "/":
+                if not right:
+                    raise FormulaError(DIV0)
+                return left / float(right)
+            if not left and right < 0:
+                raise FormulaError(DIV0)
+            return left ** right
+        if kind == 'neg':
+            return -to_number(_scalar(self._eval(node[1])))
+        if kind == 'percent':
+            return to_number(_scalar(self._eval(node[1]))) / 100.0
+        if kind == 'error':
+            raise FormulaError(node[1])
+        if kind == 'func':
+            return FUNCTIONS[node[1]](self, node[2])
+
+
+    def _numbers(self, args):
+        """
+        Numbers of the arguments of SUM and AVERAGE. Text and logicals in
+        ranges are ignored.
+        """
+        for arg in args:
+            value = self._eval(arg)
+            if isinstance(value, Range):
+                values = value.values()
+            elif arg[0] == 'ref':
+                values = [value]
+            else:
+                yield to_number(value)
+                continue
+            for v in values:
+                v = _raise(v)
+                if v is not None and _kind(v) == NUMBER:
+                    yield v
+
+
+    def SUM(self, args):
+        return sum(self._numbers(args))
+
+
+    def AVERAGE(self, args):
+        numbers = list(self._numbers(args))
+        if not numbers:
+            raise FormulaError(DIV0)
+        return sum(numbers) / float(len(numbers))
+
+
+    def COUNT(self, args):
+        count = 0
+        for arg in args:
+            try:
+                value = self._eval(arg)
+            except FormulaError:
+                continue
+            if isinstance(value, Range):
+                values = value.values()
+            elif arg[0] == 'ref':
+                values = [value]
+            else:
+                try:
+                    to_number(value)
+                except FormulaError:
+                    continue
+                count += value is not None
+                continue
+            for v in values:
+                if v is not None and _kind(v) == NUMBER and not isinstance(v, FormulaError):
+                    count += 1
+        return count
+
+
+    def IF(self, args):
+        if not 1 < len(args) < 4:
+            raise UnsupportedFormula("IF takes 2 or 3 arguments")
+        if to_bool(_scalar(self._eval(args[0]))):
+            return self._eval(args[1])
+        if len(args) == 3:
+            return self._eval(args[2])
+        return False
+
+
+    def _range(self, node):
+        value = self._eval(node)
+        if not isinstance(value, Range):
+            raise UnsupportedFormula("Only ranges of cells can be looked up")
+        return value
+
+
+    @staticmethod
+    def _find(values, lookup, match_type):
+        """
+        Return the position of `lookup` in `values` (starting at 1), exact if
+        `match_type` is 0, otherwise the last position of sorted values not
+        larger (1) or not smaller (-1) than `lookup`.
+        """
+        kind = _kind(lookup)
+        found = None
+        for idx, value in enumerate(values, 1):
+            if value is None or isinstance(value, FormulaError) or _kind(value) != kind:
+                continue
+            c = compare(value, lookup)
+            if match_type == 0:
+                if c == 0:
+                    return idx
+            elif c * match_type <= 0:
+                found = idx
+            else:
+                break
+        if found is None:
+            raise FormulaError(NA)
+        return found
+
+
+    def VLOOKUP(self, args):
+        if not 2 < len(args) < 5:
+            raise UnsupportedFormula("VLOOKUP takes 3 or 4 arguments")
+        lookup = _scalar(self._eval(args[0]))
+        table = self._range(args[1])
+        col = int(to_number(_scalar(self._eval(args[2]))))
+        approximate = True
+        if len(args) == 4:
+            approximate = to_bool(_scalar(self._eval(args[3])))
+        if col < 1:
+            raise FormulaError(VALUE)
+        if col > table.cols:
+            raise FormulaError(REF)
+        values = (table.cell(row, 1) for row in range(1, table.used_rows() + 1))
+        row = self._find(values, lookup, int(approximate))
+        return _raise(table.cell(row, col))
+
+
+    def INDEX(self, args):
+        if not 1 < len(args) < 4:
+            raise UnsupportedFormula("INDEX takes 2 or 3 arguments")
+        array = self._range(args[0])
+        row = int(to_number(_scalar(self._eval(args[1]))))
+        col = 1
+        if len(args) == 3:
+            col = int(to_number(_scalar(self._eval(args[2]))))
+        elif array.rows == 1:
+            row, col = 1, row
+        if row == 0 or col == 0:
+            raise UnsupportedFormula("INDEX of whole rows or columns")
+        if not (0 < row <= array.rows and 0 < col <= array.cols):
+            raise FormulaError(REF)
+        return _raise(array.cell(row, col))
+
+
+    def MATCH(self, args):
+        if not 1 < len(args) < 4:
+            raise UnsupportedFormula("MATCH takes 2 or 3 arguments")
+        lookup = _scalar(self._eval(args[0]))
+        array = self._range(args[1])
+        match_type = 1
+        if len(args) == 3:
+            match_type = int(to_number(_scalar(self._eval(args[2]))))
+            match_type = (match_type > 0) - (match_type < 0)
+        if array.cols == 1:
+            values = (array.cell(row, 1) for row in range(1, array.used_rows() + 1))
+        elif array.rows == 1:
+            values = (array.cell(1, col) for col in range(1, array.used_cols() + 1))
+        else:
+            raise FormulaError(NA)
+        return self._find(values, lookup, match_type)
+
+
+FUNCTIONS = {
+    "SUM": Evaluator.SUM,
+    "AVERAGE": Evaluator.AVERAGE,
+    "COUNT": Evaluator.COUNT,
+    "IF": Evaluator.IF,
+    "VLOOKUP": Evaluator.VLOOKUP,
+    "INDEX": Evaluator.INDEX,
+    "MATCH": Evaluator.MATCH,
+}
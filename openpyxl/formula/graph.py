@@ -0,0 +1,356 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Dependencies between the formulae of a workbook.
+
+Every formula is tokenized and the references it contains are resolved to
+the boundaries of a cell or range on a worksheet. References to single cells
+are indexed by cell, references to ranges by their boundaries, so that a
+formula such as "=SUM(A1:A1000000)" is a single entry rather than a million.
+"""
+
+import re
+
+from openpyxl.compat import iteritems
+from openpyxl.utils import (
+    range_boundaries,
+    get_column_letter,
+    column_index_from_string,
+)
+
+from .tokenizer import Token, tokenize
+
+MAX_ROW = 1048576
+MAX_COLUMN = 16384
+
+SHEET_REF_RE = re.compile(r"^(?:'(?P<quoted>(?:[^']|'')+)'|(?P<notquoted>[^'!]+))!(?P<ref>.+)$")
+CELL_RANGE_RE = re.compile(r"^\$?[A-Z]+\$?\d+(?::\$?[A-Z]+\$?\d+)?$")
+COL_RANGE_RE = re.compile(r"^\$?([A-Z]+):\$?([A-Z]+)$")
+ROW_RANGE_RE = re.compile(r"^\$?(\d+):\$?(\d+)$")
+
+
+class CircularReferenceError(Exception):
+    """
+    Raised when formulae depend on each other.
+    """
+
+
+def reference_boundaries(ref):
+    """
+    Convert a reference without worksheet into a tuple of boundaries:
+    (min_col, min_row, max_col, max_row)
+
+    Whole columns and rows extend to the limits of the worksheet. Returns
+    None if the reference is not a cell or range.
+    """
+    ref = ref.upper()
+    if CELL_RANGE_RE.match(ref):
+        return range_boundaries(ref)
+    m = COL_RANGE_RE.match(ref)
+    if m is not None:
+        min_col, max_col = m.groups()
+        return (column_index_from_string(min_col), 1,
+                column_index_from_string(max_col), MAX_ROW)
+    m = ROW_RANGE_RE.match(ref)
+    if m is not None:
+        min_row, max_row = m.groups()
+        return 1, int(min_row), MAX_COLUMN, int(max_row)
+
+
+def boundaries_to_string(min_col, min_row, max_col, max_row):
+    """
+    Convert boundaries back into a range string.
+    """
+    coord = "{0}{1}".format(get_column_letter(min_col), min_row)
+    if (min_col, min_row) == (max_col, max_row):
+        return coord
+    return "{0}:{1}{2}".format(coord, get_column_letter(max_col), max_row)
+
+
+class RangeIndex(object):
+
+    """
+    Index of ranges which can be queried for the ranges containing a cell.
+
+    The ranges are kept in a centred interval tree on their rows which is
+    rebuilt when needed after changes.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._tree = None
+
+
+    def add(self, boundaries, item):
+        self._entries.setdefault(boundaries, set()).add(item)
+        self._tree = None
+
+
+    def remove(self, boundaries, item):
+        items = self._entries.get(boundaries)
+        if items is not None:
+            items.discard(item)
+            if not items:
+                del self._entries[boundaries]
+            self._tree = None
+
+
+    def __len__(self):
+        return len(self._entries)
+
+
+    @classmethod
+    def _build(cls, entries):
+        if not entries:
+            return None
+        centres = sorted(b[1] + b[3] for b in entries)
+        centre = centres[len(centres) // 2] / 2.0
+        left, right, here = [], [], []
+        for b in entries:
+            if b[3] < centre:
+                left.append(b)
+            elif b[1] > centre:
+                right.append(b)
+            else:
+                here.append(b)
+        by_min = sorted(here, key=lambda b: b[1])
+        by_max = sorted(here, key=lambda b: b[3], reverse=True)
+        return centre, by_min, by_max, cls._build(left), cls._build(right)
+
+
+    def find(self, row, col):
+        """
+        Return the ranges containing the cell at (`row`, `col`).
+        """
+        if self._tree is None:
+            self._tree = self._build(list(self._entries))
+        node = self._tree
+        found = []
+        while node is not None:
+            centre, by_min, by_max, left, right = node
+            if row < centre:
+                for b in by_min:
+                    if b[1] > row:
+                        break
+                    found.append(b)
+                node = left
+            else:
+                for b in by_max:
+                    if b[3] < row:
+                        break
+                    found.append(b)
+                node = right
+        return [b for b in found if b[0] <= col <= b[2]]
+
+
+    def items(self, row, col):
+        """
+        Return the items of the ranges containing the cell at (`row`, `col`).
+        """
+        items = set()
+        for b in self.find(row, col):
+            items.update(self._entries[b])
+        return items
+
+
+class DependencyGraph(object):
+
+    """
+    Precedents and dependents of the formulae of a workbook.
+
+    Cells are referred to by worksheet title and coordinate.
+    References which cannot be resolved to a worksheet of the workbook, such
+    as external references or names which do not refer to a range, are
+    ignored.
+    """
+
+    def __init__(self, workbook):
+        self.workbook = workbook
+        self._precedents = {} # {(title, row, col): [(title, boundaries)]}
+        self._cells = {} # {(title, row, col): set of formula cells}
+        self._ranges = {} # {title: RangeIndex}
+        self.build()
+
+
+    def build(self):
+        """
+        Tokenize all formulae of the workbook.
+        """
+        self._precedents = {}
+        self._cells = {}
+        self._ranges = {}
+        for ws in self.workbook.worksheets:
+            for (row, col), cell in iteritems(ws._cells):
+                if cell.data_type == 'f':
+                    self.add_formula(ws.title, row, col, cell.value)
+
+
+    def resolve(self, title, ref):
+        """
+        Resolve a reference in a formula on the worksheet `title` to a list of
+        (title, boundaries)
+        """
+        m = SHEET_REF_RE.match(ref)
+        if m is not None:
+            title = m.group("quoted")
+            if title is not None:
+                title = title.replace("''", "'")
+            else:
+                title = m.group("notquoted")
+            ref = m.group("ref")
+            try:
+                title = self.workbook[title].title
+            except KeyError:
+                return []
+        boundaries = reference_boundaries(ref)
+        if boundaries is not None:
+            return [(title, boundaries)]
+        return self.workbook.name_index.destinations(ref, title)
+
+
+    def add_formula(self, title, row, col, formula):
+        """
+        Add or replace the formula of a cell.
+        """
+        key = (title, row, col)
+        self.remove_formula(title, row, col)
+        refs = []
+        for token in tokenize(formula):
+            if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+                refs.extend(self.resolve(title, token.value))
+        self._precedents[key] = refs
+        for sheet, b in refs:
+            if b[0] == b[2] and b[1] == b[3]:
+                self._cells.setdefault((sheet, b[1], b[0]), set()).add(key)
+            else:
+                index = self._ranges.get(sheet)
+                if index is None:
+                    index = self._ranges[sheet] = RangeIndex()
+                index.add(b, key)
+
+
+    def remove_formula(self, title, row, col):
+        """
+        Remove the formula of a cell from the graph.
+        """
+        key = (title, row, col)
+        refs = self._precedents.pop(key, None)
+        if refs is None:
+            return
+        for sheet, b in refs:
+            if b[0] == b[2] and b[1] == b[3]:
+                cell = (sheet, b[1], b[0])
+                dependents = self._cells.get(cell)
+                if dependents is not None:
+                    dependents.discard(key)
+                    if not dependents:
+                        del self._cells[cell]
+            else:
+                self._ranges[sheet].remove(b, key)
+
+
+    def _direct_dependents(self, key):
+        title, row, col = key
+        dependents = set(self._cells.get(key, ()))
+        index = self._ranges.get(title)
+        if index is not None:
+            dependents.update(index.items(row, col))
+        return dependents
+
+
+    def _all_dependents(self, keys):
+        seen = set()
+        stack = list(keys)
+        while stack:
+            for key in self._direct_dependents(stack.pop()):
+                if key not in seen:
+                    seen.add(key)
+                    stack.append(key)
+        return seen
+
+
+    def __contains__(self, cell):
+        title, coordinate = cell
+        return _key(title, coordinate) in self._precedents
+
+
+    def precedents(self, title, coordinate):
+        """
+        Return the cells and ranges the formula of a cell refers to, as a list
+        of (title, range string)
+        """
+        refs = self._precedents.get(_key(title, coordinate), [])
+        return [(sheet, boundaries_to_string(*b)) for sheet, b in refs]
+
+
+    def dependents(self, title, coordinate, recursive=False):
+        """
+        Return the formula cells which refer to a cell, as a set of
+        (title, coordinate). With `recursive` the cells which refer to those
+        are included, ie. all the cells affected by a change of the cell.
+        """
+        key = _key(title, coordinate)
+        if recursive:
+            keys = self._all_dependents([key])
+        else:
+            keys = self._direct_dependents(key)
+        return set(_cell(k) for k in keys)
+
+
+    def _order(self, keys, strict=True):
+        """
+        Sort formula cells so that every cell comes after its precedents.
+
+        Cells in a circular reference raise CircularReferenceError or, if
+        not `strict`, are put at the end.
+        """
+        keys = set(keys)
+        dependents = {}
+        pending = dict.fromkeys(keys, 0)
+        for key in keys:
+            deps = self._direct_dependents(key) & keys
+            dependents[key] = deps
+            for dep in deps:
+                pending[dep] += 1
+        ready = sorted(k for k, count in iteritems(pending) if not count)
+        order = []
+        while ready:
+            key = ready.pop()
+            order.append(key)
+            for dep in dependents[key]:
+                pending[dep] -= 1
+                if not pending[dep]:
+                    ready.append(dep)
+        if len(order) != len(keys):
+            cycle = sorted(k for k, count in iteritems(pending) if count)
+            if strict:
+                raise CircularReferenceError(
+                    "Circular reference between {0}".format(
+                        [_cell(k) for k in cycle[:10]]))
+            order.extend(cycle)
+        return order
+
+
+    def topological_order(self):
+        """
+        Return all formula cells as (title, coordinate) so that every cell
+        comes after the cells it depends on.
+        """
+        return [_cell(k) for k in self._order(self._precedents)]
+
+
+def _key(title, coordinate):
+    """
+    Convert a cell reference into the internal key (title, row, col)
+    """
+    min_col, min_row, _, _ = range_boundaries(coordinate.upper())
+    return title, min_row, min_col
+
+
+def _cell(key):
+    """
+    Convert an internal key into (title, coordinate)
+    """
+    title, row, col = key
+    return title, "{0}{1}".format(get_column_letter(col), row)
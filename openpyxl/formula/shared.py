@@ -0,0 +1,55 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Shared formulae.
+
+Excel stores a formula which is filled across a range only once, in the
+first cell of the range (the master), the other cells merely refer to it by
+its group index. The group is kept as such so that the formulae of the other
+cells only have to be worked out when asked for, and so that the group can
+be written back as it was read.
+"""
+
+from openpyxl.utils import coordinate_to_tuple
+
+from .translate import Translator
+
+
+class SharedFormula(object):
+
+    """
+    A formula shared by a range of cells.
+
+    `si`: the index of the group within the worksheet
+    `ref`: the range of cells the formula applies to
+    `text`: the formula of the master cell, including the leading '='
+    `master`: the address of the master cell
+    """
+
+    __slots__ = ('si', 'ref', 'text', 'master', 'row', 'col', '_translator')
+
+    def __init__(self, si, ref, text, master):
+        self.si = si
+        self.ref = ref
+        self.text = text
+        self.master = master
+        self.row, self.col = coordinate_to_tuple(master)
+        self._translator = None
+
+
+    def formula(self, row, col):
+        """
+        Return the formula of the cell at (`row`, `col`) in the group.
+        """
+        if row == self.row and col == self.col:
+            return self.text
+        translator = self._translator
+        if translator is None:
+            translator = self._translator = Translator(self.text, self.master)
+        return translator.translate_offset(row - self.row, col - self.col)
+
+
+    def __repr__(self):
+        return "<{0} si={1!r} ref={2!r} {3!r}>".format(self.__class__.__name__,
+                                                      self.si, self.ref, self.text)
@@ -0,0 +1,217 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Rewrite references when rows or columns are inserted into or deleted from a
+worksheet.
+
+Unlike translation, where all relative references move by the same offset,
+only the references at or after the first inserted or deleted row or column
+move, whether relative or absolute. References to deleted cells become
+#REF! errors and ranges shrink when some of their rows or columns are
+deleted.
+"""
+
+from openpyxl.utils import get_column_letter, column_index_from_string
+
+from .tokenizer import Tokenizer, Token, tokenize
+from .translate import Translator
+
+REF_ERROR = "#REF!"
+
+
+class Shift(object):
+
+    """
+    The insertion or deletion of rows or columns of a worksheet.
+
+    `title`: the title of the worksheet
+    `idx`: the index of the first row or column inserted or deleted
+    `amount`: the number of rows or columns, negative for deletions
+    `rows`: True for rows, False for columns
+    """
+
+    def __init__(self, title, idx, amount, rows=True):
+        self.title = title
+        self.idx = idx
+        self.amount = amount
+        self.rows = rows
+
+
+    def index(self, value):
+        """
+        Return the new index of a row or column, None if it is deleted.
+        """
+        if value < self.idx:
+            return value
+        if self.amount > 0 or value >= self.idx - self.amount:
+            return value + self.amount
+
+
+    def interval(self, lo, hi):
+        """
+        Return the new boundaries of an interval of rows or columns, None if
+        all of it is deleted.
+        """
+        new_lo, new_hi = self.index(lo), self.index(hi)
+        if new_lo is None:
+            new_lo = self.idx
+        if new_hi is None:
+            new_hi = self.idx - 1
+        if new_lo > new_hi:
+            return None
+        return new_lo, new_hi
+
+
+    def boundaries(self, min_col, min_row, max_col, max_row):
+        """
+        Return the new boundaries of a range, None if it is deleted.
+        """
+        if self.rows:
+            interval = self.interval(min_row, max_row)
+            if interval is not None:
+                return min_col, interval[0], max_col, interval[1]
+        else:
+            interval = self.interval(min_col, max_col)
+            if interval is not None:
+                return interval[0], min_row, interval[1], max_row
+
+
+    def _row_part(self, row_str, value):
+        return row_str[:row_str.startswith('$')] + str(value)
+
+
+    def _col_part(self, col_str, value):
+        return col_str[:col_str.startswith('$')] + get_column_letter(value)
+
+
+    def reference(self, ref):
+        """
+        Shift a reference to a cell or range, without worksheet. `$` markers
+        are kept. Returns None if it is deleted, and other references, such as
+        names, unchanged.
+        """
+        match = Translator.ROW_RANGE_RE.match(ref)
+        if match is not None:
+            if not self.rows:
+                return ref
+            lo, hi = match.groups()
+            interval = self.interval(int(lo.lstrip('$')), int(hi.lstrip('$')))
+            if interval is None:
+                return None
+            return "{0}:{1}".format(self._row_part(lo, interval[0]),
+                                    self._row_part(hi, interval[1]))
+
+        match = Translator.COL_RANGE_RE.match(ref)
+        if match is not None:
+            if self.rows:
+                return ref
+            lo, hi = match.groups()
+            interval = self.interval(column_index_from_string(lo.lstrip('$').upper()),
+                                     column_index_from_string(hi.lstrip('$').upper()))
+            if interval is None:
+                return None
+            return "{0}:{1}".format(self._col_part(lo, interval[0]),
+                                    self._col_part(hi, interval[1]))
+
+        pieces = [Translator.CELL_REF_RE.match(piece) for piece in ref.split(":")]
+        if None in pieces or len(pieces) > 2:
+            return ref
+        parts = [m.groups() for m in pieces]
+        if self.rows:
+            values = [int(row.lstrip('$')) for col, row in parts]
+        else:
+            values = [column_index_from_string(col.lstrip('$').upper())
+                      for col, row in parts]
+        if len(values) == 1:
+            value = self.index(values[0])
+            if value is None:
+                return None
+            values = [value]
+        else:
+            values = self.interval(*values)
+            if values is None:
+                return None
+        new = []
+        for (col, row), value in zip(parts, values):
+            if self.rows:
+                row = self._row_part(row, value)
+            else:
+                col = self._col_part(col, value)
+            new.append(col + row)
+        return ":".join(new)
+
+
+    def range_string(self, range_string):
+        """
+        Shift a range string of one or more ranges separated by spaces, such as
+        those of merged cells or conditional formats. Returns None if all of
+        them are deleted.
+        """
+        ranges = []
+        for ref in range_string.split():
+            ref = self.reference(ref)
+            if ref is not None:
+                ranges.append(ref)
+        if ranges:
+            return " ".join(ranges)
+
+
+    def _sheet(self, ws_part, own):
+        """
+        Whether a worksheet prefix refers to the shifted worksheet.
+        """
+        if not ws_part:
+            return own
+        title = ws_part[:-1]
+        if title.startswith("'") and title.endswith("'"):
+            title = title[1:-1].replace("''", "'")
+        return title == self.title
+
+
+    def formula(self, formula, own=True):
+        """
+        Shift the references of a formula. `own` is True for formulae on
+        the shifted worksheet, whose references without worksheet refer to it.
+        """
+        if ' ' in formula:
+            # keep intersections
+            tok = Tokenizer(formula, ignore_wspace=False)
+            tok.parse()
+            tokens = tok.items
+        else:
+            tokens = tokenize(formula)
+        if not tokens or tokens[0].type == Token.LITERAL:
+            return formula
+        changed = False
+        text = ["="]
+        for token in tokens:
+            value = token.value
+            if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+                ws_part, ref = Translator.strip_ws_name(value)
+                if self._sheet(ws_part, own):
+                    new = self.reference(ref)
+                    if new is None:
+                        new = REF_ERROR
+                    if new != ref:
+                        changed = True
+                        value = ws_part + new
+            text.append(value)
+        if not changed:
+            return formula
+        return "".join(text)
+
+
+    def refers_to(self, formula, own=True):
+        """
+        Whether a formula refers to cells of the shifted worksheet.
+        """
+        for token in tokenize(formula):
+            if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+                ws_part, ref = Translator.strip_ws_name(token.value)
+                if (self._sheet(ws_part, own)
+                    and (Translator.CELL_REF_RE.match(ref.split(":")[0])
+                         or Translator.ROW_RANGE_RE.match(ref)
+                         or Translator.COL_RANGE_RE.match(ref))):
+                    return True
+        return False
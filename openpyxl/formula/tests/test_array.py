@@ -0,0 +1,64 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+import pytest
+
+
+@pytest.fixture
+def ArrayFormulae():
+    from ..array import ArrayFormulae
+    return ArrayFormulae
+
+
+@pytest.fixture
+def arrays(ArrayFormulae):
+    arrays = ArrayFormulae()
+    arrays['C10'] = {'t': 'array', 'ref': 'C10:C14'}
+    arrays[(2, 5)] = {'t': 'dataTable', 'ref': 'E2:G4', 'dt2D': '1'}
+    arrays[(20, 1)] = {'t': 'array'}
+    return arrays
+
+
+def test_lookup(arrays):
+    assert arrays[(10, 3)] == {'t': 'array', 'ref': 'C10:C14'}
+    assert arrays.get('e2')['t'] == 'dataTable'
+    assert arrays.get('A1') is None
+    assert 'A20' in arrays
+    assert len(arrays) == 3
+    assert sorted(arrays) == [(2, 5), (10, 3), (20, 1)]
+
+
+@pytest.mark.parametrize("row, col, key, boundaries",
+                         [
+                             (10, 3, (10, 3), (3, 10, 3, 14)),
+                             (14, 3, (10, 3), (3, 10, 3, 14)),
+                             (3, 6, (2, 5), (5, 2, 7, 4)),
+                             (20, 1, (20, 1), (1, 20, 1, 20)),
+                             (15, 3, None, None),
+                             (3, 4, None, None),
+                         ])
+def test_find(arrays, row, col, key, boundaries):
+    assert arrays.find(row, col) == key
+    assert arrays.spill_range(row, col) == boundaries
+
+
+def test_replace(arrays):
+    arrays['C10'] = {'t': 'array', 'ref': 'C10:D10'}
+    assert arrays.find(12, 3) is None
+    assert arrays.find(10, 4) == (10, 3)
+    del arrays['C10']
+    assert arrays.find(10, 3) is None
+    assert len(arrays) == 2
+
+
+def test_dict_methods(arrays):
+    assert arrays.pop('C10') == {'t': 'array', 'ref': 'C10:C14'}
+    assert arrays.find(12, 3) is None
+    assert arrays.pop('C10', None) is None
+    arrays.update({'B2': {'t': 'array', 'ref': 'B2:B3'}})
+    assert arrays.find(3, 2) == (2, 2)
+    assert arrays.setdefault('B2', {}) == {'t': 'array', 'ref': 'B2:B3'}
+    assert {'t': 'array'} in list(arrays.values())
+    arrays.clear()
+    assert arrays == {}
+    assert arrays.find(3, 2) is None
@@ -0,0 +1,208 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+from io import BytesIO
+
+import pytest
+
+
+@pytest.fixture
+def Evaluator():
+    from ..evaluate import Evaluator
+    return Evaluator
+
+
+@pytest.fixture
+def ws():
+    from openpyxl import Workbook
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    rows = [
+        ["apple", 3, 0.5],
+        ["banana", 5, 0.25],
+        ["cherry", 7, 2],
+        ["date", "n/a", True],
+    ]
+    for row in rows:
+        ws.append(row)
+    return ws
+
+
+@pytest.mark.parametrize("formula, expected",
+                         [
+                             ("=1+2*3", 7),
+                             ("=(1+2)*3", 9),
+                             ("=-2^2", 4),
+                             ("=2^3^2", 64),
+                             ("=10/4", 2.5),
+                             ("=50%", 0.5),
+                             ('="a"&1&TRUE', "a1TRUE"),
+                             ("=B1*C1", 1.5),
+                             ("=B1<B2", True),
+                             ('="B"="b"', True),
+                             ('="a"<1', False),
+                             ("=Z99", 0),
+                             ("=Z99+1", 1),
+                             ("=SUM(B1:B4)", 15),
+                             ("=SUM(B:B,1,TRUE)", 17),
+                             ("=AVERAGE(B1:B3)", 5.0),
+                             ("=COUNT(A1:C4)", 6),
+                             ("=COUNT(1,\"2\",\"x\")", 2),
+                             ('=IF(B1>4,"big","small")', "small"),
+                             ("=IF(B2>4,B2)", 5),
+                             ("=IF(B1>4,B2)", False),
+                             ("=IF(TRUE,1,1/0)", 1),
+                             ('=VLOOKUP("BANANA",A1:C4,3,FALSE)', 0.25),
+                             ("=VLOOKUP(\"c\",A1:C4,2)", 5),
+                             ("=INDEX(A1:C4,3,2)", 7),
+                             ("=INDEX(B1:B4,2)", 5),
+                             ('=MATCH("cherry",A:A,0)', 3),
+                             ("=MATCH(6,B1:B3)", 2),
+                             ("=INDEX(B1:B4,MATCH(\"date\",A1:A4,0)+0)", "n/a"),
+                         ])
+def test_evaluate(Evaluator, ws, formula, expected):
+    ws['E1'] = formula
+    evaluator = Evaluator(ws.parent)
+    value = evaluator.value(ws['E1'])
+    assert value == expected
+    assert type(value) is type(expected)
+
+
+@pytest.mark.parametrize("formula, expected",
+                         [
+                             ("=1/0", "#DIV/0!"),
+                             ("=A1+1", "#VALUE!"),
+                             ("=#REF!+1", "#REF!"),
+                             ("=AVERAGE(D1:D4)", "#DIV/0!"),
+                             ('=VLOOKUP("fig",A1:C4,2,FALSE)', "#N/A"),
+                             ('=VLOOKUP("apple",A1:C4,4,FALSE)', "#REF!"),
+                             ("=INDEX(A1:C4,5,1)", "#REF!"),
+                             ("=SUM(E2,1)", "#DIV/0!"),
+                         ])
+def test_errors(Evaluator, ws, formula, expected):
+    ws['E1'] = formula
+    ws['E2'] = "=1/0"
+    evaluator = Evaluator(ws.parent)
+    assert evaluator.value(ws['E1']) == expected
+
+
+@pytest.mark.parametrize("formula",
+                         [
+                             "=TODAY()",
+                             "=SUM(A1:A2,B1:B2 B1)",
+                             "=missing_name",
+                             "={1,2}",
+                             "=E2+1",
+                         ])
+def test_unsupported(Evaluator, ws, formula):
+    ws['E1'] = formula
+    ws['E2'] = "=NOW()"
+    evaluator = Evaluator(ws.parent)
+    assert evaluator.value(ws['E1']) is None
+
+
+def test_other_sheet(Evaluator, ws):
+    wb = ws.parent
+    wb.create_named_range("prices", ws, "$C$1:$C$3")
+    summary = wb.create_sheet(title="Summary sheet")
+    summary['A1'] = "=SUM(Data!B1:B3)+'Summary sheet'!B1"
+    summary['B1'] = "=SUM(prices)"
+    evaluator = Evaluator(wb)
+    assert evaluator.value(summary['A1']) == 17.75
+
+
+def test_circular(Evaluator, ws):
+    ws['E1'] = "=E2"
+    ws['E2'] = "=E1+1"
+    ws['E3'] = "=B1"
+    evaluator = Evaluator(ws.parent)
+    evaluator.calculate()
+    assert evaluator.value(ws['E1']) is None
+    assert evaluator.value(ws['E3']) == 3
+
+
+def test_incremental(Evaluator, ws):
+    ws['E1'] = "=SUM(B1:B3)"
+    ws['E2'] = "=E1*2"
+    ws['E3'] = "=C1*2"
+    evaluator = Evaluator(ws.parent)
+    evaluator.calculate()
+    assert evaluator.value(ws['E2']) == 30
+
+    ws['B2'] = 10
+    evaluator.changed(ws['B2'])
+    assert evaluator._dirty == set([("Data", 1, 5), ("Data", 2, 5)])
+    assert evaluator.result(ws['E3']) == 1
+    assert evaluator.value(ws['E2']) == 40
+
+    ws['E1'] = "=B1"
+    evaluator.changed(ws['E1'])
+    assert evaluator.value(ws['E2']) == 6
+
+
+def test_save_results(Evaluator, ws):
+    from openpyxl import load_workbook
+    wb = ws.parent
+    ws['E1'] = "=SUM(B1:B3)"
+    ws['E2'] = '=A1&"s"'
+    ws['E3'] = "=B1>1"
+    ws['E4'] = "=1/0"
+    ws['E5'] = "=NOW()"
+    wb.evaluator = Evaluator(wb)
+
+    out = BytesIO()
+    wb.save(out)
+    wb = load_workbook(out, data_only=True)
+    ws = wb["Data"]
+    assert ws['E1'].value == 15
+    assert ws['E2'].value == "apples"
+    assert ws['E3'].value is True
+    assert ws['E4'].value == "#DIV/0!"
+    assert ws['E5'].value is None
+
+
+def test_save_after_change(Evaluator):
+    from openpyxl import Workbook, load_workbook
+    wb = Workbook()
+    ws = wb.active
+    ws['A1'] = 10
+    ws['A2'] = "=A1*2"
+    ws['B1'] = "=A2+2"
+    wb.evaluator = Evaluator(wb)
+    wb.save(BytesIO())
+
+    ws['A1'] = 5
+    ws.append([1, 2])
+    ws['C1'] = "=SUM(A:A)"
+    out = BytesIO()
+    wb.save(out)
+    ws = load_workbook(out, data_only=True).active
+    assert ws['A2'].value == 10
+    assert ws['B1'].value == 12
+    assert ws['C1'].value == 16
+
+
+def test_save_after_rename(Evaluator):
+    from openpyxl import Workbook, load_workbook
+    wb = Workbook()
+    ws = wb.active
+    ws.append([5, "=A1*2", "=B1+1"])
+    wb.evaluator = Evaluator(wb)
+    wb.save(BytesIO())
+
+    ws.title = "Renamed"
+    out = BytesIO()
+    wb.save(out)
+    ws = load_workbook(out, data_only=True).active
+    assert [ws[c].value for c in ("A1", "B1", "C1")] == [5, 10, 11]
+
+
+def test_reset(Evaluator, ws):
+    ws['E1'] = "=B1*2"
+    evaluator = Evaluator(ws.parent)
+    assert evaluator.value(ws['E1']) == 6
+    ws._cells[(1, 2)]._value = 4
+    evaluator.reset()
+    assert evaluator._dirty == set([("Data", 1, 5)])
+    assert evaluator.value(ws['E1']) == 8
@@ -0,0 +1,115 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+import pytest
+
+
+@pytest.fixture
+def DependencyGraph():
+    from ..graph import DependencyGraph
+    return DependencyGraph
+
+
+@pytest.fixture
+def Workbook():
+    from openpyxl import Workbook
+    return Workbook
+
+
+@pytest.fixture
+def wb(Workbook):
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws['A1'] = 1
+    ws['A2'] = 2
+    ws['B1'] = "=A1*2"
+    ws['B2'] = "=SUM(A1:A1000000)"
+    ws['C1'] = "=B1+B2"
+    other = wb.create_sheet(title="Summary sheet")
+    other['A1'] = "=Data!C1+'Summary sheet'!B1"
+    other['B1'] = "=SUM(Data!$B:$B)"
+    return wb
+
+
+@pytest.mark.parametrize("ref, boundaries",
+                         [
+                             ("A1", (1, 1, 1, 1)),
+                             ("$B$2:c5", (2, 2, 3, 5)),
+                             ("$A:$C", (1, 1, 3, 1048576)),
+                             ("2:3", (1, 2, 16384, 3)),
+                             ("rates", None),
+                         ])
+def test_reference_boundaries(ref, boundaries):
+    from ..graph import reference_boundaries
+    assert reference_boundaries(ref) == boundaries
+
+
+def test_range_index():
+    from ..graph import RangeIndex
+    index = RangeIndex()
+    index.add((1, 1, 1, 1000000), "column")
+    index.add((1, 5, 3, 10), "block")
+    index.add((2, 20, 2, 30), "other")
+    assert index.items(7, 1) == set(["column", "block"])
+    assert index.items(25, 2) == set(["other"])
+    assert index.items(25, 3) == set()
+    index.remove((1, 5, 3, 10), "block")
+    assert index.items(7, 1) == set(["column"])
+    assert len(index) == 2
+
+
+def test_precedents(DependencyGraph, wb):
+    graph = DependencyGraph(wb)
+    assert graph.precedents("Data", "C1") == [("Data", "B1"), ("Data", "B2")]
+    assert graph.precedents("Data", "B2") == [("Data", "A1:A1000000")]
+    assert graph.precedents("Summary sheet", "A1") == [("Data", "C1"),
+                                                       ("Summary sheet", "B1")]
+    assert graph.precedents("Data", "A1") == []
+
+
+def test_dependents(DependencyGraph, wb):
+    graph = DependencyGraph(wb)
+    assert graph.dependents("Data", "A1") == set([("Data", "B1"), ("Data", "B2")])
+    assert graph.dependents("Data", "A500") == set([("Data", "B2")])
+    assert graph.dependents("Data", "A1", recursive=True) == set([
+        ("Data", "B1"), ("Data", "B2"), ("Data", "C1"),
+        ("Summary sheet", "A1"), ("Summary sheet", "B1")])
+
+
+def test_named_range(DependencyGraph, wb):
+    ws = wb["Data"]
+    wb.create_named_range("inputs", ws, "$A$1:$A$2")
+    ws['D1'] = "=AVERAGE(inputs)"
+    graph = DependencyGraph(wb)
+    assert graph.precedents("Data", "D1") == [("Data", "A1:A2")]
+    assert ("Data", "D1") in graph.dependents("Data", "A2")
+
+
+def test_topological_order(DependencyGraph, wb):
+    graph = DependencyGraph(wb)
+    order = graph.topological_order()
+    assert len(order) == 5
+    for cell in order:
+        for dep in graph.dependents(*cell):
+            assert order.index(cell) < order.index(dep)
+
+
+def test_circular_reference(DependencyGraph, Workbook):
+    from ..graph import CircularReferenceError
+    wb = Workbook()
+    ws = wb.active
+    ws['A1'] = "=B1"
+    ws['B1'] = "=A1+1"
+    graph = DependencyGraph(wb)
+    with pytest.raises(CircularReferenceError):
+        graph.topological_order()
+
+
+def test_update(DependencyGraph, wb):
+    graph = DependencyGraph(wb)
+    graph.add_formula("Data", 2, 2, "=A2")
+    assert graph.dependents("Data", "A500") == set()
+    assert graph.dependents("Data", "A2") == set([("Data", "B2")])
+    graph.remove_formula("Data", 2, 2)
+    assert ("Data", "B2") not in graph
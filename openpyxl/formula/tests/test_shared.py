@@ -0,0 +1,35 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+import pytest
+
+
+@pytest.fixture
+def SharedFormula():
+    from ..shared import SharedFormula
+    return SharedFormula
+
+
+def test_master(SharedFormula):
+    shared = SharedFormula("0", "B7:E7", "=b4*2", "B7")
+    assert (shared.row, shared.col) == (7, 2)
+    assert shared.formula(7, 2) == "=b4*2"
+    assert shared._translator is None
+
+
+def test_dependent(SharedFormula):
+    shared = SharedFormula("0", "B7:E8", "=B4*$A$1", "B7")
+    assert shared.formula(7, 3) == "=C4*$A$1"
+    assert shared.formula(8, 5) == "=E5*$A$1"
+
+
+def test_cell_value(SharedFormula):
+    from openpyxl import Workbook
+    ws = Workbook().active
+    shared = SharedFormula("0", "A2:C2", "=A1+1", "A2")
+    for col in "ABC":
+        cell = ws[col + "2"]
+        cell._value = shared
+        cell.data_type = 'f'
+    assert ws['C2'].value == "=C1+1"
+    assert ws['B2'].internal_value == "=B1+1"
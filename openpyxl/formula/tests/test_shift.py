@@ -0,0 +1,74 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+import pytest
+
+
+@pytest.fixture
+def Shift():
+    from ..shift import Shift
+    return Shift
+
+
+@pytest.mark.parametrize("idx, amount, value, expected",
+                         [
+                             (5, 2, 4, 4),
+                             (5, 2, 5, 7),
+                             (5, -2, 5, None),
+                             (5, -2, 6, None),
+                             (5, -2, 7, 5),
+                         ])
+def test_index(Shift, idx, amount, value, expected):
+    shift = Shift("Sheet", idx, amount)
+    assert shift.index(value) == expected
+
+
+@pytest.mark.parametrize("rows, amount, ref, expected",
+                         [
+                             (True, 2, "A4", "A4"),
+                             (True, 2, "$B$5", "$B$7"),
+                             (True, 2, "A1:C10", "A1:C12"),
+                             (True, 2, "5:$6", "7:$8"),
+                             (True, 2, "A:C", "A:C"),
+                             (True, -2, "A5", None),
+                             (True, -2, "A1:B6", "A1:B4"),
+                             (True, -2, "A6:B8", "A5:B6"),
+                             (True, -2, "A5:B6", None),
+                             (False, 1, "E1:$F$2", "F1:$G$2"),
+                             (False, 1, "D:$E", "D:$F"),
+                             (False, -1, "E:E", None),
+                             (False, 1, "3:4", "3:4"),
+                             (True, 2, "prices", "prices"),
+                         ])
+def test_reference(Shift, rows, amount, ref, expected):
+    shift = Shift("Sheet", 5, amount, rows=rows)
+    assert shift.reference(ref) == expected
+
+
+@pytest.mark.parametrize("formula, own, expected",
+                         [
+                             ("=A4+A5", True, "=A4+A7"),
+                             ("=SUM(A1:A10)*$B$6", True, "=SUM(A1:A12)*$B$8"),
+                             ("=A5", False, "=A5"),
+                             ("=Sheet!A5+'Other sheet'!A5", False,
+                              "=Sheet!A7+'Other sheet'!A5"),
+                             ("=SUM(A1:A9 A5)", True, "=SUM(A1:A11 A7)"),
+                             ('="A5"', True, '="A5"'),
+                             ("=A4 + 1", True, "=A4 + 1"),
+                         ])
+def test_formula(Shift, formula, own, expected):
+    shift = Shift("Sheet", 5, 2)
+    assert shift.formula(formula, own) == expected
+
+
+def test_formula_deleted(Shift):
+    shift = Shift("Sheet", 5, -1)
+    assert shift.formula("=A5+Sheet!A6+SUM(A5:A6)") == "=#REF!+Sheet!A5+SUM(A5:A5)"
+
+
+def test_refers_to(Shift):
+    shift = Shift("Sheet", 5, 2)
+    assert shift.refers_to("=A1", own=True)
+    assert not shift.refers_to("=A1", own=False)
+    assert shift.refers_to("=Sheet!A1", own=False)
+    assert not shift.refers_to("=prices", own=True)
@@ -492,6 +492,78 @@ class TestTokenizer(object):
         assert tok.render() == formula
 
 
+def char_parse(tok):
+    """
+    Reference implementation of Tokenizer.parse for formulae, reading one
+    character at a time.
+    """
+    tok.offset = 1
+    dispatcher = {}
+    for chars, consumer in (
+        ('"\'', tok.parse_string),
+        ('[', tok.parse_brackets),
+        ('#', tok.parse_error),
+        (' ', tok.parse_whitespace),
+        ('+-*/^&=><%', tok.parse_operator),
+        ('{(', tok.parse_opener),
+        (')}', tok.parse_closer),
+        (';,', tok.parse_separator),
+    ):
+        dispatcher.update(dict.fromkeys(chars, consumer))
+    while tok.offset < len(tok.formula):
+        if tok.check_scientific_notation():
+            continue
+        curr_char = tok.formula[tok.offset]
+        if curr_char in tok.TOKEN_ENDERS:
+            tok.save_token()
+        if curr_char in dispatcher:
+            tok.offset += dispatcher[curr_char]()
+        else:
+            tok.token.append(curr_char)
+            tok.offset += 1
+    tok.save_token()
+
+
+CORPUS = [
+    '=IF(A$3<40%,"",INDEX(Pipeline!B$4:B$138,#REF!))',
+    "='Summary slices'!$C$3",
+    '=-MAX(Pipeline!AA4:AA138)',
+    '=TEXT(-S7/1000,"$#,##0""M""")',
+    "=IF(A$3<1.3E-8,\"\",IF(ISNA('External Ref'!K7),"
+    '"N/A",TEXT(K7*1E+12,"0")&"bp"',
+    '=+IF(A$3<>$B7,"",(MIN(IF({TRUE, FALSE;1,2},A6:B6,$S7))>='
+    'LOWER_BOUND)*($BR6>$S72123))',
+    '=(AW$4=$D7)+0%',
+    '=$A:$A,$C:$C',
+    '=SUM(Sheet1:Sheet3!A1:B10)',
+    '=[1]Sheet1!$A$1+[Book2.xlsx]Data!B2',
+    '=Table1[[#This Row],[Amount]]*2',
+    "='It''s here'!A1&\"quoted \"\"text\"\"\"",
+    '=1E+2+2.5E-3-3E2',
+    '=A1   +   B1',
+    '=VLOOKUP(A2,$D$2:$F$100,3,FALSE)/#DIV/0!',
+    '=-(-A1)^2%',
+    '=A1:A10 B5:B20',
+    '=SUMPRODUCT((A1:A100>=5)*(B1:B100<=10),C1:C100)',
+    '={1,2;3,4}',
+    '=INDEX(rng,MATCH(MAX(rng),rng,0))',
+    '=',
+    '=""',
+]
+
+
+@pytest.mark.parametrize("formula", CORPUS)
+@pytest.mark.parametrize("ignore_wspace", [True, False])
+def test_scanner_equivalence(tokenizer, formula, ignore_wspace):
+    tok = tokenizer.Tokenizer(formula, ignore_wspace)
+    tok.parse()
+    ref = tokenizer.Tokenizer(formula, ignore_wspace)
+    char_parse(ref)
+    result = [(t.value, t.type, t.subtype) for t in tok.items]
+    expected = [(t.value, t.type, t.subtype) for t in ref.items]
+    assert result == expected
+
+
 class TestToken(object):
 
     def test_init(self, tokenizer):
@@ -565,3 +637,13 @@ class TestToken(object):
         assert token.value == ';'
         assert token.type == SEP
         assert token.subtype == ROW
+
+
+def test_tokenize(tokenizer):
+    tokenize = tokenizer.tokenize
+    tokenize.cache_clear()
+    tokens = tokenize("=SUM(A1:A5)")
+    assert [t.value for t in tokens] == ["SUM(", "A1:A5", ")"]
+    assert tokenize("=SUM(A1:A5)") is tokens
+    info = tokenize.cache_info()
+    assert (info.hits, info.misses, info.currsize) == (1, 1, 1)
@@ -56,6 +56,13 @@ class TestTranslator(object):
             assert t1.type == t2.type
             assert t1.subtype == t2.subtype
 
+    def test_get_tokens_copied(self, Translator):
+        trans = Translator("=A1+B1", "A1")
+        tokens = trans.get_tokens()
+        tokens[0].value = "C1"
+        assert trans.get_tokens()[0].value == "A1"
+        assert Translator("=A1+B1", "A1").translate_formula("A2") == "=A2+B2"
+
     @pytest.mark.parametrize("test_str, groups", [
         ["1:1", ("1", "1")],
         ["1234:5678", ("1234", "5678")],
@@ -197,6 +204,7 @@ class TestTranslator(object):
         ("$DEF:$FOV", 25, 25, "$DEF:$FOV"),
         ("HA:$JA", -5, -15, "GL:$JA"),
         ("named1", -33, 33, "named1"),
+        ("Sheet-2!named_range_2", 1, 1, "Sheet-2!named_range_2"),
         ("A15", -3, 4, "E12"),
         ("$AB303", 3, 2, "$AB306"),
         ("YY$101", 4, 2, "ZA$101"),
@@ -234,3 +242,47 @@ class TestTranslator(object):
                                origin, dest, result):
         trans = Translator(formula, origin)
         assert trans.translate_formula(dest) == result
+
+    @pytest.mark.parametrize("test_str, parts", [
+        ("1:1", ["", ("ROW", 1), ":", ("ROW", 1)]),
+        ("$A:B", ["", "$A", ":", ("COL", 2)]),
+        ("Sheet!A$1", ["Sheet!", ("COL", 1), "$1"]),
+        ("named1", ["", "named1"]),
+        ("B2:$C3", ["", "", ("COL", 2), ("ROW", 2), ":", "", "$C", ("ROW", 3)]),
+    ])
+    def test_compile_range(self, Translator, test_str, parts):
+        assert Translator.compile_range(test_str) == parts
+
+    @pytest.mark.parametrize("range_str", [
+        "A1", "$A$1:B2", "3:$4", "Sheet!A$1", "'Sh 1'!B:$C",
+        "named1", "Sheet!named1", "'Sh 1'!named1:B2",
+    ])
+    def test_compiled_range(self, Translator, range_str):
+        trans = Translator("=" + range_str, "A1")
+        translated = Translator.translate_range(range_str, 1, 1)
+        assert trans.translate_formula("B2") == "=" + translated
+
+    def test_translate_offset(self, Translator, TranslatorError):
+        trans = Translator("=SUM(A$2:B2)+'Sh 1'!$A3*named", "C3")
+        assert trans.translate_offset(1, 1) == "=SUM(B$2:C3)+'Sh 1'!$A4*named"
+        assert trans.translate_offset(0, 0) == "=SUM(A$2:B2)+'Sh 1'!$A3*named"
+        with pytest.raises(TranslatorError):
+            trans.translate_offset(-2, 0)
+        assert Translator("Just text", "A1").translate_offset(1, 1) == "Just text"
+
+    @pytest.mark.parametrize("dest, result", [
+        ("D4", "=SUM(B$2:C3)+'Sh 1'!$A4*named"),
+        ("C12", "=SUM(A$2:B11)+'Sh 1'!$A12*named"),
+        ("A1", None),
+    ])
+    def test_translate_compiled(self, Translator, TranslatorError, dest,
+                                result):
+        trans = Translator("=SUM(A$2:B2)+'Sh 1'!$A3*named", "C3")
+        trans.translate_formula("C3")
+        template = trans._template
+        if result is None:
+            with pytest.raises(TranslatorError):
+                trans.translate_formula(dest)
+        else:
+            assert trans.translate_formula(dest) == result
+        assert trans._template is template
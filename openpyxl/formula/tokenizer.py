@@ -8,6 +8,8 @@ Bachtal
 
 import re
 
+from openpyxl.compat import lru_cache
+
 
 class TokenizerError(Exception):
     "Base class for all Tokenizer errors."
@@ -42,6 +44,20 @@ class Tokenizer(object):
                    "#NUM!", "#N/A")
     TOKEN_ENDERS = ',;}) +-*/^&=><%'  # Each of these characters, marks the
                                        # end of an operand token
+    CONSUMERS = (
+        ('"\'', 'parse_string'),
+        ('[', 'parse_brackets'),
+        ('#', 'parse_error'),
+        (' ', 'parse_whitespace'),
+        ('+-*/^&=><%', 'parse_operator'),
+        ('{(', 'parse_opener'),
+        (')}', 'parse_closer'),
+        (';,', 'parse_separator'),
+    )
+    # maps chars to the name of the specific parsing method
+    DISPATCHER = dict((char, name) for chars, name in CONSUMERS for char in chars)
+    # A run of characters none of which needs a specific consumer
+    OPERAND_RE = re.compile('[^"\'\\[# +\\-*/^&=><%{()};,]+')
 
     def __init__(self, formula, ignore_wspace=True):
         self.formula = formula
@@ -61,32 +77,24 @@ class Tokenizer(object):
         else:
             self.items.append(Token(self.formula, Token.LITERAL))
             return
-        consumers = (
-            ('"\'', self.parse_string),
-            ('[', self.parse_brackets),
-            ('#', self.parse_error),
-            (' ', self.parse_whitespace),
-            ('+-*/^&=><%', self.parse_operator),
-            ('{(', self.parse_opener),
-            (')}', self.parse_closer),
-            (';,', self.parse_separator),
-        )
-        dispatcher = {}  # maps chars to the specific parsing function
-        for chars, consumer in consumers:
-            dispatcher.update(dict.fromkeys(chars, consumer))
-        while self.offset < len(self.formula):
-            if self.check_scientific_notation():  # May consume one character
-                continue
-            curr_char = self.formula[self.offset]
-            if curr_char in self.TOKEN_ENDERS:
-                self.save_token()
+        dispatcher = self.DISPATCHER
+        formula = self.formula
+        size = len(formula)
+        match_operand = self.OPERAND_RE.match
+        while self.offset < size:
+            curr_char = formula[self.offset]
             if curr_char in dispatcher:
-                self.offset += dispatcher[curr_char]()
+                if (curr_char in '+-' and self.token
+                    and self.check_scientific_notation()):  # May consume one character
+                    continue
+                if curr_char in self.TOKEN_ENDERS:
+                    self.save_token()
+                self.offset += getattr(self, dispatcher[curr_char])()
             else:
-                # TODO: this can probably be sped up using a regex to get to
-                # the next interesting character
-                self.token.append(curr_char)
-                self.offset += 1
+                # consume everything up to the next interesting character
+                end = match_operand(formula, self.offset).end()
+                self.token.append(formula[self.offset:end])
+                self.offset = end
         self.save_token()
 
     def parse_string(self):
@@ -106,7 +114,7 @@ class Tokenizer(object):
         delim = self.formula[self.offset]
         assert delim in ('"', "'")
         regex = self.STRING_REGEXES[delim]
-        match = regex.match(self.formula[self.offset:])
+        match = regex.match(self.formula, self.offset)
         if match is None:
             subtype = "string" if delim == '"' else 'link'
             raise TokenizerError(
@@ -145,9 +153,8 @@ class Tokenizer(object):
         """
         self.assert_empty_token()
         assert self.formula[self.offset] == '#'
-        subformula = self.formula[self.offset:]
         for err in self.ERROR_CODES:
-            if subformula.startswith(err):
+            if self.formula.startswith(err, self.offset):
                 self.items.append(Token.make_operand(err))
                 return len(err)
         raise TokenizerError(
@@ -164,7 +171,7 @@ class Tokenizer(object):
         assert self.formula[self.offset] == ' '
         if not self.ignore_wspace:
           self.items.append(Token(' ', Token.WSPACE))
-        return self.WSPACE_RE.match(self.formula[self.offset:]).end()
+        return self.WSPACE_RE.match(self.formula, self.offset).end() - self.offset
 
     def parse_operator(self):
         """
@@ -311,6 +318,21 @@ class Tokenizer(object):
         return "=" + "".join(token.value for token in self.items)
 
 
+@lru_cache(maxsize=10000)
+def tokenize(formula):
+    """
+    Return the tokens of a formula as a tuple.
+
+    The tokens of the most recently used formulae are cached, so that the
+    same formula in many cells is only parsed once. The tokens are shared
+    and must not be changed. `tokenize.cache_info()` returns the hits and
+    misses of the cache.
+    """
+    tok = Tokenizer(formula)
+    tok.parse()
+    return tuple(tok.items)
+
+
 class Token(object):
 
     """
@@ -10,7 +10,7 @@ to identify the parts of the formula that need to change.
 """
 
 import re
-from .tokenizer import Tokenizer, Token
+from .tokenizer import Tokenizer, Token, tokenize
 from openpyxl.utils import (coordinate_from_string, column_index_from_string,
                             get_column_letter)
 
@@ -39,6 +39,14 @@ class Translator(object):
     `origin`: The cell address (in A1 notation) where this formula was
               defined (excluding the worksheet name).
 
+    The formula is tokenized only once, and its tokens are shared with other
+    translators of the same formula (see `tokenize`), which is why
+    `get_tokens` returns copies of them. The first translation
+    compiles it into a template of literal text and the relative row and
+    column parts of its references so that further translations, such as
+    those of the cells sharing a formula, only need to fill in the new
+    values.
+
     """
 
     def __init__(self, formula, origin):
@@ -47,12 +55,18 @@ class Translator(object):
         # formulae stored in the workbook must be in A1 notation.
         col, self.row = coordinate_from_string(origin)
         self.col = column_index_from_string(col)
-        self.tokenizer = Tokenizer(formula)
+        self.formula = formula
+        self._template = None
+
+    @property
+    def tokenizer(self):
+        "A tokenizer for the formula, which is not parsed."
+        return Tokenizer(self.formula)
 
     def get_tokens(self):
         "Returns a list with the tokens comprising the formula."
-        self.tokenizer.parse()
-        return self.tokenizer.items
+        return [Token(token.value, token.type, token.subtype)
+                for token in tokenize(self.formula)]
 
     ROW_RANGE_RE = re.compile(r"(\$?[1-9][0-9]{0,6}):(\$?[1-9][0-9]{0,6})$")
     COL_RANGE_RE = re.compile(r"(\$?[A-Za-z]{1,3}):(\$?[A-Za-z]{1,3})$")
@@ -130,10 +144,93 @@ class Translator(object):
                 for piece in range_str.split(':'))
         match = cls.CELL_REF_RE.match(range_str)
         if match is None:  # Must be a named range
-            return range_str
+            return ws_part + range_str
         return (ws_part + cls.translate_col(match.group(1), cdelta)
                 + cls.translate_row(match.group(2), rdelta))
 
+    ROW = "ROW"
+    COL = "COL"
+
+    @classmethod
+    def compile_row(cls, row_str):
+        """
+        Return a row-snippet as a literal if it is absolute or as a slot
+        otherwise.
+        """
+        if row_str.startswith('$'):
+            return row_str
+        return (cls.ROW, int(row_str))
+
+    @classmethod
+    def compile_col(cls, col_str):
+        """
+        Return a col-snippet as a literal if it is absolute or as a slot
+        otherwise. Invalid columns are kept as strings so that translating
+        them raises the same errors as translate_col.
+        """
+        if col_str.startswith('$'):
+            return col_str
+        try:
+            return (cls.COL, column_index_from_string(col_str))
+        except ValueError:
+            return (cls.COL, col_str)
+
+    @classmethod
+    def compile_range(cls, range_str):
+        """
+        Split an A1-style range reference into a list of literal strings and
+        (ROW, index) or (COL, index) slots for the parts which are relative.
+
+        Filling in the slots gives the same result as `translate_range`.
+        """
+        ws_part, range_str = cls.strip_ws_name(range_str)
+        parts = [ws_part]
+        match = cls.ROW_RANGE_RE.match(range_str)  # e.g. `3:4`
+        if match is not None:
+            parts.extend([cls.compile_row(match.group(1)), ":",
+                          cls.compile_row(match.group(2))])
+            return parts
+        match = cls.COL_RANGE_RE.match(range_str)  # e.g. `A:BC`
+        if match is not None:
+            parts.extend([cls.compile_col(match.group(1)), ":",
+                          cls.compile_col(match.group(2))])
+            return parts
+        if ':' in range_str: # e.g. `A1:B5`
+            for idx, piece in enumerate(range_str.split(':')):
+                if idx:
+                    parts.append(":")
+                parts.extend(cls.compile_range(piece))
+            return parts
+        match = cls.CELL_REF_RE.match(range_str)
+        if match is None:  # Must be a named range
+            parts.append(range_str)
+            return parts
+        parts.extend([cls.compile_col(match.group(1)),
+                      cls.compile_row(match.group(2))])
+        return parts
+
+    def compile(self):
+        """
+        Convert the tokens of the formula into a template of literal strings
+        and slots for the relative parts of its references.
+        """
+        template = []
+        text = ['=']
+        for token in tokenize(self.formula):
+            if token.type == Token.OPERAND and token.subtype == Token.RANGE:
+                for part in self.compile_range(token.value):
+                    if isinstance(part, tuple):
+                        template.append("".join(text))
+                        template.append(part)
+                        text = []
+                    else:
+                        text.append(part)
+            else:
+                text.append(token.value)
+        template.append("".join(text))
+        self._template = template
+        return template
+
     def translate_formula(self, dest):
         """
         Convert the formula into A1 notation.
@@ -142,12 +239,6 @@ class Translator(object):
         whose address is `dest` (no worksheet name).
 
         """
-        tokens = self.get_tokens()
-        if not tokens:
-            return ""
-        elif tokens[0].type == Token.LITERAL:
-            return tokens[0].value
-        out = ['=']
         # per the spec:
         # A compliant producer or consumer considers a defined name in the
         # range A1-XFD1048576 to be an error. All other names outside this
@@ -155,12 +246,42 @@ class Translator(object):
         # ambiguity exists. (I.18.2.5)
         dcol, drow = coordinate_from_string(dest)
         dcol = column_index_from_string(dcol)
-        row_delta = drow - self.row
-        col_delta = dcol - self.col
-        for token in tokens:
-            if token.type == Token.OPERAND and token.subtype == Token.RANGE:
-                out.append(self.translate_range(token.value, row_delta,
-                                                col_delta))
-            else:
-                out.append(token.value)
+        return self.translate_offset(drow - self.row, dcol - self.col)
+
+    def translate_offset(self, row_delta, col_delta):
+        """
+        Convert the formula into A1 notation for the cell `row_delta` rows
+        down and `col_delta` columns to the right of its origin.
+        """
+        tokens = tokenize(self.formula)
+        if not tokens:
+            return ""
+        elif tokens[0].type == Token.LITERAL:
+            return tokens[0].value
+        return self._fill(row_delta, col_delta)
+
+    def _fill(self, row_delta, col_delta):
+        """
+        Fill in the slots of the compiled template for the given offsets.
+        """
+        template = self._template
+        if template is None:
+            template = self.compile()
+        out = []
+        for part in template:
+            if part.__class__ is tuple:
+                kind, value = part
+                if kind == self.ROW:
+                    value += row_delta
+                    if value <= 0:
+                        raise TranslatorError("Formula out of range")
+                    part = str(value)
+                elif value.__class__ is int:
+                    try:
+                        part = get_column_letter(value + col_delta)
+                    except ValueError:
+                        raise TranslatorError("Formula out of range")
+                else:
+                    part = self.translate_col(value, col_delta)
+            out.append(part)
         return "".join(out)
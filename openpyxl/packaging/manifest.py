@@ -35,12 +35,31 @@ from openpyxl.xml.constants import (
     CONTYPES_NS
 )
 
-# initialise mime-types
-mimetypes.init()
-mimetypes.add_type('application/xml', ".xml")
-mimetypes.add_type('application/vnd.openxmlformats-package.relationships+xml', ".rels")
-mimetypes.add_type("application/vnd.ms-office.activeX", ".bin")
-mimetypes.add_type("application/vnd.openxmlformats-officedocument.vmlDrawing", ".vml")
+MIME_TYPES = (
+    ('application/xml', ".xml"),
+    ('application/vnd.openxmlformats-package.relationships+xml', ".rels"),
+    ("application/vnd.ms-office.activeX", ".bin"),
+    ("application/vnd.openxmlformats-officedocument.vmlDrawing", ".vml"),
+)
+
+
+# filled on first use by _types_map
+_TYPES_MAP = {}
+
+
+def _types_map():
+    """
+    Return the mime-types by extension. They are read on first use, because
+    reading the system's tables is slow, into a table of their own so that
+    the global tables of the mimetypes module are left as they are.
+    """
+    if not _TYPES_MAP:
+        files = [name for name in mimetypes.knownfiles if os.path.isfile(name)]
+        types = mimetypes.MimeTypes(files)
+        for mime, ext in MIME_TYPES:
+            types.add_type(mime, ext)
+        _TYPES_MAP.update(types.types_map[True])
+    return _TYPES_MAP
 
 
 class FileExtension(Serialisable):
@@ -115,7 +134,8 @@ class Manifest(Serialisable):
     @property
     def extensions(self):
         exts = set([os.path.splitext(part.PartName)[-1] for part in self.Override])
-        return [(ext[1:], mimetypes.types_map[ext]) for ext in sorted(exts)]
+        types_map = _types_map()
+        return [(ext[1:], types_map[ext]) for ext in sorted(exts)]
 
 
     def to_tree(self):
@@ -177,7 +197,7 @@ def write_content_types(workbook, as_template=False):
 
         if sheet._comment_count > 0:
             comments_id += 1
-            vml = FileExtension("vml", mimetypes.types_map[".vml"])
+            vml = FileExtension("vml", _types_map()[".vml"])
             if vml not in manifest.Default:
                 manifest.Default.append(vml)
             name = '/xl/comments%d.xml' % comments_id
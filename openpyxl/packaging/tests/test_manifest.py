@@ -273,3 +273,13 @@ class TestContentTypes:
         """
         diff = compare_xml(xml, expected)
         assert diff is None, diff
+
+
+def test_types_map_private():
+    import mimetypes
+    from ..manifest import _types_map
+    mimetypes.add_type("application/x-openpyxl-test", ".opxtest")
+    types_map = _types_map()
+    assert types_map[".rels"] == "application/vnd.openxmlformats-package.relationships+xml"
+    assert types_map is _types_map()
+    assert mimetypes.types_map[".opxtest"] == "application/x-openpyxl-test"
@@ -22,6 +22,9 @@ except ImportError:
 
 # package imports
 from openpyxl.utils.exceptions import InvalidFileException
+from openpyxl.utils.indexed_list import IndexedList
+from openpyxl.utils.instrumentation import phase
+from openpyxl.utils.sampler import profiled
 from openpyxl.xml.constants import (
     ARC_SHARED_STRINGS,
     ARC_CORE,
@@ -35,7 +38,10 @@ from openpyxl.xml.constants import (
 
 from openpyxl.workbook import Workbook
 from openpyxl.workbook.names.external import detect_external_links
-from openpyxl.workbook.names.named_range import read_named_ranges
+from openpyxl.workbook.names.named_range import (
+    read_named_ranges,
+    DefinedNameList,
+)
 from .strings import read_string_table
 from openpyxl.styles.stylesheet import apply_stylesheet
 from .workbook import (
@@ -50,7 +56,6 @@ from openpyxl.packaging.core import DocumentProperties
 from openpyxl.worksheet.read_only import ReadOnlyWorksheet
 from openpyxl.xml.functions import fromstring
 from .worksheet import WorkSheetParser
-from .comments import read_comments, get_comments_file
 # Use exc_info for Python 2 compatibility with "except Exception[,/ as] e"
 
 
@@ -118,6 +123,7 @@ def _validate_archive(filename):
     return archive
 
 
+@profiled("load")
 def load_workbook(filename, read_only=False, use_iterators=False, keep_vba=KEEP_VBA, guess_types=False, data_only=False):
     """Open the given filename and return the workbook
 
@@ -147,7 +153,8 @@ def load_workbook(filename, read_only=False, use_iterators=False, keep_vba=KEEP_
         and the returned workbook will be read-only.
 
     """
-    archive = _validate_archive(filename)
+    with phase("archive"):
+        archive = _validate_archive(filename)
     read_only = read_only or use_iterators
 
     wb = Workbook(guess_types=guess_types, data_only=data_only, read_only=read_only)
@@ -160,47 +167,51 @@ def load_workbook(filename, read_only=False, use_iterators=False, keep_vba=KEEP_
     # If are going to preserve the vba then attach a copy of the archive to the
     # workbook so that is available for the save.
     if keep_vba:
-        try:
-            f = open(filename, 'rb')
-            s = f.read()
-            f.close()
-        except:
-            pos = filename.tell()
-            filename.seek(0)
-            s = filename.read()
-            filename.seek(pos)
-        wb.vba_archive = ZipFile(BytesIO(s), 'r')
+        with phase("vba"):
+            try:
+                f = open(filename, 'rb')
+                s = f.read()
+                f.close()
+            except:
+                pos = filename.tell()
+                filename.seek(0)
+                s = filename.read()
+                filename.seek(pos)
+            wb.vba_archive = ZipFile(BytesIO(s), 'r')
 
     if read_only:
         wb._archive = ZipFile(filename)
 
     # get workbook-level information
-    try:
-        src = fromstring(archive.read(ARC_CORE))
-        wb.properties = DocumentProperties.from_tree(src)
-    except KeyError:
-        wb.properties = DocumentProperties()
-    wb.active = read_workbook_settings(archive.read(ARC_WORKBOOK)) or 0
-
-    # what content types do we have?
-    cts = dict(read_content_types(archive))
-
-    strings_path = cts.get(SHARED_STRINGS)
-    if strings_path is not None:
-        if strings_path.startswith("/"):
-            strings_path = strings_path[1:]
-        shared_strings = read_string_table(archive.read(strings_path))
-    else:
-        shared_strings = []
+    with phase("workbook"):
+        try:
+            src = fromstring(archive.read(ARC_CORE))
+            wb.properties = DocumentProperties.from_tree(src)
+        except KeyError:
+            wb.properties = DocumentProperties()
+        wb.active = read_workbook_settings(archive.read(ARC_WORKBOOK)) or 0
+
+        # what content types do we have?
+        cts = dict(read_content_types(archive))
+
+    with phase("shared strings"):
+        strings_path = cts.get(SHARED_STRINGS)
+        if strings_path is not None:
+            if strings_path.startswith("/"):
+                strings_path = strings_path[1:]
+            shared_strings = read_string_table(archive.read(strings_path))
+        else:
+            shared_strings = []
 
     wb.is_template = XLTX in cts or XLTM in cts
 
-    try:
-        wb.loaded_theme = archive.read(ARC_THEME)  # some writers don't output a theme, live with it (fixes #160)
-    except KeyError:
-        pass
+    with phase("styles"):
+        try:
+            wb.loaded_theme = archive.read(ARC_THEME)  # some writers don't output a theme, live with it (fixes #160)
+        except KeyError:
+            pass
 
-    apply_stylesheet(archive, wb) # bind styles to workbook
+        apply_stylesheet(archive, wb) # bind styles to workbook
 
     wb.excel_base_date = read_excel_base_date(archive)
 
@@ -212,31 +223,37 @@ def load_workbook(filename, read_only=False, use_iterators=False, keep_vba=KEEP_
         if not worksheet_path in valid_files:
             continue
 
-        if read_only:
-            new_ws = ReadOnlyWorksheet(wb, sheet_name, worksheet_path, None,
-                                       shared_strings)
-            wb._add_sheet(new_ws)
-        else:
-            fh = archive.open(worksheet_path)
-            parser = WorkSheetParser(wb, sheet_name, fh, shared_strings)
-            parser.parse()
-            new_ws = wb[sheet_name]
-        new_ws.sheet_state = sheet['state']
+        with phase("worksheet:" + sheet_name):
+            if read_only:
+                new_ws = ReadOnlyWorksheet(wb, sheet_name, worksheet_path, None,
+                                           shared_strings)
+                wb._add_sheet(new_ws)
+            else:
+                fh = archive.open(worksheet_path)
+                parser = WorkSheetParser(wb, sheet_name, fh, shared_strings)
+                parser.parse()
+                new_ws = wb[sheet_name]
+            new_ws.sheet_state = sheet['state']
 
         if not read_only:
         # load comments into the worksheet cells
+            from .comments import read_comments, get_comments_file
             comments_file = get_comments_file(worksheet_path, archive, valid_files)
             if comments_file is not None:
-                read_comments(new_ws, archive.read(comments_file))
+                with phase("comments:" + sheet_name):
+                    read_comments(new_ws, archive.read(comments_file))
 
-    wb._differential_styles = [] # reset
-    wb._named_ranges = list(read_named_ranges(archive.read(ARC_WORKBOOK), wb))
+    wb._differential_styles = IndexedList() # reset
+    with phase("named ranges"):
+        wb._named_ranges = DefinedNameList(
+            read_named_ranges(archive.read(ARC_WORKBOOK), wb))
 
     wb.code_name = read_workbook_code_name(archive.read(ARC_WORKBOOK))
 
     if EXTERNAL_LINK in cts:
-        rels = read_rels(archive)
-        wb._external_links = {book.link_index: book for book in detect_external_links(rels, archive)}
+        with phase("external links"):
+            rels = read_rels(archive)
+            wb._external_links = {book.link_index: book for book in detect_external_links(rels, archive)}
 
 
     archive.close()
@@ -495,11 +495,11 @@ def test_legacy_document_no_keep(WorkSheetParser, datadir):
 
 
 @pytest.fixture
-def Translator():
-    from openpyxl.formula import translate
-    return translate.Translator
+def SharedFormula():
+    from openpyxl.formula.shared import SharedFormula
+    return SharedFormula
 
-def test_shared_formula(WorkSheetParser, Translator):
+def test_shared_formula(WorkSheetParser, SharedFormula):
     parser = WorkSheetParser
     src = """
     <x:c r="A9" t="str" xmlns:x="http://schemas.openxmlformats.org/spreadsheetml/2006/main">
@@ -508,8 +508,10 @@ def test_shared_formula(WorkSheetParser, Translator):
     </x:c>
     """
     element = fromstring(src)
-    parser.shared_formula_masters['0'] = Translator("=A4*B4", "A1")
+    shared = SharedFormula('0', "A1:A9", "=A4*B4", "A1")
+    parser.ws.shared_formulae['0'] = shared
     parser.parse_cell(element)
+    assert parser.ws['A9']._value is shared
     assert parser.ws['A9'].value == "=A12*B12"
 
 
@@ -550,7 +552,7 @@ def test_shared_formulae(WorkSheetParser, datadir):
 
     parser.parse()
 
-    assert set(ws.formula_attributes.keys()) == set(['C10'])
+    assert set(ws.formula_attributes.keys()) == set([(10, 3)])
 
     # Test shared forumlae
     assert ws.cell('B7').data_type == 'f'
@@ -558,8 +560,13 @@ def test_shared_formulae(WorkSheetParser, datadir):
     assert ws.cell('C7').value == '=C4*2'
     assert ws.cell('D7').value == '=D4*2'
     assert ws.cell('E7').value == '=E4*2'
+    shared = ws.shared_formulae['0']
+    assert shared.master == 'B7'
+    assert shared.ref == 'B7:E7'
+    assert ws.cell('E7')._value is shared
 
     # Test array forumlae
     assert ws.cell('C10').data_type == 'f'
     assert ws.formula_attributes['C10']['ref'] == 'C10:C14'
+    assert ws.formula_attributes.find(12, 3) == (10, 3)
     assert ws.cell('C10').value == '=SUM(A10:A14*B10:B14)'
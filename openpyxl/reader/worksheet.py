@@ -25,7 +25,7 @@ from openpyxl.xml.constants import (
 from openpyxl.xml.functions import safe_iterator
 from openpyxl.styles import Color
 from openpyxl.formatting import ConditionalFormatting, Rule
-from openpyxl.formula.translate import Translator
+from openpyxl.formula.shared import SharedFormula
 from openpyxl.worksheet.properties import WorksheetProperties
 from openpyxl.utils import (
     coordinate_from_string,
@@ -73,9 +73,7 @@ class WorkSheetParser(object):
         self.guess_types = wb._guess_types
         self.data_only = wb.data_only
         self.styles = self.ws.parent._cell_styles
-        self.differential_styles = wb._differential_styles
         self.keep_vba = wb.vba_archive is not None
-        self.shared_formula_masters = {}  # {si_str: Translator()}
 
     def parse(self):
         dispatcher = {
@@ -116,6 +114,7 @@ class WorkSheetParser(object):
         data_type = element.get('t', 'n')
         coordinate = element.get('r')
         style_id = element.get('s')
+        row, column = coordinate_to_tuple(coordinate)
         array_formula = False
 
         # assign formula to cell value unless only the data is desired
@@ -131,7 +130,7 @@ class WorkSheetParser(object):
                     array_formula = True
 
                 if formula_type != "shared":
-                    self.ws.formula_attributes[coordinate] = dict(formula.attrib)
+                    self.ws.formula_attributes[(row, column)] = dict(formula.attrib)
 
                 else:
                     si = formula.get('si')  # Shared group index for shared formulas
@@ -167,15 +166,17 @@ class WorkSheetParser(object):
                     # formula in the two "impl. defined" cases and no
                     # formula in the "??" case. This choice of
                     # implementation allows us to disregard the `ref`
-                    # parameter altogether, and does not require
-                    # computing expressions like `C5 in A1:D6`.
-                    # Presumably, Excel does not generate spreadsheets
-                    # with such contradictions.
-                    if si in self.shared_formula_masters:
-                        trans = self.shared_formula_masters[si]
-                        value = trans.translate_formula(coordinate)
-                    else:
-                        self.shared_formula_masters[si] = Translator(value, coordinate)
+                    # parameter when reading: it is only kept so that the
+                    # group can be written back. Presumably, Excel does
+                    # not generate spreadsheets with such contradictions.
+                    #
+                    # The cells of the group hold the group itself, their
+                    # formulae are only translated when asked for.
+                    shared = self.ws.shared_formulae.get(si)
+                    if shared is None:
+                        shared = SharedFormula(si, formula.get('ref'), value, coordinate)
+                        self.ws.shared_formulae[si] = shared
+                    value = shared
 
 
         style_array = None
@@ -183,7 +184,6 @@ class WorkSheetParser(object):
             style_id = int(style_id)
             style_array = self.styles[style_id]
 
-        row, column = coordinate_to_tuple(coordinate)
         cell = Cell(self.ws, row=row, col_idx=column, style_array=style_array, array_formula=array_formula)
         self.ws._cells[(row, column)] = cell
 
@@ -206,7 +206,7 @@ class WorkSheetParser(object):
                 if child is not None:
                     value = child.text
 
-        if self.guess_types or value is None:
+        if self.guess_types and data_type != 'f' or value is None:
             cell.value = value
         else:
             cell._value=value
@@ -272,7 +272,7 @@ class WorkSheetParser(object):
         for node in cfRules:
             rule = Rule.from_tree(node)
             if rule.dxfId is not None:
-                rule.dxf = self.differential_styles[rule.dxfId]
+                rule.dxf = self.ws.parent._differential_styles[rule.dxfId]
             self.ws.conditional_formatting.cf_rules[range_string].append(rule)
 
 
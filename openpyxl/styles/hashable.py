@@ -2,7 +2,6 @@ from __future__ import absolute_import
 # Copyright (c) 2010-2015 openpyxl
 
 
-import inspect
 from openpyxl.compat import unicode, basestring, safe_string, zip
 from openpyxl.descriptors import Descriptor
 from openpyxl.descriptors.serialisable import Serialisable
@@ -19,6 +18,7 @@ class HashableObject(Serialisable):
 
     @property
     def __defaults__(self):
+        import inspect
         spec = inspect.getargspec(self.__class__.__init__)
         return dict(zip(spec.args[1:], spec.defaults))
 
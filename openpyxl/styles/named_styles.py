@@ -1,7 +1,7 @@
 from __future__ import absolute_import
 # Copyright (c) 2010-2015 openpyxl
 
-from openpyxl.compat import safe_string
+from openpyxl.compat import safe_string, basestring
 
 from openpyxl.descriptors import (
     Strict,
@@ -18,7 +18,8 @@ from .fills import PatternFill, Fill
 from .fonts import Font, DEFAULT_FONT
 from .borders import Border
 from .alignment import Alignment
-from .numbers import NumberFormatDescriptor
+from .numbers import NumberFormatDescriptor, BUILTIN_FORMATS_REVERSE
+from .cell_style import StyleArray
 from .protection import Protection
 from .hashable import HashableObject
 
@@ -41,6 +42,8 @@ class NamedStyle(HashableObject):
     __fields__ = ("name", "font", "fill", "border", "number_format",
                   "alignment", "protection")
 
+    _style = None
+
     def __init__(self,
                  name="Normal",
                  font=Font(),
@@ -63,6 +66,13 @@ class NamedStyle(HashableObject):
         self.hidden = hidden
 
 
+    def __setattr__(self, attr, value):
+        super(NamedStyle, self).__setattr__(attr, value)
+        if attr in self.__fields__:
+            # formatting has changed and must be resolved again
+            self.__dict__['_style'] = None
+
+
     def __iter__(self):
         for key in ('name', 'builtinId', 'hidden', 'xfId'):
             value = getattr(self, key, None)
@@ -70,6 +80,122 @@ class NamedStyle(HashableObject):
                 yield key, safe_string(value)
 
 
+    def bind(self, wb):
+        """
+        Add the formatting objects of the style to the workbook collections.
+        The resulting style array is kept until the style is changed.
+        """
+        style = StyleArray()
+        style.fontId = wb._fonts.add(self.font)
+        style.fillId = wb._fills.add(self.fill)
+        style.borderId = wb._borders.add(self.border)
+        style.alignmentId = wb._alignments.add(self.alignment)
+        style.protectionId = wb._protections.add(self.protection)
+        fmt = self.number_format
+        if fmt in BUILTIN_FORMATS_REVERSE:
+            style.numFmtId = BUILTIN_FORMATS_REVERSE[fmt]
+        else:
+            style.numFmtId = wb._number_formats.add(fmt) + 164
+        style.xfId = wb._named_styles.index(self.name)
+        self._style = style
+        return style
+
+
+class NamedStyleList(list):
+    """
+    Named styles of a workbook with lookup by name.
+    The position of a style in the list is its xfId, so styles can be added
+    or replaced but not removed or reordered.
+
+    Styles can be renamed after they have been added, so the index of names
+    is checked against the style found and rebuilt when it is out of date.
+    """
+
+    def __init__(self, iterable=()):
+        self._names = {}
+        self.extend(iterable)
+
+
+    def _reindex(self):
+        self._names = {}
+        for idx, style in enumerate(self):
+            self._names.setdefault(style.name, idx)
+
+
+    def _position(self, name):
+        idx = self._names.get(name)
+        if idx is None or list.__getitem__(self, idx).name != name:
+            self._reindex()
+            idx = self._names[name]
+        return idx
+
+
+    @property
+    def names(self):
+        return [style.name for style in self]
+
+
+    def __contains__(self, name):
+        try:
+            self._position(name)
+        except KeyError:
+            return False
+        return True
+
+
+    def __getitem__(self, key):
+        if isinstance(key, basestring):
+            key = self._position(key)
+        return list.__getitem__(self, key)
+
+
+    def __setitem__(self, key, style):
+        if not isinstance(key, int):
+            raise TypeError("Named styles can only be replaced one at a time")
+        self._check(style, key)
+        list.__setitem__(self, key, style)
+        self._reindex()
+
+
+    def index(self, name):
+        return self._position(name)
+
+
+    def _check(self, style, idx=None):
+        if not isinstance(style, NamedStyle):
+            raise TypeError("""Only NamedStyle instances can be added""")
+        if style.name in self and self.index(style.name) != idx:
+            raise ValueError("""Style {0} exists already""".format(style.name))
+
+
+    def append(self, style):
+        self._check(style)
+        self._names[style.name] = len(self)
+        list.append(self, style)
+
+
+    def extend(self, iterable):
+        for style in iterable:
+            self.append(style)
+
+
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
+
+
+    def __reduce__(self):
+        # copies and pickles are indexed when they are filled
+        return self.__class__, (list(self),)
+
+
+    def _fixed(self, *args, **kw):
+        raise TypeError("Named styles cannot be removed or reordered")
+
+    insert = remove = pop = sort = reverse = _fixed
+    __delitem__ = __imul__ = __setslice__ = __delslice__ = _fixed
+
+
 class NamedCellStyle(Serialisable):
 
     """
@@ -131,13 +257,26 @@ class NamedCellStyleList(Serialisable):
     @property
     def names(self):
         """
-        Convert to NamedStyle objects and remove duplicates
+        Convert to NamedStyle objects ordered by xfId and remove duplicates
         """
-        styles = {}
-        for ns in self.cellStyle:
+        styles = NamedStyleList()
+        for ns in sorted(self.cellStyle, key=lambda ns: ns.xfId):
+            if ns.name in styles:
+                continue
             style = NamedStyle(name=ns.name,
-                                hidden=ns.hidden
-                                )
+                               hidden=ns.hidden,
+                               builtinId=ns.builtinId,
+                               )
             style.xfId = ns.xfId
-            styles[ns.name] = style
+            styles.append(style)
         return styles
+
+
+    @property
+    def positions(self):
+        """
+        Map the xfId of every named style to the position of its name once
+        duplicates have been removed
+        """
+        styles = self.names
+        return dict((ns.xfId, styles.index(ns.name)) for ns in self.cellStyle)
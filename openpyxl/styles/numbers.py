@@ -3,6 +3,7 @@ from __future__ import absolute_import
 
 import re
 
+from openpyxl.compat import lru_cache
 from openpyxl.descriptors import (
     String,
     Sequence,
@@ -95,6 +96,7 @@ FORMAT_CURRENCY_EUR_SIMPLE = '[$EUR ]#,##0.00_-'
 DATE_INDICATORS = 'dmyhs'
 BAD_DATE_RE = re.compile(r'((?<=\[)|").*[dmhys]+.*(\]|")', re.UNICODE)
 
+@lru_cache()
 def is_date_format(fmt):
     if fmt is None:
         return False
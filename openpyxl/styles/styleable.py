@@ -6,9 +6,29 @@ from warnings import warn
 from .numbers import BUILTIN_FORMATS, BUILTIN_FORMATS_REVERSE
 from .proxy import StyleProxy
 from .cell_style import StyleArray
+from .named_styles import NamedStyle
 from . import Style
 
 
+def _get_proxy(wb, collection, idx):
+    """
+    Return a shared proxy for an item in one of the workbook style collections.
+    Proxies are cached per workbook and discarded if the underlying object has
+    been replaced.
+    """
+    coll = getattr(wb, collection)
+    target = coll[idx]
+    try:
+        cache = wb._style_proxies
+    except AttributeError:
+        cache = wb._style_proxies = {}
+    key = (collection, idx)
+    proxy = cache.get(key)
+    if proxy is None or proxy._StyleProxy__target is not target:
+        proxy = cache[key] = StyleProxy(target)
+    return proxy
+
+
 class StyleDescriptor(object):
 
     def __init__(self, collection, key):
@@ -23,11 +43,11 @@ class StyleDescriptor(object):
 
 
     def __get__(self, instance, cls):
-        coll = getattr(instance.parent.parent, self.collection)
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
-        idx =  getattr(instance._style, self.key)
-        return StyleProxy(coll[idx])
+        style = instance._style
+        idx = 0
+        if style is not None:
+            idx = getattr(style, self.key)
+        return _get_proxy(instance.parent.parent, self.collection, idx)
 
 
 class NumberFormatDescriptor(object):
@@ -47,15 +67,44 @@ class NumberFormatDescriptor(object):
 
 
     def __get__(self, instance, cls):
-        if not getattr(instance, "_style"):
-            instance._style = StyleArray()
-        idx = getattr(instance._style, self.key)
+        style = instance._style
+        if style is None:
+            return "General"
+        idx = style.numFmtId
         if idx < 164:
             return BUILTIN_FORMATS.get(idx, "General")
         coll = getattr(instance.parent.parent, self.collection)
         return coll[idx - 164]
 
 
+class NamedStyleDescriptor(object):
+
+    collection = "_named_styles"
+
+    def __set__(self, instance, value):
+        wb = instance.parent.parent
+        coll = getattr(wb, self.collection)
+        if isinstance(value, NamedStyle):
+            if value.name not in coll:
+                wb.add_named_style(value)
+            value = value.name
+        if value not in coll:
+            raise ValueError("{0} is not a known style".format(value))
+        style = coll[value]
+        if style._style is None:
+            style.bind(wb)
+        instance._style = StyleArray(style._style)
+
+
+    def __get__(self, instance, cls):
+        style = instance._style
+        idx = 0
+        if style is not None:
+            idx = style.xfId
+        coll = getattr(instance.parent.parent, self.collection)
+        return coll[idx].name
+
+
 class StyleableObject(object):
     """
     Base class for styleble objects implementing proxy and lookup functions
@@ -67,6 +116,7 @@ class StyleableObject(object):
     number_format = NumberFormatDescriptor()
     protection = StyleDescriptor('_protections', "protectionId")
     alignment = StyleDescriptor('_alignments', "alignmentId")
+    named_style = NamedStyleDescriptor()
 
     __slots__ = ('parent', '_style')
 
@@ -18,7 +18,6 @@ from .fonts import FontList
 from .numbers import (
     NumberFormatList,
     BUILTIN_FORMATS,
-    BUILTIN_FORMATS_REVERSE
 )
 from .alignment import Alignment
 from .protection import Protection
@@ -27,7 +26,7 @@ from .named_styles import (
     NamedStyle,
     NamedCellStyle
 )
-from .cell_style import CellStyleList, CellStyle
+from .cell_style import CellStyleList, CellStyle, StyleArray
 
 
 class Stylesheet(Serialisable):
@@ -91,6 +90,7 @@ class Stylesheet(Serialisable):
         self.alignments = self.cellXfs.alignments
         self.protections = self.cellXfs.prots
         self._normalise_numbers()
+        self._normalise_named_styles()
         self.named_styles =  self._merge_named_styles()
 
 
@@ -107,32 +107,35 @@ class Stylesheet(Serialisable):
         """
         Merge named style names "cellStyles" with their associated styles "cellStyleXfs"
         """
-        named_styles = {}
+        named_styles = self.cellStyles.names
+        if self.cellStyleXfs is None:
+            return named_styles
         custom = self.custom_formats
-        formats = self.number_formats
-        for name, style in self.cellStyles.names.items():
+        for style in named_styles:
             xf = self.cellStyleXfs[style.xfId]
             style.font = self.fonts[xf.fontId]
             style.fill = self.fills[xf.fillId]
             style.border = self.borders[xf.borderId]
             if xf.numFmtId in custom:
-                fmt = custom[xf.numFmtId]
-                style.numFmtId = formats.index(fmt) + 164
+                style.number_format = custom[xf.numFmtId]
+            else:
+                style.number_format = BUILTIN_FORMATS.get(xf.numFmtId, "General")
             if xf.alignment:
                 style.alignment = xf.alignment
             if xf.protection:
                 style.protection = xf.protection
-            named_styles[name] = style
         return named_styles
 
 
     def _split_named_styles(self, wb):
         """
         Convert NamedStyle into separate CellStyle and Xf objects
+        Styles are only resolved against the workbook collections if they
+        have been changed since they were last used.
         """
         names = []
         xfs = []
-        for idx, style in enumerate(wb._named_styles.values()):
+        for idx, style in enumerate(wb._named_styles):
             name = NamedCellStyle(
                 name=style.name,
                 builtinId=style.builtinId,
@@ -141,16 +144,15 @@ class Stylesheet(Serialisable):
             )
             names.append(name)
 
-            xf = CellStyle()
-            xf.fontId =  wb._fonts.add(style.font)
-            xf.borderId = wb._borders.add(style.border)
-            xf.fillId =  wb._fills.add(style.fill)
-            fmt = style.number_format
-            if fmt in BUILTIN_FORMATS_REVERSE:
-                fmt = BUILTIN_FORMATS_REVERSE[fmt]
-            else:
-                fmt = wb._number_formats.add(style.number_format) + 164
-            xf.numFmtId = fmt
+            array = style._style
+            if array is None:
+                array = style.bind(wb)
+            xf = CellStyle(numFmtId=array.numFmtId, fontId=array.fontId,
+                           fillId=array.fillId, borderId=array.borderId)
+            if array.alignmentId:
+                xf.alignment = wb._alignments[array.alignmentId]
+            if array.protectionId:
+                xf.protection = wb._protections[array.protectionId]
             xfs.append(xf)
 
         self.cellStyles.cellStyle = names
@@ -180,32 +182,173 @@ class Stylesheet(Serialisable):
                 style.numFmtId = formats.index(fmt) + 164
 
 
+    def _normalise_named_styles(self):
+        """
+        Point cell styles to the position of their named style once named
+        styles with the same name have been merged
+        """
+        if not self.cellStyles.cellStyle:
+            return
+        positions = self.cellStyles.positions
+        for style in self.cell_styles:
+            style.xfId = positions.get(style.xfId, 0)
+
+
 def apply_stylesheet(archive, wb):
     """
     Add styles to workbook if present
+
+    Only cell formats, number formats and the names of named styles, which
+    are required to read cell values, are loaded immediately. The rest of the stylesheet is converted
+    when one of the workbook style collections is first accessed.
     """
     try:
         src = archive.read(ARC_STYLE)
     except KeyError:
         return wb
     node = fromstring(src)
-    stylesheet = Stylesheet.from_tree(node)
+
+    numFmts = node.find("{%s}numFmts" % SHEET_MAIN_NS)
+    if numFmts is not None:
+        numFmts = NumberFormatList.from_tree(numFmts)
+    cellStyles = node.find("{%s}cellStyles" % SHEET_MAIN_NS)
+    if cellStyles is not None:
+        cellStyles = NamedCellStyleList.from_tree(cellStyles)
+    cellXfs = node.find("{%s}cellXfs" % SHEET_MAIN_NS)
+    if cellXfs is not None:
+        node.remove(cellXfs)
+        cellXfs = CellStyleList.from_tree(cellXfs)
+    stylesheet = Stylesheet(numFmts=numFmts, cellXfs=cellXfs,
+                            cellStyles=cellStyles)
 
     wb._cell_styles = stylesheet.cell_styles
-    wb._named_styles = stylesheet.named_styles
-    wb._borders = IndexedList(stylesheet.borders.border)
-    wb._fonts = IndexedList(stylesheet.fonts.font)
-    wb._fills = IndexedList(stylesheet.fills.fill)
-    wb._differential_styles = IndexedList(stylesheet.dxfs.dxf)
     wb._number_formats = stylesheet.number_formats
     wb._protections = stylesheet.protections
     wb._alignments = stylesheet.alignments
+
+    for attr in DeferredStyles.attrs:
+        wb.__dict__.pop(attr, None)
+    wb._deferred_stylesheet = node
+
+
+def _apply_deferred_styles(wb, node):
+    """
+    Convert the remainder of the stylesheet and bind it to the workbook.
+    Collections which have been assigned in the meantime are kept.
+    """
+    stylesheet = Stylesheet.from_tree(node)
+
+    styles = {
+        '_named_styles': stylesheet.named_styles,
+        '_borders': IndexedList(stylesheet.borders.border),
+        '_fonts': IndexedList(stylesheet.fonts.font),
+        '_fills': IndexedList(stylesheet.fills.fill),
+        '_differential_styles': IndexedList(stylesheet.dxfs.dxf),
+        '_colors': COLOR_INDEX,
+    }
     if stylesheet.colors is not None:
-        wb._colors = stylesheet.colors.index
+        styles['_colors'] = stylesheet.colors.index
+
+    for attr, value in styles.items():
+        wb.__dict__.setdefault(attr, value)
+
+
+class DeferredStyles(object):
+    """
+    Workbook style collections which are only read from the stylesheet
+    of a loaded file when first accessed.
+
+    Assigning the collection shadows the descriptor so that there is no
+    overhead once the styles have been loaded.
+    """
+
+    attrs = ('_named_styles', '_borders', '_fonts', '_fills',
+             '_differential_styles', '_colors')
+
+    def __init__(self, name):
+        self.name = name
+
+
+    def __get__(self, instance, cls):
+        if instance is None:
+            return self
+        node = instance.__dict__.pop('_deferred_stylesheet', None)
+        if node is None:
+            raise AttributeError(self.name)
+        _apply_deferred_styles(instance, node)
+        return instance.__dict__[self.name]
+
+
+def _styleable_objects(wb):
+    """
+    Yield all named styles, cells and dimensions in a workbook which have
+    their own styles
+    """
+    for style in wb._named_styles:
+        if style._style is not None:
+            yield style
+    for ws in wb.worksheets:
+        for obj in ws._cells.values():
+            if obj._style is not None:
+                yield obj
+        for dims in (ws.row_dimensions, ws.column_dimensions):
+            for obj in dims.values():
+                if obj._style is not None:
+                    yield obj
+
+
+def compact_styles(wb):
+    """
+    Remove unused and duplicate formatting objects from a workbook.
+
+    Only objects referenced by named styles, cells and row or column
+    dimensions are kept and the style arrays of these are remapped to the
+    new indices. The first entries of each collection are the defaults
+    Excel expects and are always preserved.
+    """
+    if wb.write_only:
+        # styles have already been written to the worksheets
+        return
+
+    fonts = IndexedList(wb._fonts[:1])
+    fills = IndexedList(wb._fills[:2])
+    borders = IndexedList(wb._borders[:1])
+    alignments = IndexedList(wb._alignments[:1])
+    protections = IndexedList(wb._protections[:1])
+    number_formats = IndexedList()
+
+    remapped = {}
+    for obj in _styleable_objects(wb):
+        style = obj._style
+        key = tuple(style)
+        new = remapped.get(key)
+        if new is None:
+            new = StyleArray(style)
+            new.fontId = fonts.add(wb._fonts[style.fontId])
+            new.fillId = fills.add(wb._fills[style.fillId])
+            new.borderId = borders.add(wb._borders[style.borderId])
+            new.alignmentId = alignments.add(wb._alignments[style.alignmentId])
+            new.protectionId = protections.add(wb._protections[style.protectionId])
+            if style.numFmtId >= 164:
+                fmt = wb._number_formats[style.numFmtId - 164]
+                new.numFmtId = number_formats.add(fmt) + 164
+            remapped[key] = new
+        obj._style = StyleArray(new)
+
+    wb._fonts = fonts
+    wb._fills = fills
+    wb._borders = borders
+    wb._alignments = alignments
+    wb._protections = protections
+    wb._number_formats = number_formats
+    wb._cell_styles = IndexedList([StyleArray()])
 
 
 def write_stylesheet(wb):
     stylesheet = Stylesheet()
+    # named styles may add to the workbook collections
+    stylesheet._split_named_styles(wb)
+
     stylesheet.fonts.font = wb._fonts
     stylesheet.fills.fill = wb._fills
     stylesheet.borders.border = wb._borders
@@ -231,7 +374,6 @@ def write_stylesheet(wb):
         xfs.append(xf)
     stylesheet.cellXfs = CellStyleList(xf=xfs)
 
-    stylesheet._split_named_styles(wb)
     stylesheet.tableStyles = TableStyleList()
 
     tree = stylesheet.to_tree()
@@ -8,6 +8,7 @@ from ..borders import Border
 from ..fills import PatternFill
 from ..alignment import Alignment
 from ..protection import Protection
+from ..cell_style import StyleArray
 
 from openpyxl.xml.functions import fromstring, tostring
 from openpyxl.tests.helper import compare_xml
@@ -141,4 +142,118 @@ class TestNamedCellStyleList:
         """
         node = fromstring(src)
         styles = NamedCellStyleList.from_tree(node)
-        assert set(styles.names) == set(['Normal', 'Hyperlink', 'Followed Hyperlink'])
+        assert styles.names.names == ['Normal', 'Hyperlink', 'Followed Hyperlink']
+        assert styles.positions == {0:0, 1:1, 2:2, 3:1, 4:2, 5:1, 6:2, 7:1,
+                                    8:2, 9:1, 10:2}
+
+
+@pytest.fixture
+def NamedStyleList():
+    from ..named_styles import NamedStyleList
+    return NamedStyleList
+
+
+class TestNamedStyleList:
+
+    def test_append(self, NamedStyleList, NamedStyle):
+        styles = NamedStyleList()
+        style = NamedStyle(name="Heading")
+        styles.append(style)
+        assert "Heading" in styles
+        assert styles["Heading"] is style
+        assert styles[0] is style
+        assert styles.index("Heading") == 0
+
+
+    def test_duplicate(self, NamedStyleList, NamedStyle):
+        styles = NamedStyleList([NamedStyle()])
+        with pytest.raises(ValueError):
+            styles.append(NamedStyle())
+
+
+    def test_invalid(self, NamedStyleList):
+        styles = NamedStyleList()
+        with pytest.raises(TypeError):
+            styles.append("Normal")
+
+
+    def test_slice(self, NamedStyleList, NamedStyle):
+        styles = NamedStyleList([NamedStyle(), NamedStyle(name="Heading")])
+        assert [s.name for s in styles[:1]] == ["Normal"]
+        assert styles[-1].name == "Heading"
+
+
+    def test_extend(self, NamedStyleList, NamedStyle):
+        styles = NamedStyleList()
+        styles.extend([NamedStyle(), NamedStyle(name="Heading")])
+        styles += [NamedStyle(name="Total")]
+        assert styles.index("Total") == 2
+        with pytest.raises(ValueError):
+            styles.extend([NamedStyle(name="Heading")])
+
+
+    def test_replace(self, NamedStyleList, NamedStyle):
+        styles = NamedStyleList([NamedStyle(), NamedStyle(name="Heading")])
+        styles[1] = NamedStyle(name="Title")
+        assert styles.index("Title") == 1
+        assert "Heading" not in styles
+        styles[1] = NamedStyle(name="Title")
+        with pytest.raises(ValueError):
+            styles[1] = NamedStyle()
+        with pytest.raises(TypeError):
+            styles[:1] = [NamedStyle(name="Other")]
+
+
+    @pytest.mark.parametrize("method, args",
+                             [
+                                 ("insert", (0, None)),
+                                 ("remove", (None,)),
+                                 ("pop", ()),
+                                 ("sort", ()),
+                                 ("reverse", ()),
+                                 ("__delitem__", (0,)),
+                             ]
+                             )
+    def test_fixed(self, NamedStyleList, NamedStyle, method, args):
+        styles = NamedStyleList([NamedStyle()])
+        with pytest.raises(TypeError):
+            getattr(styles, method)(*args)
+        assert styles.names == ["Normal"]
+
+
+    def test_rename(self, NamedStyleList, NamedStyle):
+        style = NamedStyle(name="Heading")
+        styles = NamedStyleList([NamedStyle(), style])
+        style.name = "Title"
+        assert "Heading" not in styles
+        assert styles["Title"] is style
+        assert styles.index("Title") == 1
+
+
+    def test_rename_elsewhere(self, NamedStyleList, NamedStyle):
+        styles = NamedStyleList([NamedStyle(), NamedStyle(name="Heading")])
+        styles._reindex = None # any rebuild of the index would fail
+        NamedStyle(name="Other").name = "Renamed"
+        other = NamedStyleList([NamedStyle(name="Heading")])
+        other[0].name = "Title"
+        assert styles.index("Heading") == 1
+
+
+    def test_copy(self, NamedStyleList, NamedStyle):
+        import copy
+        styles = NamedStyleList([NamedStyle(), NamedStyle(name="Heading")])
+        styles = copy.deepcopy(styles)
+        assert styles.index("Heading") == 1
+
+
+def test_bind(NamedStyle):
+    from openpyxl import Workbook
+    wb = Workbook()
+    style = NamedStyle(name="Heading", font=Font(bold=True),
+                       number_format="0.000")
+    wb.add_named_style(style)
+    assert wb.named_styles == ["Normal", "Heading"]
+    assert style._style == StyleArray([1, 0, 0, 164, 0, 0, 0, 0, 1])
+
+    style.font = Font(italic=True)
+    assert style._style is None
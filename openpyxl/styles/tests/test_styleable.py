@@ -75,3 +75,42 @@ def test_assign_style(StyleableObject):
     style = Style(font=Font(underline="single"))
     so.style = style
     assert style.font == Font(underline="single")
+
+
+def test_shared_proxy(StyleableObject):
+    so = StyleableObject(sheet=DummyWorksheet())
+    so.font = Font(italic=True)
+    assert so.font is so.font
+
+
+def test_unstyled_read(StyleableObject):
+    so = StyleableObject(sheet=DummyWorksheet())
+    so.parent.parent._fonts.add(Font())
+    assert so.font == Font()
+    assert so.number_format == "General"
+    assert so._style is None
+
+
+def test_named_style():
+    from openpyxl import Workbook
+    from ..named_styles import NamedStyle
+    wb = Workbook()
+    ws = wb.active
+    cell = ws['A1']
+    assert cell.named_style == "Normal"
+
+    style = NamedStyle(name="Heading", font=Font(bold=True))
+    cell.named_style = style
+    assert cell.named_style == "Heading"
+    assert cell.font == Font(bold=True)
+
+    ws['A2'].named_style = "Heading"
+    assert ws['A2']._style == cell._style
+    assert ws['A2']._style is not cell._style
+
+
+def test_unknown_named_style():
+    from openpyxl import Workbook
+    wb = Workbook()
+    with pytest.raises(ValueError):
+        wb.active['A1'].named_style = "Heading"
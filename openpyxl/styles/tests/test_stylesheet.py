@@ -234,6 +234,34 @@ def test_no_styles():
 
 
 
+def test_deferred_styles(datadir, Stylesheet):
+    from ..stylesheet import apply_stylesheet
+    from zipfile import ZipFile
+    from io import BytesIO
+    from openpyxl.workbook import Workbook
+    from openpyxl.xml.constants import ARC_STYLE
+
+    datadir.chdir()
+    with open("complex-styles.xml") as src:
+        xml = src.read()
+    archive = ZipFile(BytesIO(), "a")
+    archive.writestr(ARC_STYLE, xml)
+    wb = Workbook()
+    apply_stylesheet(archive, wb)
+
+    assert "_fonts" not in wb.__dict__
+    assert "_named_styles" not in wb.__dict__
+    assert len(wb._cell_styles) == 29
+
+    stylesheet = Stylesheet.from_tree(fromstring(xml))
+    assert wb._fonts == stylesheet.fonts.font
+    assert wb._fills == stylesheet.fills.fill
+    assert wb._borders == stylesheet.borders.border
+    assert wb._cell_styles == stylesheet.cell_styles
+    assert len(wb._named_styles) == 3
+    assert "_deferred_stylesheet" not in wb.__dict__
+
+
 def test_write_worksheet(Stylesheet):
     from openpyxl import Workbook
     wb = Workbook()
@@ -315,3 +343,53 @@ def test_simple_styles(datadir):
     xml = tostring(stylesheet)
     diff = compare_xml(xml, expected)
     assert diff is None, diff
+
+
+def test_compact_styles():
+    from openpyxl import Workbook
+    from ..fonts import Font
+    from ..stylesheet import compact_styles
+
+    wb = Workbook()
+    ws = wb.active
+    ws['A1'].font = Font(bold=True)
+    ws['A2'].font = Font(italic=True)
+    ws['A3'].number_format = "0.000"
+    ws['A4'].number_format = "0.0000"
+    ws.row_dimensions[2].font = Font(italic=True)
+    ws['A1'].style_id
+    ws['A2'].style_id
+
+    ws['A1'].font = Font(bold=False)
+    ws['A3'].number_format = "General"
+    assert len(wb._fonts) == 4
+    assert len(wb._number_formats) == 2
+
+    compact_styles(wb)
+
+    assert wb._fonts[1:] == [Font(bold=False), Font(italic=True)]
+    assert wb._number_formats == ["0.0000"]
+    assert ws['A2'].font == Font(italic=True)
+    assert ws['A4'].number_format == "0.0000"
+    assert ws['A4']._style.numFmtId == 164
+    assert ws.row_dimensions[2].font == Font(italic=True)
+    assert len(wb._cell_styles) == 1
+
+
+def test_compact_duplicates():
+    from openpyxl import Workbook
+    from ..fonts import Font
+    from ..stylesheet import compact_styles
+
+    wb = Workbook()
+    ws = wb.active
+    wb._fonts.append(Font(bold=True))
+    list.append(wb._fonts, Font(bold=True))
+    ws['A1']._style = StyleArray([2, 0, 0, 0, 0, 0, 0, 0, 0])
+    ws['A2']._style = StyleArray([1, 0, 0, 0, 0, 0, 0, 0, 0])
+
+    compact_styles(wb)
+
+    assert len(wb._fonts) == 2
+    assert ws['A1']._style == ws['A2']._style
+    assert ws['A1']._style is not ws['A2']._style
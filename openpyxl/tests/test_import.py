@@ -0,0 +1,9 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+
+def test_lazy_subpackages():
+    from openpyxl.benchmarks.import_time import measure, eager
+    seconds, modules = measure()
+    assert "openpyxl.workbook" in modules
+    assert eager(modules) == []
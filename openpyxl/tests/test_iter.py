@@ -214,6 +214,8 @@ def test_read_single_cell_date(sample_workbook, cell, value):
     rows = ws.iter_rows(cell)
     cell = list(rows)[0][0]
     assert cell.value == value
+    if wb.read_only:
+        assert cell._format is wb._number_format_table[cell._style_id]
 
 
 @pytest.mark.parametrize("data_only, expected",
@@ -349,3 +351,34 @@ def test_read_empty_rows(datadir, DummyWorkbook, ReadOnlyWorksheet):
     ws = ReadOnlyWorksheet(DummyWorkbook, "Sheet", "", "empty_rows.xml", [])
     rows = tuple(ws.rows)
     assert len(rows) == 7
+
+
+def test_track_progress():
+    from openpyxl import Workbook
+    wb = Workbook()
+    ws = wb.active
+    for idx in range(25):
+        ws.append([idx, "row {0}".format(idx)])
+    out = BytesIO()
+    wb.save(out)
+
+    ws = load_workbook(out, read_only=True).active
+    reports = []
+    ws.track_progress(reports.append, rows=10)
+    rows = list(ws.rows)
+    assert len(rows) == 25
+    assert [p.rows for p in reports] == [10, 20, 25]
+    assert reports[-1].bytes > 0
+    assert all(p.elapsed >= 0 for p in reports)
+
+    del reports[:]
+    rows = ws.rows
+    for idx, row in zip(range(15), rows):
+        pass
+    rows.close()
+    assert [p.rows for p in reports] == [10, 15]
+
+    ws.track_progress(None)
+    reports = []
+    list(ws.rows)
+    assert reports == []
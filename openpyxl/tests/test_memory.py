@@ -0,0 +1,29 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+The memory used by the streaming modes must not grow with the number of rows
+"""
+
+import pytest
+
+tracemalloc = pytest.importorskip("tracemalloc")
+
+from openpyxl.benchmarks.memory import STREAMING, growth
+
+
+@pytest.mark.parametrize("name, fn", STREAMING)
+def test_bounded_memory(name, fn):
+    small, large = growth(fn, rows=50, factor=20)
+    assert large < small * 1.5, name
+
+
+def test_read_dimension_stops_at_cells():
+    from io import BytesIO
+    from openpyxl.worksheet.read_only import read_dimension
+    rows = "".join('<row r="%d"><c r="A%d"><v>1</v></c></row>' % (idx, idx)
+                   for idx in range(1, 2000)).encode("ascii")
+    # the cells are not parsed so the broken end is never reached
+    src = BytesIO(b'<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+                  b'<sheetData>' + rows + b'<broken></sheetData>')
+    assert read_dimension(src) is None
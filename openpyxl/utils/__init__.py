@@ -7,12 +7,14 @@ Collection of utilities used within the package and also available for client co
 
 import datetime
 import re
+from string import ascii_uppercase
 
 from .formulas import FORMULAE
 from openpyxl.compat import basestring
 from openpyxl.utils.exceptions import CellCoordinatesException
 
 # constants
+DIGITS = "0123456789"
 COORD_RE = re.compile('^[$]?([A-Z]+)[$]?(\d+)$')
 RANGE_EXPR = """
 [$]?(?P<min_col>[A-Z]+)
@@ -36,7 +38,9 @@ def get_column_interval(start, end):
 
 def coordinate_from_string(coord_string):
     """Convert a coordinate string like 'B12' to a tuple ('B', 12)"""
-    match = COORD_RE.match(coord_string.upper())
+    match = COORD_RE.match(coord_string)
+    if match is None:
+        match = COORD_RE.match(coord_string.upper())
     if not match:
         msg = 'Invalid cell coordinates (%s)' % coord_string
         raise CellCoordinatesException(msg)
@@ -83,12 +87,26 @@ def _get_column_letter(col_idx):
     return ''.join(reversed(letters))
 
 
+# filled on first use by _fill_column_caches
 _COL_STRING_CACHE = {}
 _STRING_COL_CACHE = {}
-for i in range(1, 18279):
-    col = _get_column_letter(i)
-    _STRING_COL_CACHE[i] = col
-    _COL_STRING_CACHE[col] = i
+
+
+def _fill_column_caches():
+    """
+    Fill the tables of column letters and indices for A -> ZZZ.
+
+    Columns are listed in order by prefixing the shorter names with every
+    letter, which is much quicker than converting each index in turn. Each
+    table is filled by a single update, so other threads never see one half
+    filled.
+    """
+    letters = list(ascii_uppercase)
+    two = [a + b for a in letters for b in letters]
+    columns = letters + two + [a + b for a in letters for b in two]
+    indices = range(1, len(columns) + 1)
+    _STRING_COL_CACHE.update(zip(indices, columns))
+    _COL_STRING_CACHE.update(zip(columns, indices))
 
 
 def get_column_letter(idx,):
@@ -98,6 +116,9 @@ def get_column_letter(idx,):
     try:
         return _STRING_COL_CACHE[idx]
     except KeyError:
+        if not _STRING_COL_CACHE:
+            _fill_column_caches()
+            return get_column_letter(idx)
         raise ValueError("Invalid column index {0}".format(idx))
 
 
@@ -106,12 +127,43 @@ def column_index_from_string(str_col):
     ('A' -> 1)
     """
     # we use a function argument to get indexed name lookup
+    try:
+        return _COL_STRING_CACHE[str_col]
+    except KeyError:
+        if not _COL_STRING_CACHE:
+            _fill_column_caches()
     try:
         return _COL_STRING_CACHE[str_col.upper()]
     except KeyError:
         raise ValueError("{0} is not a valid column name".format(str_col))
 
 
+def get_column_letters(indices):
+    """Convert a sequence of column indices into a list of column letters
+    ([1, 2, 3] -> ['A', 'B', 'C'])
+    """
+    if not _STRING_COL_CACHE:
+        _fill_column_caches()
+    try:
+        return list(map(_STRING_COL_CACHE.__getitem__, indices))
+    except KeyError as e:
+        raise ValueError("Invalid column index {0}".format(e.args[0]))
+
+
+def column_indices_from_strings(columns):
+    """Convert a sequence of column names into a list of numerical indices
+    (['A', 'b', 'AA'] -> [1, 2, 27])
+    """
+    if not _COL_STRING_CACHE:
+        _fill_column_caches()
+    columns = list(columns)
+    try:
+        return list(map(_COL_STRING_CACHE.__getitem__, columns))
+    except KeyError:
+        # lower case or invalid names
+        return [column_index_from_string(col) for col in columns]
+
+
 def range_boundaries(range_string):
     """
     Convert a range string into a tuple of boundaries:
@@ -159,8 +211,15 @@ def coordinate_to_tuple(coordinate):
     """
     Convert an Excel style coordinate to (row, colum) tuple
     """
+    # plain coordinates such as 'B12' are split without a regex
+    col = coordinate.rstrip(DIGITS)
+    row = coordinate[len(col):]
+    if row and col in _COL_STRING_CACHE:
+        row = int(row)
+        if row:
+            return row, _COL_STRING_CACHE[col]
     col, row = coordinate_from_string(coordinate)
-    return row, _COL_STRING_CACHE[col]
+    return row, column_index_from_string(col)
 
 
 def range_to_tuple(range_string):
@@ -0,0 +1,260 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Opt-in measurement of the phases of loading and saving workbooks.
+
+Phases are only measured while an instrument is active:
+
+    >>> from openpyxl.utils.instrumentation import instrument
+    >>> with instrument(callback) as recorder:
+    ...     wb = load_workbook("sample.xlsx")
+    >>> for phase in recorder.phases:
+    ...     print(phase.name, phase.wall, phase.cpu, phase.allocated)
+
+The callback, if any, is called with every phase as it ends, for instance to
+pass the measurements on to a metrics system. Allocated bytes are only
+measured when `tracemalloc` is tracing, otherwise they are None.
+
+The streaming worksheets can also report their progress while rows are read
+or written, see `ProgressMeter`.
+"""
+
+from collections import namedtuple
+from contextlib import contextmanager
+import threading
+import time
+
+try:
+    cpu_time = time.process_time
+except AttributeError: # Python < 3.3
+    cpu_time = time.clock
+
+
+Phase = namedtuple("Phase", "name wall cpu allocated")
+Phase.__doc__ = """
+The measurements of a phase: wall and CPU time in seconds, and the net bytes
+allocated by Python during the phase or None
+"""
+
+
+_local = threading.local()
+
+
+def _tracemalloc():
+    """
+    Return the tracemalloc module, which is only imported when measuring
+    """
+    try:
+        import tracemalloc
+    except ImportError: # Python < 3.4
+        return None
+    return tracemalloc
+
+
+class Recorder(object):
+
+    """
+    Collect the phases measured while it is active.
+    """
+
+    def __init__(self, callback=None, memory=False):
+        self.callback = callback
+        self.memory = memory
+        self.phases = []
+
+
+    def record(self, phase):
+        self.phases.append(phase)
+        if self.callback is not None:
+            self.callback(phase)
+
+
+    def totals(self):
+        """
+        Return the wall time, CPU time and allocated bytes of all phases by
+        phase name.
+        """
+        totals = {}
+        for phase in self.phases:
+            wall, cpu, allocated = totals.get(phase.name, (0, 0, None))
+            if phase.allocated is not None:
+                allocated = (allocated or 0) + phase.allocated
+            totals[phase.name] = (wall + phase.wall, cpu + phase.cpu, allocated)
+        return totals
+
+
+def _recorders():
+    recorders = getattr(_local, "recorders", None)
+    if recorders is None:
+        recorders = _local.recorders = []
+    return recorders
+
+
+@contextmanager
+def instrument(callback=None, memory=False):
+    """
+    Measure the phases of the workbooks loaded or saved in this thread
+    within the block. With `memory`, tracemalloc is started for the block if
+    it is not tracing already.
+    """
+    recorder = Recorder(callback, memory)
+    started = False
+    tracemalloc = _tracemalloc()
+    if memory and tracemalloc is not None and not tracemalloc.is_tracing():
+        tracemalloc.start()
+        started = True
+    recorders = _recorders()
+    recorders.append(recorder)
+    try:
+        yield recorder
+    finally:
+        recorders.remove(recorder)
+        if started:
+            tracemalloc.stop()
+
+
+@contextmanager
+def _measure(name, recorders):
+    tracemalloc = _tracemalloc()
+    tracing = tracemalloc is not None and tracemalloc.is_tracing()
+    if tracing:
+        memory = tracemalloc.get_traced_memory()[0]
+    wall = time.time()
+    cpu = cpu_time()
+    try:
+        yield
+    finally:
+        cpu = cpu_time() - cpu
+        wall = time.time() - wall
+        allocated = None
+        if tracing and tracemalloc.is_tracing():
+            allocated = tracemalloc.get_traced_memory()[0] - memory
+        phase = Phase(name, wall, cpu, allocated)
+        for recorder in recorders:
+            recorder.record(phase)
+
+
+class _NoPhase(object):
+
+    def __enter__(self):
+        pass
+
+    def __exit__(self, *args):
+        pass
+
+_NO_PHASE = _NoPhase()
+
+
+def phase(name):
+    """
+    Return a context manager which measures a phase if an instrument is
+    active and does nothing otherwise.
+    """
+    recorders = getattr(_local, "recorders", None)
+    if not recorders:
+        return _NO_PHASE
+    return _measure(name, list(recorders))
+
+
+Progress = namedtuple("Progress", "rows bytes elapsed")
+Progress.__doc__ = """
+The progress of reading or writing a streaming worksheet: the rows read or
+written, the bytes of XML read or written and the time in seconds since the
+start
+"""
+
+INFINITY = float("inf")
+
+
+class ProgressMeter(object):
+
+    """
+    Call `callback` with the Progress of a worksheet every `rows` rows or
+    `bytes` bytes, whichever comes first.
+
+    The worksheet calls `update` with the number of rows whenever it reaches
+    `due`, so that it only compares two integers per row otherwise. Bytes
+    are obtained from `measure` every `poll` rows when a number of bytes is
+    set.
+    """
+
+    poll = 1000
+
+    def __init__(self, callback, rows=10000, bytes=None, measure=None):
+        self.callback = callback
+        self.rows = rows
+        self.bytes = bytes
+        self.measure = measure
+        self.start = time.time()
+        self.reported = 0
+        self._next_rows = rows or INFINITY
+        self._next_bytes = bytes or INFINITY
+        self.due = self._due(0)
+
+
+    def _due(self, rows):
+        if self.bytes and self.measure is not None:
+            return min(self._next_rows, rows + self.poll)
+        return self._next_rows
+
+
+    def processed(self):
+        if self.measure is None:
+            return None
+        return self.measure()
+
+
+    def update(self, rows):
+        size = self.processed()
+        if (rows >= self._next_rows
+            or size is not None and size >= self._next_bytes):
+            self.report(rows, size)
+        self.due = self._due(rows)
+
+
+    def report(self, rows, size=None):
+        if size is None:
+            size = self.processed()
+        self.callback(Progress(rows, size, time.time() - self.start))
+        self.reported = rows
+        if self.rows:
+            self._next_rows = rows + self.rows
+        if self.bytes and size is not None:
+            self._next_bytes = size + self.bytes
+
+
+    def finish(self, rows):
+        """
+        Report the rows since the last report
+        """
+        if rows > self.reported:
+            self.report(rows)
+
+
+class _NoProgress(object):
+
+    due = INFINITY
+
+_NO_PROGRESS = _NoProgress()
+
+
+class CountingReader(object):
+
+    """
+    File-like object counting the bytes read from another one
+    """
+
+    def __init__(self, src):
+        self.src = src
+        self.count = 0
+
+
+    def read(self, size=-1):
+        data = self.src.read(size)
+        self.count += len(data)
+        return data
+
+
+    def close(self):
+        self.src.close()
@@ -0,0 +1,190 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Low-overhead sampling profiler for loading and saving workbooks.
+
+A background thread looks at the stack of the thread loading or saving a
+workbook at regular intervals and counts the stacks seen, from the outermost
+openpyxl frame inwards. Nothing is traced between samples so the work
+measured runs at nearly full speed.
+
+Sampling is enabled for every load and save by the environment variable
+`OPENPYXL_PROFILE`, or for the saves of a workbook by its `profile`
+attribute, set to the name of a file. The stacks are appended to the file in
+the folded format read by flamegraph.pl and similar tools:
+
+    save;openpyxl.writer.excel:save;openpyxl.writer.excel:write_data 12
+
+`OPENPYXL_PROFILE_INTERVAL` sets the interval between samples in seconds.
+"""
+
+from contextlib import contextmanager
+from functools import wraps
+import os
+import sys
+import threading
+
+from openpyxl.utils.instrumentation import _NO_PHASE
+
+PROFILE_ENV = "OPENPYXL_PROFILE"
+INTERVAL_ENV = "OPENPYXL_PROFILE_INTERVAL"
+INTERVAL = 0.01
+
+
+class Sampler(object):
+
+    """
+    Count the stacks of a thread, by default the current one, every
+    `interval` seconds while it is running.
+    """
+
+    def __init__(self, interval=INTERVAL, thread_id=None):
+        self.interval = interval
+        if thread_id is None:
+            thread_id = threading.current_thread().ident
+        self.thread_id = thread_id
+        self.samples = {}
+        self._stopped = threading.Event()
+        self._thread = None
+
+
+    def start(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._run,
+                                        name="openpyxl-sampler")
+        self._thread.daemon = True
+        self._thread.start()
+
+
+    def stop(self):
+        self._stopped.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+    def __enter__(self):
+        self.start()
+        return self
+
+
+    def __exit__(self, *args):
+        self.stop()
+
+
+    def _run(self):
+        while not self._stopped.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            stack = self._stack(frame)
+            del frame
+            if stack:
+                self.samples[stack] = self.samples.get(stack, 0) + 1
+
+
+    @staticmethod
+    def _stack(frame):
+        """
+        Return the frames of a stack as (module, function) from the outermost
+        openpyxl frame inwards. Frames of this module are left out.
+        """
+        stack = []
+        outermost = 0
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "?")
+            if module != __name__:
+                stack.append((module, frame.f_code.co_name))
+                if module.startswith("openpyxl"):
+                    outermost = len(stack)
+            frame = frame.f_back
+        del stack[outermost:]
+        stack.reverse()
+        return tuple(stack)
+
+
+    def folded(self, root=None):
+        """
+        Return the stacks as lines of the folded format, with an optional
+        root frame
+        """
+        lines = []
+        for stack, count in sorted(self.samples.items()):
+            names = ["{0}:{1}".format(module, fn) for module, fn in stack]
+            if root is not None:
+                names.insert(0, root)
+            lines.append("{0} {1}".format(";".join(names), count))
+        return lines
+
+
+    def subsystems(self, depth=1):
+        """
+        Return the number of samples by the openpyxl package in which they
+        were taken, eg. 'reader', 'styles' or 'xml' or, with a `depth` of 2,
+        'reader.worksheet'. Time spent in other libraries is counted for the
+        openpyxl package which called them.
+        """
+        totals = {}
+        for stack, count in self.samples.items():
+            for module, fn in reversed(stack):
+                if module.startswith("openpyxl."):
+                    name = ".".join(module.split(".")[1:depth + 1])
+                    break
+            else:
+                name = "openpyxl"
+            totals[name] = totals.get(name, 0) + count
+        return totals
+
+
+def _interval():
+    try:
+        return float(os.environ.get(INTERVAL_ENV, INTERVAL))
+    except ValueError:
+        return INTERVAL
+
+
+@contextmanager
+def profile(filename, operation, interval=None):
+    """
+    Sample the current thread within the block and append the stacks to
+    `filename`, under a root frame named after the operation
+    """
+    if interval is None:
+        interval = _interval()
+    sampler = Sampler(interval)
+    sampler.start()
+    try:
+        yield sampler
+    finally:
+        sampler.stop()
+        lines = sampler.folded(operation)
+        with open(filename, "a") as out:
+            for line in lines:
+                out.write(line + "\n")
+
+
+def sampling(operation, filename=None):
+    """
+    Return a context manager which samples the block into `filename` or the
+    file named by the environment if either is set, and does nothing
+    otherwise
+    """
+    filename = filename or os.environ.get(PROFILE_ENV)
+    if not filename:
+        return _NO_PHASE
+    return profile(filename, operation)
+
+
+def profiled(operation):
+    """
+    Decorate a function to be sampled when profiling is enabled by the
+    environment
+    """
+    def decorator(fn):
+        @wraps(fn)
+        def wrapper(*args, **kw):
+            with sampling(operation):
+                return fn(*args, **kw)
+        return wrapper
+    return decorator
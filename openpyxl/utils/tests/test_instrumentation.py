@@ -0,0 +1,105 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+from io import BytesIO
+
+import pytest
+
+
+@pytest.fixture
+def instrument():
+    from ..instrumentation import instrument
+    return instrument
+
+
+def test_inactive():
+    from ..instrumentation import phase, _NO_PHASE
+    assert phase("anything") is _NO_PHASE
+
+
+def test_phase(instrument):
+    from ..instrumentation import phase
+    seen = []
+    with instrument(seen.append) as recorder:
+        with phase("first"):
+            pass
+        with phase("second"):
+            [0] * 1000
+    names = [p.name for p in recorder.phases]
+    assert names == ["first", "second"]
+    assert seen == recorder.phases
+    assert all(p.wall >= 0 and p.cpu >= 0 for p in seen)
+    assert recorder.totals()["first"][0] == seen[0].wall
+
+
+def test_memory(instrument):
+    pytest.importorskip("tracemalloc")
+    from ..instrumentation import phase
+    with instrument(memory=True) as recorder:
+        with phase("allocate"):
+            data = [object() for i in range(1000)]
+    assert len(data) == 1000
+    assert recorder.phases[0].allocated > 0
+
+
+def test_load_save(instrument):
+    from openpyxl import Workbook, load_workbook
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    ws['A1'] = "text"
+    out = BytesIO()
+    with instrument() as recorder:
+        wb.save(out)
+        load_workbook(out)
+    names = [p.name for p in recorder.phases]
+    assert names == [
+        "charts", "images", "worksheet:Data", "chartsheets", "shared strings",
+        "styles",
+        "archive", "workbook", "shared strings", "styles", "worksheet:Data",
+        "named ranges",
+    ]
+
+
+class TestProgressMeter:
+
+    def test_rows(self):
+        from ..instrumentation import ProgressMeter
+        reports = []
+        meter = ProgressMeter(reports.append, rows=100)
+        for rows in range(1, 251):
+            if rows >= meter.due:
+                meter.update(rows)
+        meter.finish(250)
+        assert [p.rows for p in reports] == [100, 200, 250]
+        assert reports[0].bytes is None
+
+
+    def test_bytes(self):
+        from ..instrumentation import ProgressMeter
+        reports = []
+        meter = ProgressMeter(reports.append, rows=None, bytes=4000,
+                              measure=lambda: rows * 3)
+        for rows in range(1, 5001):
+            if rows >= meter.due:
+                meter.update(rows)
+        # bytes are measured every 1000 rows
+        assert [p.rows for p in reports] == [2000, 4000]
+        assert [p.bytes for p in reports] == [6000, 12000]
+
+
+    def test_finish_reported(self):
+        from ..instrumentation import ProgressMeter
+        reports = []
+        meter = ProgressMeter(reports.append, rows=10)
+        meter.update(10)
+        meter.finish(10)
+        assert len(reports) == 1
+
+
+def test_counting_reader():
+    from ..instrumentation import CountingReader
+    src = CountingReader(BytesIO(b"0123456789"))
+    assert src.read(4) == b"0123"
+    src.read()
+    assert src.count == 10
@@ -0,0 +1,86 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+from io import BytesIO
+import time
+
+import pytest
+
+
+@pytest.fixture
+def Sampler():
+    from ..sampler import Sampler
+    return Sampler
+
+
+def busy(seconds):
+    from openpyxl.utils import get_column_letter
+    end = time.time() + seconds
+    while time.time() < end:
+        for idx in range(1, 100):
+            get_column_letter(idx)
+
+
+def test_sample(Sampler):
+    with Sampler(interval=0.001) as sampler:
+        busy(0.1)
+    assert sampler.samples
+    for stack in sampler.samples:
+        module, fn = stack[0]
+        assert module.startswith("openpyxl")
+    assert "utils" in sampler.subsystems()
+    assert all(k.startswith("utils") for k in sampler.subsystems(depth=2))
+
+
+def test_folded(Sampler):
+    sampler = Sampler()
+    sampler.samples = {
+        (("openpyxl.writer.excel", "save"), ("zipfile", "write")): 3,
+        (("openpyxl.writer.excel", "save"),): 1,
+    }
+    assert sampler.folded("save") == [
+        "save;openpyxl.writer.excel:save 1",
+        "save;openpyxl.writer.excel:save;zipfile:write 3",
+    ]
+    assert sampler.subsystems() == {'writer': 4}
+
+
+def test_inactive(monkeypatch):
+    from ..sampler import sampling, PROFILE_ENV
+    from ..instrumentation import _NO_PHASE
+    monkeypatch.delenv(PROFILE_ENV, raising=False)
+    assert sampling("load") is _NO_PHASE
+
+
+def test_environment(monkeypatch, tmpdir):
+    from openpyxl import Workbook, load_workbook
+    from ..sampler import PROFILE_ENV, INTERVAL_ENV
+    filename = str(tmpdir.join("profile.folded"))
+    monkeypatch.setenv(PROFILE_ENV, filename)
+    monkeypatch.setenv(INTERVAL_ENV, "0.0005")
+    wb = Workbook()
+    ws = wb.active
+    for row in range(200):
+        ws.append(range(20))
+    out = BytesIO()
+    wb.save(out)
+    load_workbook(out)
+    with open(filename) as src:
+        lines = src.read().splitlines()
+    roots = set(line.split(";")[0] for line in lines)
+    assert roots == set(["save", "load"])
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert int(count) > 0
+
+
+def test_workbook_flag(monkeypatch, tmpdir):
+    from openpyxl import Workbook
+    from openpyxl.writer.excel import save_virtual_workbook
+    from ..sampler import PROFILE_ENV
+    monkeypatch.delenv(PROFILE_ENV, raising=False)
+    filename = tmpdir.join("save.folded")
+    wb = Workbook()
+    wb.profile = str(filename)
+    save_virtual_workbook(wb)
+    assert filename.check()
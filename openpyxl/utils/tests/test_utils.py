@@ -90,9 +90,60 @@ def test_column_letter(value, expected):
     assert get_column_letter(value) == expected
 
 
-def test_coordinate_tuple():
+def test_column_tables():
+    from .. import _get_column_letter
+    for idx in range(1, 18279):
+        column = _get_column_letter(idx)
+        assert get_column_letter(idx) == column
+        assert column_index_from_string(column) == idx
+
+
+def test_column_letters():
+    from .. import get_column_letters
+    assert get_column_letters(range(1, 4)) == ['A', 'B', 'C']
+    assert get_column_letters([27, 18278]) == ['AA', 'ZZZ']
+    assert get_column_letters([]) == []
+
+
+@pytest.mark.parametrize("indices", ([0], [1, 18279], ['A']))
+def test_bad_column_letters(indices):
+    from .. import get_column_letters
+    with pytest.raises(ValueError):
+        get_column_letters(indices)
+
+
+def test_column_indices():
+    from .. import column_indices_from_strings
+    assert column_indices_from_strings(['A', 'AA', 'ZZZ']) == [1, 27, 18278]
+    assert column_indices_from_strings(c for c in ['a', 'Jj']) == [1, 270]
+
+
+@pytest.mark.parametrize("columns", (['A', 'JJJJ'], ['']))
+def test_bad_column_indices(columns):
+    from .. import column_indices_from_strings
+    with pytest.raises(ValueError):
+        column_indices_from_strings(columns)
+
+
+@pytest.mark.parametrize("coordinate, expected",
+                         [
+                             ("D15", (15, 4)),
+                             ("d15", (15, 4)),
+                             ("$AA$3", (3, 27)),
+                             ("XFD1048576", (1048576, 16384)),
+                         ]
+                         )
+def test_coordinate_tuple(coordinate, expected):
     from .. import coordinate_to_tuple
-    assert coordinate_to_tuple("D15") == (15, 4)
+    assert coordinate_to_tuple(coordinate) == expected
+
+
+@pytest.mark.parametrize("coordinate", ("A0", "A", "15", "A1B"))
+def test_invalid_coordinate_tuple(coordinate):
+    from .. import coordinate_to_tuple
+    from ..exceptions import CellCoordinatesException
+    with pytest.raises(CellCoordinatesException):
+        coordinate_to_tuple(coordinate)
 
 
 
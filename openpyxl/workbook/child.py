@@ -88,4 +88,12 @@ class _WorkbookChild(object):
         if len(value) > 31:
             raise ValueError('Maximum 31 characters allowed in sheet title')
 
+        renamed = self.__title and self.__title != value
         self.__title = value
+        if getattr(self.__parent, "_name_index", None) is not None:
+            # names are indexed by worksheet title
+            self.__parent.names_changed()
+        evaluator = getattr(self.__parent, "evaluator", None)
+        if renamed and evaluator is not None:
+            # so are the formulae and results of the evaluator
+            evaluator.reset()
@@ -13,6 +13,7 @@ from openpyxl.compat import unicode
 from openpyxl.utils.exceptions import NamedRangeException
 from openpyxl.xml.functions import fromstring, safe_iterator
 from openpyxl.xml.constants import SHEET_MAIN_NS
+from openpyxl.formula.graph import reference_boundaries
 
 # constants
 NAMED_RANGE_RE = re.compile("""
@@ -27,9 +28,34 @@ FORMULA_REGEX = re.compile(r"^[a-zA-Z]+[(]+.*[)]$")
 DISCARDED_RANGES = re.compile("^_xlnm\.")
 
 
+class _Edited(object):
+    """
+    Attribute of a defined name which tells the list of names holding it
+    that it has changed
+    """
+
+    def __init__(self, slot):
+        self.slot = slot
+
+    def __get__(self, instance, cls):
+        if instance is None:
+            return self
+        return getattr(instance, self.slot)
+
+    def __set__(self, instance, value):
+        setattr(instance, self.slot, value)
+        names = getattr(instance, '_names', None)
+        if names is not None:
+            names._edits += 1
+
+
 class NamedValue(object):
     """A named value"""
-    __slots__ = ('name', 'value', 'scope')
+    __slots__ = ('_name', '_value', '_scope', '_names')
+
+    name = _Edited('_name')
+    value = _Edited('_value')
+    scope = _Edited('_scope')
 
     def __init__(self, name, value):
         self.name = name
@@ -59,7 +85,9 @@ class NamedRange(NamedValue):
 
     Scope is a worksheet object or None for workbook scope names (the default)
     """
-    __slots__ = ('name', 'destinations', 'scope')
+    __slots__ = ('_destinations',)
+
+    destinations = _Edited('_destinations')
 
     str_format = unicode('%s!%s')
     repr_format = unicode('<%s "%s">')
@@ -84,6 +112,174 @@ class NamedRange(NamedValue):
         return  self.repr_format % (self.__class__.__name__, str(self))
 
 
+class DefinedNameList(list):
+    """
+    List of the defined names of a workbook which counts the changes to
+    itself and to the names it holds, so that indices of the names can tell
+    when they are out of date.
+
+    Changes made in place to the list of destinations of a named range are
+    not counted: call `Workbook.names_changed` after them.
+    """
+
+    _edits = 0
+
+    def __init__(self, iterable=()):
+        list.__init__(self)
+        self.extend(iterable)
+
+
+    def _hold(self, names):
+        self._edits += 1
+        for named_range in names:
+            named_range._names = self
+        return names
+
+
+    def append(self, named_range):
+        list.append(self, self._hold([named_range])[0])
+
+
+    def extend(self, iterable):
+        list.extend(self, self._hold(list(iterable)))
+
+
+    def insert(self, idx, named_range):
+        list.insert(self, idx, self._hold([named_range])[0])
+
+
+    def __setitem__(self, key, value):
+        if isinstance(key, slice):
+            value = self._hold(list(value))
+        else:
+            value = self._hold([value])[0]
+        list.__setitem__(self, key, value)
+
+
+    def __iadd__(self, iterable):
+        self.extend(iterable)
+        return self
+
+
+    def remove(self, named_range):
+        self._edits += 1
+        list.remove(self, named_range)
+
+
+    def pop(self, idx=-1):
+        self._edits += 1
+        return list.pop(self, idx)
+
+
+    def __delitem__(self, key):
+        self._edits += 1
+        list.__delitem__(self, key)
+
+
+    def sort(self, *args, **kw):
+        self._edits += 1
+        list.sort(self, *args, **kw)
+
+
+    def reverse(self):
+        self._edits += 1
+        list.reverse(self)
+
+
+    def __imul__(self, count):
+        self._edits += 1
+        return list.__imul__(self, count)
+
+
+    def __setslice__(self, i, j, iterable): # Python 2
+        self.__setitem__(slice(i, j), iterable)
+
+
+    def __delslice__(self, i, j): # Python 2
+        self.__delitem__(slice(i, j))
+
+
+class NameIndex(object):
+
+    """
+    Lookup of the defined names of a workbook.
+
+    Names are indexed by name, case-insensitively, and scope, and the
+    destinations of named ranges are parsed into (title, boundaries) once.
+    The index is a snapshot: it is out of date once a defined name or the
+    list of names of the workbook has been changed, and the workbook
+    discards it when worksheets are renamed. Only the names of the workbook
+    are checked, so changes to other workbooks leave it current.
+    """
+
+    def __init__(self, workbook):
+        self._names = workbook._named_ranges
+        self._edits = getattr(self._names, '_edits', None)
+        self._first = {} # {name: first defined name}
+        self._scoped = {} # {(NAME, worksheet title or None): defined name}
+        self._destinations = {} # {(NAME, worksheet title or None): [(title, boundaries)]}
+        sheets = workbook.worksheets
+        for named_range in self._names:
+            self._first.setdefault(named_range.name, named_range)
+            scope = named_range.scope
+            if scope is not None and not hasattr(scope, "title"):
+                try:
+                    scope = sheets[int(scope)]
+                except (ValueError, IndexError):
+                    continue
+            if scope is not None:
+                scope = scope.title
+            key = (named_range.name.upper(), scope)
+            self._scoped.setdefault(key, named_range)
+
+
+    def is_current(self, workbook):
+        """
+        Whether names have been changed since the index was built.
+        """
+        names = workbook._named_ranges
+        return (names is self._names and self._edits is not None
+                and getattr(names, '_edits', None) == self._edits)
+
+
+    def get(self, name):
+        """
+        Return the first defined name called `name`, None if there is none.
+        """
+        return self._first.get(name)
+
+
+    def lookup(self, name, title=None):
+        """
+        Return the defined name `name` as seen from the worksheet `title`:
+        names scoped to the worksheet take precedence over workbook names.
+        """
+        key = name.upper()
+        if title is not None:
+            named_range = self._scoped.get((key, title))
+            if named_range is not None:
+                return named_range
+        return self._scoped.get((key, None))
+
+
+    def destinations(self, name, title=None):
+        """
+        Return the destinations of a named range as a list of
+        (title, boundaries), an empty list for names which are not ranges.
+        """
+        key = (name.upper(), title)
+        refs = self._destinations.get(key)
+        if refs is None:
+            refs = []
+            named_range = self.lookup(name, title)
+            for ws, xlrange in getattr(named_range, "destinations", ()):
+                boundaries = reference_boundaries(xlrange)
+                if boundaries is not None:
+                    refs.append((ws.title, boundaries))
+            self._destinations[key] = refs
+        return refs
+
+
 def split_named_range(range_string):
     """Separate a named range into its component parts"""
 
@@ -293,3 +293,100 @@ def test_discarded_ranges(value, result):
     from ..named_range import DISCARDED_RANGES
     m = DISCARDED_RANGES.match(value) is not None
     assert m is result
+
+
+class TestNameIndex:
+
+    @pytest.fixture
+    def wb(self, Workbook):
+        wb = Workbook()
+        ws = wb.active
+        ws.title = "Data"
+        other = wb.create_sheet(title="Other")
+        wb.create_named_range("rates", ws, "$A$1:$A$5")
+        wb.create_named_range("rates", other, "$B$2", scope=other)
+        wb.create_named_range("columns", ws, "$C:$D", scope=1)
+        return wb
+
+
+    def test_lookup(self, wb):
+        index = wb.name_index
+        assert index.get("rates").destinations[0][1] == "$A$1:$A$5"
+        assert index.get("RATES") is None
+        assert index.lookup("RATES").scope is None
+        assert index.lookup("rates", "Other").scope is wb["Other"]
+        assert index.lookup("columns") is None
+        assert index.lookup("columns", "Other").name == "columns"
+
+
+    def test_destinations(self, wb):
+        index = wb.name_index
+        assert index.destinations("rates") == [("Data", (1, 1, 1, 5))]
+        assert index.destinations("rates", "Other") == [("Other", (2, 2, 2, 2))]
+        assert index.destinations("columns", "Other") == [("Data", (3, 1, 4, 1048576))]
+        assert index.destinations("missing") == []
+
+
+    def test_invalidate(self, wb):
+        index = wb.name_index
+        assert wb.name_index is index
+        wb["Other"].title = "Renamed"
+        assert wb.name_index is not index
+        assert wb.name_index.destinations("rates", "Renamed") == [("Renamed", (2, 2, 2, 2))]
+        wb.remove_named_range(wb.get_named_range("rates"))
+        assert wb.name_index.lookup("rates", "Data") is None
+        wb._named_ranges.append(NamedRange("extra", [(wb["Data"], "$A$1")]))
+        assert wb.get_named_range("extra") is not None
+
+
+    def test_edited(self, wb):
+        index = wb.name_index
+        named_range = wb.get_named_range("rates")
+        named_range.destinations = [(wb["Data"], "$B$1")]
+        assert wb.name_index is not index
+        assert wb.name_index.destinations("rates") == [("Data", (2, 1, 2, 1))]
+        named_range.scope = wb["Data"]
+        assert wb.name_index.lookup("rates") is None
+        named_range.name = "prices"
+        assert wb.name_index.lookup("prices", "Data") is named_range
+
+
+    def test_other_workbook(self, wb):
+        from openpyxl import Workbook
+        index = wb.name_index
+        other = Workbook()
+        other.create_named_range("rates", other.active, "$A$1")
+        other.get_named_range("rates").name = "prices"
+        assert wb.name_index is index
+
+
+    def test_list_edited(self, wb):
+        names = wb._named_ranges
+        name = lambda n: n.name
+        for method, args, kw in [("sort", (), {"key": name}),
+                                 ("reverse", (), {}),
+                                 ("__setitem__", (0, names[0]), {}),
+                                 ("insert", (0, names[0]), {}),
+                                 ("pop", (0,), {})]:
+            index = wb.name_index
+            getattr(names, method)(*args, **kw)
+            assert wb.name_index is not index
+        assert all(n._names is names for n in names)
+
+
+    def test_swapped(self, wb):
+        wb.name_index
+        wb.remove_named_range(wb.get_named_range("columns"))
+        wb.create_named_range("totals", wb["Data"], "$E$1")
+        assert wb.name_index.lookup("columns", "Other") is None
+        assert wb.name_index.destinations("totals") == [("Data", (5, 1, 5, 1))]
+
+
+    def test_whole_columns(self, wb):
+        ws = wb["Other"]
+        ws['D3'] = 1
+        wb.create_named_range("whole", ws, "$C:$D")
+        cells = ws.get_named_range("whole")
+        assert [c.coordinate for c in cells] == ["C1", "D1", "C2", "D2",
+                                                 "C3", "D3"]
+        assert ws.max_row == 3
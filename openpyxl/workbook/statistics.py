@@ -0,0 +1,144 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+"""
+Counts of the objects held by a workbook and estimates of their size.
+
+Sizes are estimated from `sys.getsizeof` of the objects and of their values
+one level down; they leave out objects shared with the rest of the program
+and the overhead of the allocator, so they are a lower bound which is
+suitable for comparing workbooks rather than an exact measure.
+"""
+
+import sys
+from itertools import islice
+
+from openpyxl.compat import itervalues
+from openpyxl.formula.shared import SharedFormula
+
+STYLE_TABLES = ('_fonts', '_fills', '_borders', '_alignments', '_protections',
+                '_number_formats', '_cell_styles', '_named_styles',
+                '_differential_styles')
+
+SAMPLE = 10000 # cells looked at per worksheet
+
+
+def _estimate(obj):
+    """
+    Estimate the size of an object and of the values of its attributes
+    """
+    size = sys.getsizeof(obj)
+    attrs = getattr(obj, "__dict__", None)
+    if attrs:
+        size += sys.getsizeof(attrs)
+        for value in attrs.values():
+            size += sys.getsizeof(value)
+    return size
+
+
+def worksheet_statistics(ws, sample=SAMPLE):
+    """
+    Return the counts of cells, styled cells, formulae, comments,
+    hyperlinks and merged ranges of a worksheet, and the estimated bytes of
+    its cells. Read-only and write-only worksheets keep no cells.
+
+    The counts of cells, comments, hyperlinks and merged ranges are the sizes
+    of the collections which hold them. Styled cells, formulae and bytes are
+    counted for up to `sample` cells spread over the worksheet and scaled to
+    all of them; with `sample` None every cell is counted.
+    """
+    cells = getattr(ws, "_cells", {})
+    count = len(cells)
+    step = 1
+    if sample is not None and count > sample:
+        step = count // sample
+    styled = formulae = 0
+    size = 0
+    groups = set()
+    seen = 0
+    for cell in islice(itervalues(cells), 0, None, step):
+        seen += 1
+        size += sys.getsizeof(cell)
+        style = cell._style
+        if style is not None:
+            size += sys.getsizeof(style)
+            if any(style):
+                styled += 1
+        value = cell._value
+        if value is not None:
+            if value.__class__ is SharedFormula:
+                if value not in groups:
+                    groups.add(value)
+                    size += _estimate(value)
+            else:
+                size += sys.getsizeof(value)
+        if cell.data_type == 'f':
+            formulae += 1
+        if cell._comment is not None:
+            size += _estimate(cell._comment)
+    if seen and seen != count:
+        scale = float(count) / seen
+        styled = int(round(styled * scale))
+        formulae = int(round(formulae * scale))
+        size = int(round(size * scale))
+    if cells:
+        size += sys.getsizeof(cells)
+    return {
+        'cells': count,
+        'styled_cells': styled,
+        'formulae': formulae,
+        'comments': getattr(ws, "_comment_count", 0),
+        'hyperlinks': len(getattr(ws, "hyperlinks", ())),
+        'merged_ranges': len(getattr(ws, "_merged_cells", ())),
+        'estimated_bytes': size,
+    }
+
+
+def table_statistics(table):
+    """
+    Return the number of items of a table and their estimated bytes
+    """
+    size = sys.getsizeof(table)
+    for item in table:
+        size += _estimate(item)
+    return {'count': len(table), 'estimated_bytes': size}
+
+
+def workbook_statistics(wb, sample=SAMPLE):
+    """
+    Return the statistics of every worksheet, of the shared string table and
+    of the style tables of a workbook, and their total estimated bytes.
+    See `worksheet_statistics` for `sample`.
+
+    Style tables of a loaded workbook which have not been used yet are not
+    read for this and are reported as None.
+    """
+    worksheets = {}
+    total = 0
+    for ws in wb.worksheets:
+        stats = worksheets[ws.title] = worksheet_statistics(ws, sample)
+        total += stats['estimated_bytes']
+
+    strings = wb.shared_strings
+    if not strings:
+        # read-only worksheets keep the table of the file
+        for ws in wb.worksheets:
+            strings = getattr(ws, "shared_strings", None) or strings
+    strings = table_statistics(strings)
+    total += strings['estimated_bytes']
+
+    styles = {}
+    for name in STYLE_TABLES:
+        table = wb.__dict__.get(name)
+        if table is None:
+            styles[name[1:]] = None
+            continue
+        stats = styles[name[1:]] = table_statistics(table)
+        total += stats['estimated_bytes']
+
+    return {
+        'worksheets': worksheets,
+        'shared_strings': strings,
+        'styles': styles,
+        'estimated_bytes': total,
+    }
@@ -0,0 +1,72 @@
+from __future__ import absolute_import
+# Copyright (c) 2010-2015 openpyxl
+
+from io import BytesIO
+
+import pytest
+
+from openpyxl.styles import Font
+
+
+@pytest.fixture
+def wb():
+    from openpyxl import Workbook
+    from openpyxl.comments import Comment
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "Data"
+    for row in range(1, 11):
+        ws.append([row, "text", "=A{0}*2".format(row)])
+    ws['A1'].font = Font(bold=True)
+    ws['B2'].comment = Comment("note", "author")
+    ws['B3'].hyperlink = "http://example.com"
+    ws.merge_cells("D1:E1")
+    return wb
+
+
+def test_worksheet_statistics(wb):
+    from ..statistics import worksheet_statistics
+    stats = worksheet_statistics(wb["Data"])
+    assert stats['cells'] == 30
+    assert stats['styled_cells'] == 1
+    assert stats['formulae'] == 10
+    assert stats['comments'] == 1
+    assert stats['hyperlinks'] == 1
+    assert stats['merged_ranges'] == 1
+    assert stats['estimated_bytes'] > 30 * 50
+
+
+def test_sampled(wb):
+    from ..statistics import worksheet_statistics
+    ws = wb["Data"]
+    for row in range(11, 1001):
+        ws.append([row, "text", "=A{0}*2".format(row)])
+    exact = worksheet_statistics(ws, None)
+    assert exact['formulae'] == 1000
+    stats = worksheet_statistics(ws, 300)
+    assert stats['cells'] == 3000
+    assert stats['comments'] == 1
+    assert 900 <= stats['formulae'] <= 1100
+    assert 0.9 < stats['estimated_bytes'] / float(exact['estimated_bytes']) < 1.1
+
+
+def test_workbook_statistics(wb):
+    stats = wb.statistics()
+    assert stats['worksheets']['Data']['cells'] == 30
+    assert stats['styles']['fonts']['count'] == 2
+    assert stats['styles']['cell_styles']['count'] == 1
+    assert stats['shared_strings']['count'] == 0
+    total = (stats['worksheets']['Data']['estimated_bytes']
+             + stats['shared_strings']['estimated_bytes']
+             + sum(s['estimated_bytes'] for s in stats['styles'].values()))
+    assert stats['estimated_bytes'] == total
+
+
+def test_read_only(wb):
+    from openpyxl import load_workbook
+    out = BytesIO()
+    wb.save(out)
+    wb = load_workbook(out, read_only=True)
+    stats = wb.statistics()
+    assert stats['worksheets']['Data']['cells'] == 0
+    assert stats['shared_strings']['count'] == 1
@@ -14,10 +14,10 @@ from openpyxl.writer.write_only import WriteOnlyWorksheet, save_dump
 from openpyxl.writer.excel import save_workbook
 
 from openpyxl.styles.cell_style import StyleArray
-from openpyxl.styles.named_styles import NamedStyle
+from openpyxl.styles.named_styles import NamedStyle, NamedStyleList
+from openpyxl.styles.stylesheet import DeferredStyles
 
-from openpyxl.chartsheet import Chartsheet
-from . names.named_range import NamedRange
+from . names.named_range import NamedRange, NameIndex, DefinedNameList
 from openpyxl.packaging.core import DocumentProperties
 from .protection import DocumentSecurity
 
@@ -25,6 +25,13 @@ from .protection import DocumentSecurity
 class Workbook(object):
     """Workbook is the container for all other parts of the document."""
 
+    _named_styles = DeferredStyles('_named_styles')
+    _borders = DeferredStyles('_borders')
+    _fonts = DeferredStyles('_fonts')
+    _fills = DeferredStyles('_fills')
+    _differential_styles = DeferredStyles('_differential_styles')
+    _colors = DeferredStyles('_colors')
+
     def __init__(self,
                  optimized_write=False,
                  encoding='utf-8',
@@ -34,7 +41,8 @@ class Workbook(object):
                  write_only=False):
         self._sheets = []
         self._active_sheet_index = 0
-        self._named_ranges = []
+        self._named_ranges = DefinedNameList()
+        self._name_index = None
         self._external_links = {}
         self.properties = DocumentProperties()
         self.security = DocumentSecurity()
@@ -47,7 +55,7 @@ class Workbook(object):
         self.loaded_theme = None
         self.vba_archive = None
         self.is_template = False
-        self._differential_styles = []
+        self._differential_styles = IndexedList()
         self._guess_types = guess_types
         self.data_only = data_only
         self._drawings = []
@@ -56,6 +64,8 @@ class Workbook(object):
         self.code_name = None
         self.excel_base_date = CALENDAR_WINDOWS_1900
         self.encoding = encoding
+        self.evaluator = None
+        self.profile = None # file to which saves are sampled
 
         if not self.write_only:
             self._sheets.append(Worksheet(self))
@@ -88,7 +98,23 @@ class Workbook(object):
 
         self._colors = COLOR_INDEX
         self._cell_styles = IndexedList([StyleArray()])
-        self._named_styles = {'Normal': NamedStyle(font=DEFAULT_FONT)}
+        self._named_styles = NamedStyleList([NamedStyle(font=DEFAULT_FONT)])
+
+
+    @property
+    def named_styles(self):
+        """
+        List available named styles
+        """
+        return self._named_styles.names
+
+
+    def add_named_style(self, style):
+        """
+        Add a named style
+        """
+        self._named_styles.append(style)
+        style.bind(self)
 
 
     @property
@@ -148,8 +174,10 @@ class Workbook(object):
     def _add_sheet(self, sheet, index=None):
         """Add an worksheet (at an optional index)."""
 
-        if not isinstance(sheet, (Worksheet, Chartsheet)):
-            raise TypeError("Cannot be added to a workbook")
+        if not isinstance(sheet, Worksheet):
+            from openpyxl.chartsheet import Chartsheet
+            if not isinstance(sheet, Chartsheet):
+                raise TypeError("Cannot be added to a workbook")
 
         if sheet.parent != self:
             raise ValueError("You cannot add worksheets from another workbook.")
@@ -158,16 +186,19 @@ class Workbook(object):
             self._sheets.append(sheet)
         else:
             self._sheets.insert(index, sheet)
+        self._name_index = None
 
 
     def remove_sheet(self, worksheet):
         """Remove a worksheet from this workbook."""
         self._sheets.remove(worksheet)
+        self._name_index = None
 
 
     def create_chartsheet(self, title=None, index=None):
         if self.read_only:
             raise ReadOnlyWorkbookException("Cannot create new sheet in a read-only workbook")
+        from openpyxl.chartsheet import Chartsheet
         cs = Chartsheet(parent=self, title=title)
 
         self._add_sheet(cs, index=None)
@@ -218,7 +249,8 @@ class Workbook(object):
 
     @property
     def chartsheets(self):
-        return [s for s in self._sheets if isinstance(s, Chartsheet)]
+        # chartsheets are the only other sheets, this avoids importing them
+        return [s for s in self._sheets if not isinstance(s, Worksheet)]
 
     @property
     def sheetnames(self):
@@ -243,19 +275,43 @@ class Workbook(object):
     def add_named_range(self, named_range):
         """Add an existing named_range to the list of named_ranges."""
         self._named_ranges.append(named_range)
+        self._name_index = None
 
     def get_named_range(self, name):
         """Return the range specified by name."""
-        requested_range = None
-        for named_range in self._named_ranges:
-            if named_range.name == name:
-                requested_range = named_range
-                break
-        return requested_range
+        return self.name_index.get(name)
 
     def remove_named_range(self, named_range):
         """Remove a named_range from this workbook."""
         self._named_ranges.remove(named_range)
+        self._name_index = None
+
+    @property
+    def name_index(self):
+        """
+        Index of the defined names, rebuilt after names are changed, added or
+        removed or worksheets renamed. Call `names_changed` after changing
+        the list of destinations of a name in place.
+        """
+        index = self._name_index
+        if index is None or not index.is_current(self):
+            index = self._name_index = NameIndex(self)
+        return index
+
+    def names_changed(self):
+        """Discard the index of the defined names."""
+        self._name_index = None
+
+    def statistics(self, sample=10000):
+        """
+        Return the counts of cells, comments and other objects of each
+        worksheet and the sizes of the shared string and style tables, with
+        estimated bytes. Some counts are estimated from `sample` cells of
+        each worksheet, or from all of them if `sample` is None.
+        See :func:`openpyxl.workbook.statistics.workbook_statistics`
+        """
+        from .statistics import workbook_statistics
+        return workbook_statistics(self, sample)
 
     def save(self, filename):
         """Save the current workbook under the given `filename`.
@@ -20,7 +20,12 @@ from openpyxl.utils import (
     get_column_letter,
     coordinate_to_tuple,
 )
-from openpyxl.cell.read_only import ReadOnlyCell, EMPTY_CELL
+from openpyxl.cell.read_only import ReadOnlyCell, EMPTY_CELL, _number_formats
+from openpyxl.utils.instrumentation import (
+    ProgressMeter,
+    CountingReader,
+    _NO_PROGRESS,
+)
 
 
 def read_dimension(source):
@@ -29,7 +34,8 @@ def read_dimension(source):
     min_row = min_col =  max_row = max_col = None
     DIMENSION_TAG = '{%s}dimension' % SHEET_MAIN_NS
     DATA_TAG = '{%s}sheetData' % SHEET_MAIN_NS
-    it = iterparse(source, tag=[DIMENSION_TAG, DATA_TAG])
+    # stop as soon as the cells start rather than after all of them
+    it = iterparse(source, tag=[DIMENSION_TAG, DATA_TAG], events=('start',))
     for _event, element in it:
         if element.tag == DIMENSION_TAG:
             dim = element.get("ref")
@@ -53,7 +59,6 @@ def read_dimension(source):
         elif element.tag == DATA_TAG:
             # Dimensions missing
             break
-        element.clear()
 
 
 ROW_TAG = '{%s}row' % SHEET_MAIN_NS
@@ -61,12 +66,14 @@ CELL_TAG = '{%s}c' % SHEET_MAIN_NS
 VALUE_TAG = '{%s}v' % SHEET_MAIN_NS
 FORMULA_TAG = '{%s}f' % SHEET_MAIN_NS
 DIMENSION_TAG = '{%s}dimension' % SHEET_MAIN_NS
+DATA_TAG = '{%s}sheetData' % SHEET_MAIN_NS
 
 CELL_TAGS = (CELL_TAG, VALUE_TAG, FORMULA_TAG)
 
 class ReadOnlyWorksheet(Worksheet):
 
     _xml = None
+    _progress = None
     _min_column = 1
     _min_row = 1
     _max_column = _max_row = None
@@ -95,6 +102,18 @@ class ReadOnlyWorksheet(Worksheet):
         self._xml = value
 
 
+    def track_progress(self, callback, rows=10000, bytes=None):
+        """
+        Call `callback` with the Progress of every iteration over the rows
+        every `rows` rows or `bytes` bytes of XML read, and at the end.
+        Set `callback` to None to stop.
+        """
+        if callback is None:
+            self._progress = None
+        else:
+            self._progress = (callback, rows, bytes)
+
+
     def get_squared_range(self, min_col, min_row, max_col, max_row):
         """
         The source worksheet file may have columns or rows missing.
@@ -106,35 +125,67 @@ class ReadOnlyWorksheet(Worksheet):
             empty_row = []
         row_counter = min_row
 
-        p = iterparse(self.xml_source, tag=[ROW_TAG], remove_blank_text=True)
-        for _event, element in p:
-            if element.tag == ROW_TAG:
-                row_id = int(element.get("r"))
-
-                # got all the rows we need
-                if max_row is not None and row_id > max_row:
-                    break
-
-                # some rows are missing
-                for row_counter in range(row_counter, row_id):
-                    row_counter += 1
-                    yield empty_row
-
-                # return cells from a row
-                if min_row <= row_id:
-                    yield tuple(self._get_row(element, min_col, max_col))
-                    row_counter += 1
-
-            if element.tag in CELL_TAGS:
-                # sub-elements of rows should be skipped as handled within a cell
-                continue
-            element.clear()
+        source = self.xml_source
+        meter = _NO_PROGRESS
+        if self._progress is not None:
+            measure = None
+            if hasattr(source, "read"):
+                source = CountingReader(source)
+                measure = lambda: source.count
+            meter = ProgressMeter(*self._progress, measure=measure)
+        rows = 0
+
+        sheet_data = None
+        p = iterparse(source, tag=[ROW_TAG, DATA_TAG],
+                      events=('start', 'end'), remove_blank_text=True)
+        try:
+            for event, element in p:
+                if event == 'start':
+                    if element.tag == DATA_TAG:
+                        sheet_data = element
+                    continue
+
+                if element.tag == ROW_TAG:
+                    row_id = int(element.get("r"))
+
+                    # got all the rows we need
+                    if max_row is not None and row_id > max_row:
+                        break
+
+                    # counted before it is returned, in case it is the last
+                    rows += 1
+                    if rows >= meter.due:
+                        meter.update(rows)
+
+                    # some rows are missing
+                    for row_counter in range(row_counter, row_id):
+                        row_counter += 1
+                        yield empty_row
+
+                    # return cells from a row
+                    if min_row <= row_id:
+                        yield tuple(self._get_row(element, min_col, max_col))
+                        row_counter += 1
+
+                if element.tag in CELL_TAGS:
+                    # sub-elements of rows should be skipped as handled within a cell
+                    continue
+                element.clear()
+                if sheet_data is not None and element.tag == ROW_TAG:
+                    # detach rows already read so memory does not grow with them
+                    sheet_data.clear()
+
+        finally:
+            # also when the rows are not read to the end
+            if meter is not _NO_PROGRESS:
+                meter.finish(rows)
 
 
     def _get_row(self, element, min_col=1, max_col=None):
         """Return cells from a particular row"""
         col_counter = min_col
         data_only = getattr(self.parent, 'data_only', False)
+        number_formats = _number_formats(self.parent)
 
         for cell in safe_iterator(element, CELL_TAG):
             coordinate = cell.get('r')
@@ -152,6 +203,7 @@ class ReadOnlyWorksheet(Worksheet):
                 data_type = cell.get('t', 'n')
                 style_id = int(cell.get('s', 0))
                 value = None
+                number_format = None
 
                 formula = cell.findtext(FORMULA_TAG)
                 if formula is not None and not data_only:
@@ -160,9 +212,12 @@ class ReadOnlyWorksheet(Worksheet):
 
                 else:
                     value = cell.findtext(VALUE_TAG) or None
+                    if data_type == 'n':
+                        # dates are converted in one lookup
+                        number_format = number_formats[style_id]
 
                 yield ReadOnlyCell(self, row, column,
-                                   value, data_type, style_id)
+                                   value, data_type, style_id, number_format)
             col_counter = column + 1
 
         if max_col is not None:
@@ -498,3 +498,264 @@ def test_max_row(Worksheet):
     ws.append([])
     ws.append([4])
     assert ws.max_row == 4
+
+
+class TestInsertDelete:
+
+    @pytest.fixture
+    def ws(self):
+        wb = Workbook()
+        ws = wb.active
+        for row in range(1, 6):
+            ws.append([row, row * 10, "=A{0}+B{0}".format(row)])
+        return ws
+
+
+    def test_insert_rows(self, ws):
+        other = ws.parent.create_sheet(title="Other")
+        other['A1'] = "=Sheet!A4+SUM(Sheet!A1:A5)"
+        ws.row_dimensions[4].height = 30
+        ws.merge_cells("A4:B5")
+        ws.insert_rows(3, 2)
+        assert ws['A3'].value is None
+        assert ws['A5'].value == 3
+        assert ws['C5'].value == "=A5+B5"
+        assert ws['C2'].value == "=A2+B2"
+        assert other['A1'].value == "=Sheet!A6+SUM(Sheet!A1:A7)"
+        assert ws.row_dimensions[6].height == 30
+        assert ws.merged_cell_ranges == ["A6:B7"]
+        assert ws.max_row == 7
+        ws.append([6])
+        assert ws['A8'].value == 6
+
+
+    def test_delete_rows(self, ws):
+        ws['D1'] = "=A2+SUM(B1:B5)"
+        ws.delete_rows(2)
+        assert ws['A2'].value == 3
+        assert ws['A2'].row == 2
+        assert ws['C2'].value == "=A2+B2"
+        assert ws['D1'].value == "=#REF!+SUM(B1:B4)"
+        assert ws.max_row == 4
+
+
+    def test_insert_cols(self, ws):
+        ws.column_dimensions['B'].width = 20
+        ws.conditional_formatting.cf_rules["B1:B5"] = []
+        ws.insert_cols(2)
+        assert ws['C1'].value == 10
+        assert ws['C1'].column == 'C'
+        assert ws['D1'].value == "=A1+C1"
+        assert ws.column_dimensions['C'].width == 20
+        assert list(ws.conditional_formatting.cf_rules) == ["C1:C5"]
+
+
+    def test_delete_cols(self, ws):
+        from openpyxl.worksheet.datavalidation import DataValidation
+        dv = DataValidation(type="whole", sqref="B1 C1")
+        ws.add_data_validation(dv)
+        ws.delete_cols(1)
+        assert ws['A1'].value == 10
+        assert ws['B1'].value == "=#REF!+A1"
+        assert dv.cells == set(["A1", "B1"])
+
+
+    def test_shared_formula(self, ws):
+        from openpyxl.formula.shared import SharedFormula
+        group = SharedFormula(0, "C1:C5", "=A1+B1", "C1")
+        for row in range(1, 6):
+            ws.cell(row=row, column=3)._value = group
+        ws.shared_formulae[0] = group
+        ws.insert_rows(2)
+        assert ws.shared_formulae == {}
+        assert ws['C4'].value == "=A4+B4"
+        assert ws['C1'].value == "=A1+B1"
+
+
+    def test_named_range(self, ws):
+        wb = ws.parent
+        wb.create_named_range("totals", ws, "$B$2:$B$4")
+        ws.delete_rows(1)
+        assert wb.get_named_range("totals").destinations == [(ws, "$B$1:$B$3")]
+        ws.delete_rows(1, 3)
+        assert wb.get_named_range("totals") is None
+
+
+    def test_filter_and_panes(self, ws):
+        ws.auto_filter.ref = "A1:C5"
+        ws.auto_filter.add_filter_column(2, ["x"])
+        ws.sort_state.ref = "A2:C5"
+        ws.freeze_panes = "B3"
+        ws.insert_rows(1, 2)
+        assert ws.auto_filter.ref == "A3:C7"
+        assert ws.sort_state.ref == "A4:C7"
+        assert ws.freeze_panes == "B5"
+        assert ws.sheet_view.pane.ySplit == 4
+        ws.delete_cols(1)
+        assert ws.auto_filter.ref == "A3:B7"
+        assert ws.auto_filter.filterColumn[0].colId == 1
+        assert ws.freeze_panes == "A5"
+        assert ws.sheet_view.pane.xSplit is None
+        ws.delete_rows(1, 4)
+        assert ws.sheet_view.pane is None
+
+
+    def test_print_titles(self, ws):
+        ws.add_print_title(2)
+        ws.insert_rows(1)
+        named_range = ws.parent.get_named_range("_xlnm.Print_Titles")
+        assert named_range.destinations == [(ws, "$2:$3")]
+
+
+    def test_named_value(self, ws):
+        from openpyxl.workbook.names.named_range import NamedValue
+        ws.parent.add_named_range(NamedValue("double", "Sheet!$B$2*2"))
+        ws.insert_rows(1)
+        assert ws.parent.get_named_range("double").value == "Sheet!$B$3*2"
+
+
+    def test_evaluator(self, ws):
+        from io import BytesIO
+        from openpyxl import load_workbook
+        from openpyxl.formula.evaluate import Evaluator
+        wb = ws.parent
+        wb.evaluator = Evaluator(wb)
+        wb.save(BytesIO())
+        ws.insert_rows(1, 2)
+        out = BytesIO()
+        wb.save(out)
+        ws = load_workbook(out, data_only=True).active
+        assert ws['C3'].value == 11
+        assert ws['C1'].value is None
+
+
+    @pytest.mark.parametrize("method", ["insert_rows", "delete_rows",
+                                        "insert_cols", "delete_cols"])
+    @pytest.mark.parametrize("idx, amount", [(0, 1), (1, 0), (1, -2)])
+    def test_invalid(self, ws, method, idx, amount):
+        with pytest.raises(ValueError):
+            getattr(ws, method)(idx, amount)
+        assert ws['A1'].value == 1
+
+    @pytest.mark.parametrize("method, cell, args", [
+        ("insert_rows", "A1048576", (1, 1)),
+        ("insert_cols", "XFD1", (1, 1)),
+        ("insert_rows", "A1048570", (1048570, 10)),
+    ])
+    def test_beyond_limit(self, ws, method, cell, args):
+        ws[cell] = 5
+        with pytest.raises(ValueError):
+            getattr(ws, method)(*args)
+        assert ws[cell].value == 5
+        assert ws['A1'].value == 1
+
+    def test_merged_beyond_limit(self, ws):
+        ws.merge_cells("B1048575:C1048576")
+        with pytest.raises(ValueError):
+            ws.insert_rows(2)
+        ws.insert_cols(2)
+        assert ws.merged_cell_ranges == ["C1048575:D1048576"]
+
+    def test_array_beyond_limit(self, ws):
+        ws.formula_attributes['B1'] = {'t': 'array', 'ref': 'B1:XFD1'}
+        with pytest.raises(ValueError):
+            ws.insert_cols(3)
+        ws.insert_rows(1)
+        assert ws.formula_attributes['B2']['ref'] == 'B2:XFD2'
+
+
+class TestMoveCopy:
+
+    @pytest.fixture
+    def ws(self):
+        wb = Workbook()
+        ws = wb.active
+        for row in range(1, 4):
+            ws.append([row, "=A{0}*2".format(row), "=$A$1+A{0}".format(row)])
+        ws['A1'].number_format = "0.00"
+        return ws
+
+
+    def test_move_range(self, ws):
+        ws['E2'] = "old"
+        ws.move_range("A1:B2", rows=1, cols=4)
+        assert ws['E2'].value == 1
+        assert ws['E2'].number_format == "0.00"
+        assert ws['F2'].value == "=A1*2"
+        assert (1, 1) not in ws._cells
+        assert ws['A3'].value == 3
+
+
+    def test_move_range_translate(self, ws):
+        ws.move_range("B1:C3", rows=2, translate=True)
+        assert ws['B3'].value == "=A3*2"
+        assert ws['C5'].value == "=$A$1+A5"
+        assert ws['B1'].value is None
+
+
+    def test_copy_range(self, ws):
+        ws.copy_range("A1:C3", rows=3)
+        assert ws['A1'].value == 1
+        assert ws['A4'].value == 1
+        assert ws['A4'].number_format == "0.00"
+        assert ws['A4'] is not ws['A1']
+        assert ws['B6'].value == "=A6*2"
+        assert ws['C4'].value == "=$A$1+A4"
+
+
+    def test_copy_shared_formula(self, ws):
+        from openpyxl.formula.shared import SharedFormula
+        group = SharedFormula(0, "B1:B3", "=A1*2", "B1")
+        for row in range(1, 4):
+            ws.cell(row=row, column=2)._value = group
+        ws.copy_range("B1:B3", cols=2)
+        assert ws['D3'].value == "=C3*2"
+        ws.move_range("B2:B3", cols=3)
+        assert ws['E2'].value == "=A2*2"
+
+
+    def test_outside(self, ws):
+        from openpyxl.formula.translate import TranslatorError
+        with pytest.raises(ValueError):
+            ws.move_range("A1:B2", rows=-1)
+        with pytest.raises(ValueError):
+            ws.move_range("A1:B2", rows=1048575)
+        with pytest.raises(ValueError):
+            ws.copy_range("A1:B2", cols=16383)
+        with pytest.raises(TranslatorError):
+            ws.copy_range("B2:B3", cols=-1)
+        assert ws['A2'].value == 2
+
+
+def test_move_evaluated():
+    from io import BytesIO
+    from openpyxl import load_workbook
+    from openpyxl.formula.evaluate import Evaluator
+    wb = Workbook()
+    ws = wb.active
+    ws['A1'] = 1
+    ws['A2'] = 100
+    ws['B1'] = "=A1+1"
+    wb.evaluator = Evaluator(wb)
+    wb.save(BytesIO())
+    ws.move_range("B1", rows=1, translate=True)
+    ws.copy_range("B2", cols=1)
+    out = BytesIO()
+    wb.save(out)
+    ws = load_workbook(out, data_only=True).active
+    assert ws['B1'].value is None
+    assert ws['B2'].value == 101
+    assert ws['C2'].value == 102
+
+
+def test_array_formula_moved():
+    wb = Workbook()
+    ws = wb.active
+    ws['B4'] = "=SUM(A1:A3*B1:B3)"
+    ws.formula_attributes['B4'] = {'t': 'array', 'ref': 'B4:B6'}
+    ws.insert_rows(1)
+    assert ws.formula_attributes.find(7, 2) == (5, 2)
+    assert ws.formula_attributes['B5']['ref'] == "B5:B7"
+    ws.move_range("B5", cols=1)
+    assert ws.formula_attributes.find(7, 2) is None
+    assert ws.formula_attributes['C5']['ref'] == "C5:C7"
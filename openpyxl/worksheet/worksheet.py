@@ -46,6 +46,10 @@ from openpyxl.formatting import ConditionalFormatting
 from openpyxl.workbook.names.named_range import NamedRange
 from openpyxl.workbook.child import _WorkbookChild
 from openpyxl.utils.bound_dictionary import BoundDictionary
+from openpyxl.formula.array import ArrayFormulae
+from openpyxl.formula.graph import MAX_ROW, MAX_COLUMN
+from openpyxl.formula.shared import SharedFormula
+from openpyxl.formula.translate import Translator
 
 from .datavalidation import DataValidationList
 from .header_footer import HeaderFooter
@@ -126,7 +130,8 @@ class Worksheet(_WorkbookChild):
         self.sort_state = SortState()
         self._freeze_panes = None
         self.paper_size = None
-        self.formula_attributes = {}
+        self.formula_attributes = ArrayFormulae()
+        self.shared_formulae = {} # {si: SharedFormula}
         self.orientation = None
         self.conditional_formatting = ConditionalFormatting()
         self.vba_controls = None
@@ -478,7 +483,8 @@ class Worksheet(_WorkbookChild):
 
         :rtype: tuples of tuples of :class:`openpyxl.cell.Cell`
         """
-        named_range = self.parent.get_named_range(range_string)
+        names = self.parent.name_index
+        named_range = names.lookup(range_string, self.title)
         if named_range is None:
             msg = '%s is not a valid range name' % range_string
             raise NamedRangeException(msg)
@@ -486,16 +492,21 @@ class Worksheet(_WorkbookChild):
             msg = '%s refers to a value, not a range' % range_string
             raise NamedRangeException(msg)
 
-        result = []
-        for destination in named_range.destinations:
-            worksheet, cells_range = destination
-
+        for worksheet, cells_range in named_range.destinations:
             if worksheet is not self:
                 msg = 'Range %s is not defined on worksheet %s' % \
                     (cells_range, self.title)
                 raise NamedRangeException(msg)
 
-            for row in self.iter_rows(cells_range):
+        result = []
+        for title, boundaries in names.destinations(range_string, self.title):
+            min_col, min_row, max_col, max_row = boundaries
+            # whole rows and columns end with the cells in use
+            if max_row == MAX_ROW:
+                max_row = min(max_row, self.max_row)
+            if max_col == MAX_COLUMN:
+                max_col = min(max_col, self.max_column)
+            for row in self.get_squared_range(min_col, min_row, max_col, max_row):
                 result.extend(row)
 
         return tuple(result)
@@ -641,6 +652,378 @@ class Worksheet(_WorkbookChild):
             msg = 'Cell range %s not known as merged.' % range_string
             raise InsufficientCoordinatesException(msg)
 
+
+    def insert_rows(self, idx, amount=1):
+        """
+        Insert `amount` rows before row `idx`
+        """
+        self._shift(idx, amount, rows=True)
+
+
+    def delete_rows(self, idx, amount=1):
+        """
+        Delete `amount` rows from row `idx`
+        """
+        self._shift(idx, amount, rows=True, delete=True)
+
+
+    def insert_cols(self, idx, amount=1):
+        """
+        Insert `amount` columns before column `idx`
+        """
+        self._shift(idx, amount, rows=False)
+
+
+    def delete_cols(self, idx, amount=1):
+        """
+        Delete `amount` columns from column `idx`
+        """
+        self._shift(idx, amount, rows=False, delete=True)
+
+
+    def _shift(self, idx, amount, rows, delete=False):
+        """
+        Move the cells, dimensions, merged cells, conditional formats, data
+        validations, filters and panes after an insertion or deletion, and
+        update the references to them in the formulae and defined names of
+        the workbook.
+
+        All cells are visited once, whatever the number of rows or columns.
+        """
+        if idx < 1 or amount < 1:
+            raise ValueError("Invalid index or amount")
+        from openpyxl.formula.shift import Shift
+        if delete:
+            amount = -amount
+        shift = Shift(self.title, idx, amount, rows)
+        rows = shift.rows
+        if not delete:
+            limit = MAX_ROW if rows else MAX_COLUMN
+            furthest = self._furthest(rows)
+            if furthest >= idx and furthest + amount > limit:
+                raise ValueError("Cannot move cells outside the worksheet")
+        formulae = {}
+
+        def shift_formula(value, own):
+            key = (value, own)
+            new = formulae.get(key)
+            if new is None:
+                new = formulae[key] = shift.formula(value, own)
+            return new
+
+        for ws in self.parent.worksheets:
+            if not hasattr(ws, "_cells"):
+                continue
+            own = ws is self
+            unshared = set()
+            for si, group in list(ws.shared_formulae.items()):
+                if own and group.ref is not None:
+                    min_col, min_row, max_col, max_row = range_boundaries(group.ref)
+                    moves = (max_row if rows else max_col) >= shift.idx
+                else:
+                    moves = own
+                if moves or shift.refers_to(group.text, own):
+                    unshared.add(group)
+                    del ws.shared_formulae[si]
+
+            for cell in ws._cells.values():
+                if cell.data_type != 'f':
+                    continue
+                value = cell._value
+                if value.__class__ is SharedFormula:
+                    if value not in unshared:
+                        continue
+                    value = value.formula(cell.row, cell.col_idx)
+                cell._value = shift_formula(value, own)
+
+        cells = {}
+        for (row, col), cell in iteritems(self._cells):
+            if rows:
+                row = shift.index(row)
+            else:
+                col = shift.index(col)
+            if row is None or col is None:
+                self.hyperlinks.discard(cell)
+                continue
+            cell.row = row
+            cell.col_idx = col
+            cells[(row, col)] = cell
+        self._cells = cells
+
+        if rows:
+            dims = list(self.row_dimensions.items())
+            self.row_dimensions.clear()
+            for idx, dim in dims:
+                idx = shift.index(idx)
+                if idx is not None:
+                    dim.index = idx
+                    self.row_dimensions[idx] = dim
+            current = shift.index(self._current_row)
+            self._current_row = shift.idx - 1 if current is None else current
+        else:
+            dims = list(self.column_dimensions.values())
+            self.column_dimensions.clear()
+            for dim in dims:
+                lo = dim.min or column_index_from_string(dim.index)
+                hi = dim.max or lo
+                interval = shift.interval(lo, hi)
+                if interval is None:
+                    continue
+                dim.index = get_column_letter(interval[0])
+                if dim.min is not None:
+                    dim.min, dim.max = interval
+                self.column_dimensions[dim.index] = dim
+
+        attributes = ArrayFormulae()
+        for (row, col), attrs in self.formula_attributes.items():
+            if rows:
+                row = shift.index(row)
+            else:
+                col = shift.index(col)
+            if row is None or col is None:
+                continue
+            if attrs.get('ref') is not None:
+                attrs = dict(attrs)
+                attrs['ref'] = shift.reference(attrs['ref'])
+            attributes[(row, col)] = attrs
+        self.formula_attributes = attributes
+
+        merged = []
+        for range_string in self._merged_cells:
+            range_string = shift.reference(range_string)
+            if range_string is not None and ":" in range_string:
+                merged.append(range_string)
+        self._merged_cells = merged
+
+        cf_rules = self.conditional_formatting.cf_rules
+        for range_string, rules in list(cf_rules.items()):
+            del cf_rules[range_string]
+            range_string = shift.range_string(range_string)
+            if range_string is None:
+                continue
+            for rule in rules:
+                rule.formula = [shift_formula("=" + f, True)[1:]
+                                for f in rule.formula]
+            cf_rules.setdefault(range_string, []).extend(rules)
+
+        for dv in self.data_validations.dataValidation:
+            dv.cells = set(c for c in map(shift.reference, dv.cells)
+                           if c is not None)
+            dv.ranges = [r for r in map(shift.reference, dv.ranges)
+                         if r is not None]
+
+        self._shift_filter(shift, self.auto_filter)
+        self._shift_sort_state(shift, self.sort_state)
+        self._shift_pane(shift)
+
+        for named_range in self.parent.get_named_ranges():
+            destinations = getattr(named_range, "destinations", None)
+            if destinations is None:
+                # names defined by formulae
+                if named_range.value:
+                    named_range.value = shift_formula(
+                        "=" + named_range.value, False)[1:]
+                continue
+            new = []
+            for ws, xlrange in destinations:
+                if ws is self:
+                    xlrange = shift.reference(xlrange)
+                    if xlrange is None:
+                        continue
+                new.append((ws, xlrange))
+            if new:
+                named_range.destinations = new
+            else:
+                self.parent.remove_named_range(named_range)
+        self.parent.names_changed()
+
+        evaluator = self.parent.evaluator
+        if evaluator is not None:
+            evaluator.reset()
+
+
+    @staticmethod
+    def _shift_sort_state(shift, sort_state):
+        if sort_state is None or sort_state.ref is None:
+            return
+        sort_state.ref = shift.reference(sort_state.ref)
+        conditions = []
+        for condition in sort_state.sortCondition or ():
+            condition.ref = shift.reference(condition.ref)
+            if condition.ref is not None:
+                conditions.append(condition)
+        sort_state.sortCondition = conditions
+
+
+    def _shift_filter(self, shift, auto_filter):
+        if auto_filter.ref is None:
+            return
+        min_col = range_boundaries(auto_filter.ref)[0]
+        auto_filter.ref = shift.reference(auto_filter.ref)
+        if auto_filter.ref is None:
+            auto_filter.filterColumn = []
+            auto_filter.sortState = None
+            return
+        if not shift.rows:
+            # filtered columns are numbered from the first of the filter
+            new_min_col = range_boundaries(auto_filter.ref)[0]
+            columns = []
+            for column in auto_filter.filterColumn:
+                col = shift.index(min_col + column.colId)
+                if col is not None:
+                    column.colId = col - new_min_col
+                    columns.append(column)
+            auto_filter.filterColumn = columns
+        self._shift_sort_state(shift, auto_filter.sortState)
+
+
+    def _shift_pane(self, shift):
+        """
+        Move the top left cell of the pane. Frozen rows or columns are
+        inserted or deleted like the others.
+        """
+        pane = self.sheet_view.pane
+        if pane is None or pane.topLeftCell is None:
+            return
+        column, row = coordinate_from_string(pane.topLeftCell)
+        col = column_index_from_string(column)
+        frozen = pane.state != "split"
+        if shift.rows:
+            if frozen:
+                interval = shift.interval(1, row - 1)
+                row = interval[1] + 1 if interval is not None else 1
+                pane.ySplit = row - 1 or None
+            else:
+                row = shift.index(row) or shift.idx
+        else:
+            if frozen:
+                interval = shift.interval(1, col - 1)
+                col = interval[1] + 1 if interval is not None else 1
+                pane.xSplit = col - 1 or None
+            else:
+                col = shift.index(col) or shift.idx
+        if frozen and pane.xSplit is None and pane.ySplit is None:
+            self.sheet_view.pane = None
+            return
+        pane.topLeftCell = "{0}{1}".format(get_column_letter(col), row)
+
+
+    def move_range(self, cell_range, rows=0, cols=0, translate=False):
+        """
+        Move a range of cells, with their styles, by `rows` down and `cols`
+        to the right. Existing cells are overwritten.
+
+        Formulae are moved as they are unless `translate` is True, when their
+        relative references are moved by the same offset. Formulae
+        elsewhere are not updated.
+        """
+        self._relocate(cell_range, rows, cols, translate, copy=False)
+
+
+    def copy_range(self, cell_range, rows=0, cols=0):
+        """
+        Copy a range of cells, with their values and styles, by `rows` down
+        and `cols` to the right. Existing cells are overwritten. The relative
+        references of formulae are moved by the same offset.
+        """
+        self._relocate(cell_range, rows, cols, translate=True, copy=True)
+
+
+    def _furthest(self, rows):
+        """
+        Return the last row, or column, used by the cells, merged cells and
+        array formulae of the worksheet, 0 if there are none.
+        """
+        pos = 0 if rows else 1
+        furthest = max([key[pos] for key in self._cells] or [0])
+        ranges = list(self._merged_cells)
+        ranges.extend(attrs['ref'] for attrs in self.formula_attributes.values()
+                      if attrs.get('ref'))
+        for range_string in ranges:
+            min_col, min_row, max_col, max_row = range_boundaries(range_string.upper())
+            furthest = max(furthest, max_row if rows else max_col)
+        for key in self.formula_attributes:
+            furthest = max(furthest, key[pos])
+        return furthest
+
+
+    def _relocate(self, cell_range, rows, cols, translate, copy):
+        """
+        Move or copy cells. The new values are worked out before any cell
+        changes so that a formula which cannot be translated leaves the
+        worksheet as it was.
+
+        Every distinct formula is tokenized once: all formulae move by the
+        same offset, so the result only depends on the text of the formula.
+        Cells of a shared formula are filled in from the translator of the
+        group.
+        """
+        min_col, min_row, max_col, max_row = range_boundaries(cell_range.upper())
+        if (min_row + rows < 1 or min_col + cols < 1
+            or max_row + rows > MAX_ROW or max_col + cols > MAX_COLUMN):
+            raise ValueError("Cannot move {0} outside the worksheet".format(cell_range))
+
+        translated = {}
+        values = []
+        for (row, col), cell in iteritems(self._cells):
+            if not (min_row <= row <= max_row and min_col <= col <= max_col):
+                continue
+            value = cell._value
+            if value.__class__ is SharedFormula:
+                if translate:
+                    value = value.formula(row + rows, col + cols)
+                else:
+                    value = value.formula(row, col)
+            elif translate and cell.data_type == 'f':
+                new = translated.get(value)
+                if new is None:
+                    new = Translator(value, "A1").translate_offset(rows, cols)
+                    translated[value] = new
+                value = new
+            values.append((cell, value))
+
+        arrays = self.formula_attributes
+        attributes = {}
+        moved = {}
+        for cell, value in values:
+            row, col = cell.row + rows, cell.col_idx + cols
+            attrs = arrays.get((cell.row, cell.col_idx))
+            if attrs is not None:
+                if not copy:
+                    del arrays[(cell.row, cell.col_idx)]
+                if attrs.get('ref'):
+                    b = range_boundaries(attrs['ref'].upper())
+                    attrs = dict(attrs)
+                    attrs['ref'] = "{0}{1}:{2}{3}".format(
+                        get_column_letter(b[0] + cols), b[1] + rows,
+                        get_column_letter(b[2] + cols), b[3] + rows)
+                attributes[(row, col)] = attrs
+            if copy:
+                new = Cell(self, row=row, col_idx=col, style_array=cell._style)
+                new.data_type = cell.data_type
+            else:
+                del self._cells[(cell.row, cell.col_idx)]
+                new = cell
+                new.row, new.col_idx = row, col
+            new._value = value
+            moved[(row, col)] = new
+
+        for key, cell in iteritems(moved):
+            old = self._cells.get(key)
+            if old is not None:
+                self.hyperlinks.discard(old)
+                old.comment = None
+            if key in arrays:
+                del arrays[key]
+            self._cells[key] = cell
+            self._current_row = max(key[0], self._current_row)
+        for key, attrs in iteritems(attributes):
+            arrays[key] = attrs
+
+        evaluator = self.parent.evaluator
+        if evaluator is not None:
+            evaluator.reset()
+
     def append(self, iterable):
         """Appends a group of values at the bottom of the current sheet.
 
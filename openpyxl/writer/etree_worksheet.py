@@ -3,8 +3,10 @@ from __future__ import absolute_import
 
 from operator import itemgetter
 
-from openpyxl.compat import safe_string
+from openpyxl.compat import safe_string, NUMERIC_TYPES
+from openpyxl.utils import get_column_letters
 from openpyxl.xml.functions import xmlfile, Element, SubElement
+from openpyxl.formula.shared import SharedFormula
 
 
 def get_rows_to_write(worksheet):
@@ -22,6 +24,52 @@ def get_rows_to_write(worksheet):
     return sorted(rows.items())
 
 
+def get_formula(worksheet, cell):
+    """
+    Return the attributes and text of the formula of a cell.
+
+    Cells of a shared formula refer to the master cell of their group, unless
+    the master no longer belongs to it, in which case they get their own
+    formula.
+    """
+    value = cell._value
+    if value.__class__ is not SharedFormula:
+        attrs = worksheet.formula_attributes.get((cell.row, cell.col_idx), {})
+        return attrs, value[1:]
+
+    master = worksheet._cells.get((value.row, value.col))
+    if master is None or master._value is not value:
+        return {}, value.formula(cell.row, cell.col_idx)[1:]
+    if master is not cell:
+        return {'t':'shared', 'si':value.si}, None
+    attrs = {'t':'shared', 'si':value.si}
+    if value.ref is not None:
+        attrs['ref'] = value.ref
+    return attrs, value.text[1:]
+
+
+def get_formula_result(worksheet, cell):
+    """
+    Return the data type and value of the result of a formula cached by the
+    workbook's evaluator, if any.
+    """
+    evaluator = worksheet.parent.evaluator
+    if evaluator is None:
+        return None, None
+    # the evaluator is optional, so is only imported when used
+    from openpyxl.formula.evaluate import FormulaError
+    value = evaluator.result(cell)
+    if value is None:
+        return None, None
+    if value is True or value is False:
+        return 'b', int(value)
+    if isinstance(value, NUMERIC_TYPES):
+        return None, value
+    if isinstance(value, FormulaError):
+        return 'e', value.code
+    return 'str', value
+
+
 def write_rows(xf, worksheet):
     """Write worksheet data to xml."""
 
@@ -29,31 +77,40 @@ def write_rows(xf, worksheet):
 
     dims = worksheet.row_dimensions
     max_column = worksheet.max_column
+    # letters of every column, indexed by column number
+    letters = [None] + get_column_letters(range(1, max_column + 1))
 
     with xf.element("sheetData"):
         for row_idx, row in all_rows:
 
-            attrs = {'r': '%d' % row_idx, 'spans': '1:%d' % max_column}
+            row_str = '%d' % row_idx
+            attrs = {'r': row_str, 'spans': '1:%d' % max_column}
             if row_idx in dims:
                 row_dimension = dims[row_idx]
                 attrs.update(dict(row_dimension))
 
             with xf.element("row", attrs):
                 for col, cell in sorted(row, key=itemgetter(0)):
-                    if cell.value is None and not cell.has_style:
+                    if cell._value is None and not cell.has_style:
                         continue
-                    el = write_cell(worksheet, cell, cell.has_style)
+                    el = write_cell(worksheet, cell, cell.has_style,
+                                    letters[col] + row_str)
                     xf.write(el)
 
 
-def write_cell(worksheet, cell, styled=None):
-    coordinate = cell.coordinate
+def write_cell(worksheet, cell, styled=None, coordinate=None):
+    if coordinate is None:
+        coordinate = cell.coordinate
     attributes = {'r': coordinate}
     if styled:
         attributes['s'] = '%d' % cell.style_id
 
     if cell.data_type != 'f':
         attributes['t'] = cell.data_type
+    else:
+        data_type, result = get_formula_result(worksheet, cell)
+        if data_type is not None:
+            attributes['t'] = data_type
 
     value = cell._value
 
@@ -62,11 +119,10 @@ def write_cell(worksheet, cell, styled=None):
         return el
 
     if cell.data_type == 'f':
-        shared_formula = worksheet.formula_attributes.get(coordinate, {})
-        formula = SubElement(el, 'f', shared_formula)
-        if value is not None:
-            formula.text = value[1:]
-            value = None
+        attrs, text = get_formula(worksheet, cell)
+        formula = SubElement(el, 'f', attrs)
+        formula.text = text
+        value = result
 
     if cell.data_type == 's':
         value = worksheet.parent.shared_strings.add(value)
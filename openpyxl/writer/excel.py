@@ -25,7 +25,6 @@ from openpyxl.xml.constants import (
     PACKAGE_IMAGES,
     PACKAGE_XL
     )
-from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
 from openpyxl.xml.functions import tostring
 from openpyxl.packaging.manifest import write_content_types
 from openpyxl.writer.strings import write_string_table
@@ -42,9 +41,11 @@ from openpyxl.workbook.names.external import (
     write_external_link,
     write_external_book_rel
 )
-from openpyxl.styles.stylesheet import write_stylesheet
+from openpyxl.styles.stylesheet import write_stylesheet, compact_styles
 
 from openpyxl.writer.comments import CommentWriter
+from openpyxl.utils.instrumentation import phase
+from openpyxl.utils.sampler import sampling
 
 ARC_VBA = ('xl/vba', r'xl/drawings/.*vmlDrawing\d\.vml', 'xl/ctrlProps', 'customUI',
            'xl/activeX', r'xl/media/.*\.emf')
@@ -80,14 +81,23 @@ class ExcelWriter(object):
                         archive.writestr(name, vba_archive.read(name))
                         break
 
-        self._write_charts(archive)
-        self._write_images(archive)
+        with phase("charts"):
+            self._write_charts(archive)
+        with phase("images"):
+            self._write_images(archive)
+        compact_styles(self.workbook)
+        if self.workbook.evaluator is not None:
+            with phase("calculation"):
+                self.workbook.evaluator.calculate()
         self._write_worksheets(archive)
-        self._write_chartsheets(archive)
-        self._write_string_table(archive)
+        with phase("chartsheets"):
+            self._write_chartsheets(archive)
+        with phase("shared strings"):
+            self._write_string_table(archive)
         self._write_external_links(archive)
-        stylesheet = write_stylesheet(self.workbook)
-        archive.writestr(ARC_STYLE, tostring(stylesheet))
+        with phase("styles"):
+            stylesheet = write_stylesheet(self.workbook)
+            archive.writestr(ARC_STYLE, tostring(stylesheet))
         manifest = write_content_types(self.workbook, as_template=as_template)
         archive.writestr(ARC_CONTENT_TYPES, tostring(manifest.to_tree()))
 
@@ -122,6 +132,7 @@ class ExcelWriter(object):
         for idx, sheet in enumerate(self.workbook.chartsheets, 1):
 
             if sheet._charts:
+                from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
                 drawing = SpreadsheetDrawing()
                 drawing.charts = sheet._charts
                 self.workbook._drawings.append(drawing)
@@ -154,10 +165,20 @@ class ExcelWriter(object):
         vba_controls_id = 0
 
         for i, sheet in enumerate(self.workbook.worksheets, 1):
-            xml = sheet._write(self.workbook.shared_strings)
-            archive.writestr(PACKAGE_WORKSHEETS + '/sheet%d.xml' % i , xml)
+            with phase("worksheet:" + sheet.title):
+                arcname = PACKAGE_WORKSHEETS + '/sheet%d.xml' % i
+                if self.workbook.write_only:
+                    # copy the streamed file without reading it into memory
+                    sheet.close()
+                    archive.write(sheet.filename, arcname)
+                    sheet._cleanup()
+                    sheet._saved(archive.getinfo(arcname).compress_size)
+                else:
+                    xml = sheet._write(self.workbook.shared_strings)
+                    archive.writestr(arcname, xml)
 
             if sheet._charts or sheet._images:
+                from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
                 drawing = SpreadsheetDrawing()
                 drawing.charts = sheet._charts
                 drawing.images = sheet._images
@@ -173,11 +194,12 @@ class ExcelWriter(object):
 
             if sheet._comment_count > 0:
                 comments_id += 1
-                cw = self.comment_writer(sheet)
-                archive.writestr(PACKAGE_XL + '/comments%d.xml' % comments_id,
-                    cw.write_comments())
-                archive.writestr(PACKAGE_XL + '/drawings/commentsDrawing%d.vml' % comments_id,
-                    cw.write_comments_vml())
+                with phase("comments:" + sheet.title):
+                    cw = self.comment_writer(sheet)
+                    archive.writestr(PACKAGE_XL + '/comments%d.xml' % comments_id,
+                        cw.write_comments())
+                    archive.writestr(PACKAGE_XL + '/drawings/commentsDrawing%d.vml' % comments_id,
+                        cw.write_comments_vml())
 
             if sheet.vba_controls is not None:
                 vba_controls_id += 1
@@ -208,9 +230,10 @@ class ExcelWriter(object):
 
     def save(self, filename, as_template=False):
         """Write data into the archive."""
-        archive = ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True)
-        self.write_data(archive, as_template=as_template)
-        archive.close()
+        with sampling("save", self.workbook.profile):
+            archive = ZipFile(filename, 'w', ZIP_DEFLATED, allowZip64=True)
+            self.write_data(archive, as_template=as_template)
+            archive.close()
 
 
 def save_workbook(workbook, filename, as_template=False):
@@ -234,11 +257,12 @@ def save_virtual_workbook(workbook, as_template=False):
     """Return an in-memory workbook, suitable for a Django response."""
     writer = ExcelWriter(workbook)
     temp_buffer = BytesIO()
-    try:
-        archive = ZipFile(temp_buffer, 'w', ZIP_DEFLATED, allowZip64=True)
-        writer.write_data(archive, as_template=as_template)
-    finally:
-        archive.close()
+    with sampling("save", workbook.profile):
+        try:
+            archive = ZipFile(temp_buffer, 'w', ZIP_DEFLATED, allowZip64=True)
+            writer.write_data(archive, as_template=as_template)
+        finally:
+            archive.close()
     virtual_workbook = temp_buffer.getvalue()
     temp_buffer.close()
     return virtual_workbook
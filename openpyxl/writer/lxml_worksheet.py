@@ -4,8 +4,13 @@ from __future__ import absolute_import
 from operator import itemgetter
 
 from openpyxl.compat import safe_string
+from openpyxl.utils import get_column_letters
 
-from .etree_worksheet import get_rows_to_write
+from .etree_worksheet import (
+    get_rows_to_write,
+    get_formula,
+    get_formula_result,
+)
 from openpyxl.xml.functions import xmlfile
 
 ### LXML optimisation using xf.element to reduce instance creation
@@ -17,30 +22,39 @@ def write_rows(xf, worksheet):
 
     dims = worksheet.row_dimensions
     max_column = worksheet.max_column
+    # letters of every column, indexed by column number
+    letters = [None] + get_column_letters(range(1, max_column + 1))
 
     with xf.element("sheetData"):
         for row_idx, row in sorted(all_rows):
 
-            attrs = {'r': '%d' % row_idx, 'spans': '1:%d' % max_column}
+            row_str = '%d' % row_idx
+            attrs = {'r': row_str, 'spans': '1:%d' % max_column}
             if row_idx in dims:
                 row_dimension = dims[row_idx]
                 attrs.update(dict(row_dimension))
             with xf.element("row", attrs):
 
                 for col, cell in sorted(row, key=itemgetter(0)):
-                    if cell.value is None and not cell.has_style:
+                    if cell._value is None and not cell.has_style:
                         continue
-                    write_cell(xf, worksheet, cell, cell.has_style)
+                    write_cell(xf, worksheet, cell, cell.has_style,
+                               letters[col] + row_str)
 
 
-def write_cell(xf, worksheet, cell, styled=False):
-    coordinate = cell.coordinate
+def write_cell(xf, worksheet, cell, styled=False, coordinate=None):
+    if coordinate is None:
+        coordinate = cell.coordinate
     attributes = {'r': coordinate}
     if styled:
         attributes['s'] = '%d' % cell.style_id
 
     if cell.data_type != 'f':
         attributes['t'] = cell.data_type
+    else:
+        data_type, result = get_formula_result(worksheet, cell)
+        if data_type is not None:
+            attributes['t'] = data_type
 
     value = cell._value
 
@@ -50,11 +64,11 @@ def write_cell(xf, worksheet, cell, styled=False):
 
     with xf.element('c', attributes):
         if cell.data_type == 'f':
-            shared_formula = worksheet.formula_attributes.get(coordinate, {})
-            with xf.element('f', shared_formula):
-                if value is not None:
-                    xf.write(value[1:])
-                    value = None
+            attrs, text = get_formula(worksheet, cell)
+            with xf.element('f', attrs):
+                if text is not None:
+                    xf.write(text)
+            value = result
 
         if cell.data_type == 's':
             value = worksheet.parent.shared_strings.add(value)
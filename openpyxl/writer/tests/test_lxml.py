@@ -134,6 +134,64 @@ def test_write_formula(worksheet, write_rows):
     assert diff is None, diff
 
 
+@pytest.mark.lxml_required
+def test_write_shared_formula(worksheet, write_rows):
+    from openpyxl.formula.shared import SharedFormula
+    ws = worksheet
+    shared = SharedFormula("0", "A2:C2", "=A1*2", "A2")
+    ws.shared_formulae["0"] = shared
+    for col in "ABC":
+        cell = ws[col + "2"]
+        cell._value = shared
+        cell.data_type = 'f'
+
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        write_rows(xf, ws)
+
+    xml = out.getvalue()
+    expected = """
+    <sheetData>
+      <row r="2" spans="1:3">
+        <c r="A2">
+          <f t="shared" ref="A2:C2" si="0">A1*2</f>
+          <v></v>
+        </c>
+        <c r="B2">
+          <f t="shared" si="0"/>
+          <v></v>
+        </c>
+        <c r="C2">
+          <f t="shared" si="0"/>
+          <v></v>
+        </c>
+      </row>
+    </sheetData>
+    """
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
+@pytest.mark.lxml_required
+def test_write_shared_formula_without_master(worksheet):
+    from openpyxl.formula.shared import SharedFormula
+    from .. lxml_worksheet import write_cell
+    ws = worksheet
+    shared = SharedFormula("0", "A2:C2", "=A1*2", "A2")
+    ws['A2'] = 5
+    cell = ws['C2']
+    cell._value = shared
+    cell.data_type = 'f'
+
+    out = BytesIO()
+    with xmlfile(out) as xf:
+        write_cell(xf, ws, cell)
+    xml = out.getvalue()
+    expected = """<c r="C2"><f>C1*2</f><v></v></c>"""
+    diff = compare_xml(xml, expected)
+    assert diff is None, diff
+
+
 @pytest.mark.lxml_required
 def test_row_height(worksheet, write_rows):
     from openpyxl.worksheet.dimensions import RowDimension
@@ -597,3 +597,26 @@ def test_write_drawing(worksheet):
     xml = tostring(write_drawing(worksheet))
     diff = compare_xml(xml, expected)
     assert diff is None, diff
+
+
+@pytest.mark.parametrize("name", ['etree', 'lxml'])
+def test_row_writer(worksheet, name):
+    from ..worksheet import set_row_writer, get_row_writer, write_worksheet
+    if name == 'lxml':
+        pytest.importorskip("lxml")
+    default = get_row_writer()
+    worksheet.cell('A1').value = 1
+    set_row_writer(name)
+    try:
+        assert get_row_writer() == name
+        xml = write_worksheet(worksheet, None)
+    finally:
+        set_row_writer(default)
+    node = fromstring(xml)
+    assert node.find("{%s}sheetData/{%s}row" % (SHEET_MAIN_NS, SHEET_MAIN_NS)) is not None
+
+
+def test_unknown_row_writer():
+    from ..worksheet import set_row_writer
+    with pytest.raises(ValueError):
+        set_row_writer("sax")
@@ -337,3 +337,20 @@ def test_save():
     from ..write_only import save_dump
     wb = Workbook(write_only=True)
     save_dump(wb, filename)
+
+
+def test_track_progress():
+    from openpyxl import Workbook
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    reports = []
+    ws.track_progress(reports.append, rows=10)
+    for idx in range(25):
+        ws.append([idx, "row {0}".format(idx)])
+    assert [p.rows for p in reports] == [10, 20]
+    out = BytesIO()
+    wb.save(out)
+    assert [p.rows for p in reports] == [10, 20, 25]
+    archive = ZipFile(out)
+    info = archive.getinfo("xl/worksheets/sheet1.xml")
+    assert reports[-1].bytes == info.compress_size
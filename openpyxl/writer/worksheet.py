@@ -91,8 +91,7 @@ def write_conditional_formatting(worksheet):
         for rule in rules:
             if rule.dxf is not None:
                 if rule.dxf != DifferentialStyle():
-                    rule.dxfId = len(wb._differential_styles)
-                    wb._differential_styles.append(rule.dxf)
+                    rule.dxfId = wb._differential_styles.add(rule.dxf)
             cf.append(rule.to_tree())
 
         yield cf
@@ -138,10 +137,32 @@ def write_drawing(worksheet):
         return drawing.to_tree("drawing")
 
 
+ROW_WRITERS = ('etree', 'lxml')
+_row_writer = {'name': LXML is True and 'lxml' or 'etree'}
+
+
+def set_row_writer(name):
+    """
+    Select the implementation which writes the cells of worksheets: 'lxml',
+    the default with lxml, or 'etree'
+    """
+    if name not in ROW_WRITERS:
+        raise ValueError("Unknown row writer {0}".format(name))
+    _row_writer['name'] = name
+
+
+def get_row_writer():
+    """
+    Return the name of the implementation which writes the cells of
+    worksheets
+    """
+    return _row_writer['name']
+
+
 def write_worksheet(worksheet, shared_strings):
     """Write a worksheet to an xml file."""
     worksheet._rels = []
-    if LXML is True:
+    if _row_writer['name'] == 'lxml':
         from .lxml_worksheet import write_cell, write_rows
     else:
         from .etree_worksheet import write_cell, write_rows
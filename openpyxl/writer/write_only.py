@@ -7,13 +7,14 @@ from __future__ import absolute_import
 import atexit
 from inspect import isgenerator
 import os
-from tempfile import NamedTemporaryFile
 
 from openpyxl.cell import Cell
 from openpyxl.worksheet import Worksheet
 from openpyxl.worksheet.related import Related
 
+from openpyxl.utils import get_column_letter
 from openpyxl.utils.exceptions import WorkbookAlreadySaved
+from openpyxl.utils.instrumentation import ProgressMeter, _NO_PROGRESS
 from openpyxl.writer.excel import ExcelWriter
 from openpyxl.writer.comments import CommentWriter
 from .relations import write_rels
@@ -47,6 +48,7 @@ class CommentParentCell(object):
 
 
 def create_temporary_file(suffix=''):
+    from tempfile import NamedTemporaryFile
     fobj = NamedTemporaryFile(mode='w+', suffix=suffix,
                               prefix='openpyxl.', delete=False)
     filename = fobj.name
@@ -68,6 +70,8 @@ class WriteOnlyWorksheet(Worksheet):
 
     __saved = False
     writer = None
+    _progress = None
+    _meter = _NO_PROGRESS
 
     def __init__(self, parent_workbook, title):
         Worksheet.__init__(self, parent_workbook, title)
@@ -86,6 +90,33 @@ class WriteOnlyWorksheet(Worksheet):
         return self._fileobj_name
 
 
+    def track_progress(self, callback, rows=10000, bytes=None):
+        """
+        Call `callback` with the Progress of writing the worksheet every
+        `rows` rows appended or `bytes` bytes of XML written, and when it is
+        saved with the size of the compressed worksheet.
+        Must be called before the first row is appended.
+        """
+        if callback is None:
+            self._progress = None
+        else:
+            self._progress = (callback, rows, bytes)
+
+
+    def _written(self):
+        if os.path.exists(self.filename):
+            return os.path.getsize(self.filename)
+        return 0
+
+
+    def _saved(self, compressed):
+        """
+        Report the worksheet as saved into the archive
+        """
+        if self._meter is not _NO_PROGRESS:
+            self._meter.report(self._max_row, compressed)
+
+
     def _write_header(self):
         """
         Generator that creates the XML file and the sheet header
@@ -164,8 +195,12 @@ class WriteOnlyWorksheet(Worksheet):
         if self.writer is None:
             self.writer = self._write_header()
             next(self.writer)
+            if self._progress is not None:
+                self._meter = ProgressMeter(*self._progress,
+                                            measure=self._written)
 
-        el = Element("row", r='%d' % self._max_row)
+        row_str = '%d' % row_idx
+        el = Element("row", r=row_str)
 
         col_idx = None
         for col_idx, value in enumerate(row, 1):
@@ -187,7 +222,8 @@ class WriteOnlyWorksheet(Worksheet):
             cell.row = row_idx
 
             styled = cell.has_style
-            tree = write_cell(self, cell, styled)
+            tree = write_cell(self, cell, styled,
+                              get_column_letter(col_idx) + row_str)
             el.append(tree)
             if styled: # styled cell or datetime
                 cell = WriteOnlyCell(self)
@@ -200,6 +236,9 @@ class WriteOnlyWorksheet(Worksheet):
         except StopIteration:
             self._already_saved()
 
+        if row_idx >= self._meter.due:
+            self._meter.update(row_idx)
+
 
     def _already_saved(self):
         raise WorkbookAlreadySaved('Workbook has already been saved and cannot be modified or saved anymore.')
@@ -6,6 +6,8 @@ XML compatability functions
 """
 
 # Python stdlib imports
+from io import TextIOBase
+import os
 import re
 from functools import partial
 # compatibility
@@ -25,7 +27,6 @@ if LXML is True:
     QName,
     xmlfile
     )
-    from xml.etree.cElementTree import iterparse
 else:
     try:
         from xml.etree.cElementTree import (
@@ -64,10 +65,61 @@ from openpyxl.xml.constants import (
     DCTERMS_PREFIX
 )
 
+# Parsers for reading worksheets. The standard library parser is the
+# default, lxml's can be selected at runtime or with OPENPYXL_ITERPARSE
+try:
+    from xml.etree.cElementTree import iterparse as _etree_iterparse
+except ImportError:
+    from xml.etree.ElementTree import iterparse as _etree_iterparse
+
+
+def _etree_parser(source, events=None, **kw):
+    return _etree_iterparse(source, events)
+
+
+def _lxml_parser(source, tag=None, **kw):
+    from lxml.etree import iterparse
+    if isinstance(source, TextIOBase):
+        # lxml only reads bytes
+        return _etree_parser(source, kw.get('events'))
+    if tag is not None:
+        kw['tag'] = list(tag)
+    # do not load external entities
+    return iterparse(source, resolve_entities=False, no_network=True, **kw)
+
+
+ITERPARSERS = {'etree': _etree_parser}
+if LXML is True:
+    ITERPARSERS['lxml'] = _lxml_parser
+
+_iterparser = {'name': None, 'parser': None}
+
+
+def set_iterparse(name):
+    """
+    Select the parser used to read worksheets: 'etree' or, if lxml is
+    available, 'lxml'
+    """
+    if name not in ITERPARSERS:
+        raise ValueError("Unknown or unavailable XML parser {0}".format(name))
+    _iterparser['name'] = name
+    _iterparser['parser'] = ITERPARSERS[name]
+
+
+def get_iterparse():
+    """
+    Return the name of the parser used to read worksheets
+    """
+    return _iterparser['name']
+
+
+_name = os.environ.get("OPENPYXL_ITERPARSE", "etree")
+set_iterparse(_name if _name in ITERPARSERS else "etree")
+
+
 # allow LXML interface
-_iterparse = iterparse
 def safe_iterparse(source, *args, **kw):
-    return _iterparse(source)
+    return _iterparser['parser'](source, *args, **kw)
 
 iterparse = safe_iterparse
 
@@ -1,3 +1,5 @@
+from io import BytesIO
+
 import pytest
 
 from openpyxl.xml.functions import ConditionalElement
@@ -50,3 +52,27 @@ def test_localtag(xml, tag):
     from .. functions import fromstring
     node = fromstring(xml)
     assert localname(node) == tag
+
+
+@pytest.mark.parametrize("name", ['etree', 'lxml'])
+def test_set_iterparse(name):
+    from .. functions import (
+        ITERPARSERS, set_iterparse, get_iterparse, iterparse, localname)
+    if name not in ITERPARSERS:
+        pytest.skip("{0} is not available".format(name))
+    default = get_iterparse()
+    set_iterparse(name)
+    try:
+        assert get_iterparse() == name
+        src = BytesIO(b"<root><row r='1'/><row r='2'/></root>")
+        rows = [el.get("r") for _, el in iterparse(src, tag=['row'])
+                if localname(el) == "row"]
+    finally:
+        set_iterparse(default)
+    assert rows == ['1', '2']
+
+
+def test_set_unknown_iterparse():
+    from .. functions import set_iterparse
+    with pytest.raises(ValueError):
+        set_iterparse("sax")